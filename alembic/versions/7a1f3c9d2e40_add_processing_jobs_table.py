@@ -0,0 +1,43 @@
+"""add processing_jobs table
+
+Revision ID: 7a1f3c9d2e40
+Revises: c5c501c76722
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1f3c9d2e40'
+down_revision: Union[str, None] = 'c5c501c76722'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('processing_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='job_status'), nullable=False),
+    sa.Column('source_type', postgresql.ENUM(name='source_type', create_type=False), nullable=False),
+    sa.Column('source_location', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('diarization_csv_path', sa.String(), nullable=True),
+    sa.Column('summary_json_path', sa.String(), nullable=True),
+    sa.Column('audio_summary_path', sa.String(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_processing_jobs_status', 'processing_jobs', ['status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_processing_jobs_status', table_name='processing_jobs')
+    op.drop_table('processing_jobs')
+    op.execute("DROP TYPE IF EXISTS job_status;")
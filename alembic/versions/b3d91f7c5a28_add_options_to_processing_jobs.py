@@ -0,0 +1,26 @@
+"""add options to processing_jobs
+
+Revision ID: b3d91f7c5a28
+Revises: 7a1f3c9d2e40
+Create Date: 2026-10-18 16:40:12.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d91f7c5a28'
+down_revision: Union[str, None] = '7a1f3c9d2e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('processing_jobs', sa.Column('options', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('processing_jobs', 'options')
@@ -0,0 +1,26 @@
+"""add content_hash to processing_jobs
+
+Revision ID: e4a72c19d6b3
+Revises: b3d91f7c5a28
+Create Date: 2026-10-18 19:05:47.201936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a72c19d6b3'
+down_revision: Union[str, None] = 'b3d91f7c5a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('processing_jobs', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('processing_jobs', 'content_hash')
@@ -0,0 +1,67 @@
+"""
+openai-whisper (fp32 PyTorch) vs faster-whisper (int8 CTranslate2) on CPU:
+real-time factor and word error rate against reference transcripts.
+
+Every audio file needs its reference transcript next to it, same name with a
+.txt extension (meeting.mp3 -> meeting.txt).
+
+Run from the repository root:
+    python -m benchmarks.asr_engines path/to/meeting.mp3 [more files ...]
+"""
+from src.services.transcription.engines import WhisperEngine, FasterWhisperEngine
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.core import get_settings
+import time
+import sys
+import re
+import os
+
+
+def normalize(text: str):
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref, hyp = normalize(reference), normalize(hypothesis)
+    # Levenshtein distance over words, one row at a time
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref_word != hyp_word))
+        previous = current
+    return previous[-1] / max(len(ref), 1)
+
+
+def main():
+    model = get_settings().WHISPER_MODEL
+    engines = {
+        "whisper fp32": WhisperEngine(model=model, device="cpu"),
+        "faster-whisper int8": FasterWhisperEngine(model=model, device="cpu", compute_type="int8"),
+    }
+    inputs = []
+    for path in sys.argv[1:]:
+        with open(f"{os.path.splitext(path)[0]}.txt", encoding="utf-8") as f:
+            inputs.append((path, DecodedAudio.from_file(path), f.read()))
+    total_audio = sum(audio.duration for _, audio, _ in inputs)
+
+    print(f"model: {model}, {len(inputs)} files, {total_audio / 60:.1f} min of audio, cpu")
+    print(f"{'engine':>20} {'load (s)':>9} {'RTF':>7} {'WER':>7}")
+    for name, engine in engines.items():
+        start = time.perf_counter()
+        engine.load()
+        load_seconds = time.perf_counter() - start
+
+        elapsed, errors, words = 0.0, 0.0, 0
+        for _, audio, reference in inputs:
+            start = time.perf_counter()
+            text = engine.transcribe(audio.samples)["text"]
+            elapsed += time.perf_counter() - start
+            count = len(normalize(reference))
+            errors += word_error_rate(reference, text) * count
+            words += count
+        print(f"{name:>20} {load_seconds:>9.1f} {elapsed / total_audio:>7.3f} {errors / max(words, 1):>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
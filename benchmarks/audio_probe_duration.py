@@ -0,0 +1,55 @@
+"""
+Reading the duration of a long recording: full decode with
+``AudioSegment.from_file`` (old SpeakerAnalyzer path) vs AudioProbe, which
+reads the container headers or, for header-less webm, counts packets.
+
+Run from the repository root:
+    python -m benchmarks.audio_probe_duration
+"""
+from src.services.audio.AudioProbe import AudioProbe
+from pydub import AudioSegment
+import subprocess
+import tempfile
+import time
+import os
+
+MINUTES = [10, 60]
+FORMATS = [("mp3", ["-c:a", "libmp3lame", "-b:a", "128k"]), ("webm", ["-c:a", "libopus", "-b:a", "32k"])]
+
+
+def write_synthetic(path: str, minutes: int, codec_args):
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", f"sine=frequency=220:duration={minutes * 60}",
+         "-ac", "2", *codec_args, path],
+        check=True
+    )
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main():
+    print(f"{'file':>12} {'decode (s)':>11} {'probe (s)':>10} {'cached (s)':>11} {'method':>12} {'duration':>9}")
+    for minutes in MINUTES:
+        for extension, codec_args in FORMATS:
+            with tempfile.NamedTemporaryFile(suffix=f".{extension}", delete=False) as f:
+                path = f.name
+            try:
+                write_synthetic(path, minutes, codec_args)
+                _, decode_seconds = timed(lambda: len(AudioSegment.from_file(path)) / 1000.0)
+                probe = AudioProbe()
+                metadata, probe_seconds = timed(lambda: probe.probe(path))
+                _, cached_seconds = timed(lambda: probe.probe(path))
+                print(
+                    f"{f'{minutes}m {extension}':>12} {decode_seconds:>11.2f} {probe_seconds:>10.3f} "
+                    f"{cached_seconds:>11.5f} {metadata.method:>12} {metadata.duration:>9.1f}"
+                )
+            finally:
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+CPU time and disk used per hour of audio by ingestion.
+
+old: recordings are re-encoded to 192 kbps MP3 (pydub for webm, yt-dlp's
+     FFmpegExtractAudio for downloads), then pyannote and whisper each decode
+     and resample that MP3 to 16 kHz mono.
+new: CanonicalAudio transcodes once to 16 kHz mono FLAC and decodes the same
+     samples in the same ffmpeg run.
+
+CPU time includes ffmpeg child processes. Run from the repository root:
+    python -m benchmarks.canonical_ingest
+"""
+from src.services.audio.CanonicalAudio import CanonicalAudio
+from src.services.audio.DecodedAudio import DecodedAudio
+from pydub import AudioSegment
+import subprocess
+import tempfile
+import resource
+import os
+
+MINUTES = 10
+SOURCES = [
+    ("recorded webm", "webm", ["-c:a", "libopus", "-b:a", "64k"]),
+    ("downloaded m4a", "m4a", ["-c:a", "aac", "-b:a", "128k"]),
+]
+
+
+def cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def write_source(path: str, codec_args):
+    # Stereo 48 kHz speech-band tone, like a browser or platform recording
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-f", "lavfi",
+         "-i", f"sine=frequency=220:duration={MINUTES * 60}:sample_rate=48000",
+         "-ac", "2", *codec_args, path],
+        check=True
+    )
+
+
+def old_ingest(path: str, workdir: str) -> int:
+    mp3_path = os.path.join(workdir, "converted.mp3")
+    AudioSegment.from_file(path).export(mp3_path, format="mp3", bitrate="192k")
+    # pyannote and whisper each decoded the MP3 on their own
+    DecodedAudio.from_file(mp3_path)
+    DecodedAudio.from_file(mp3_path)
+    return os.path.getsize(mp3_path)
+
+
+def new_ingest(path: str, canonical: CanonicalAudio) -> int:
+    canonical_path, _ = canonical.ingest(path)
+    size = os.path.getsize(canonical_path)
+    canonical.release(canonical_path)
+    return size
+
+
+def main():
+    canonical = CanonicalAudio()
+    scale = 60 / MINUTES
+    print(f"Per audio hour, measured on {MINUTES} minute inputs")
+    print(f"{'source':>15} {'old CPU s':>10} {'new CPU s':>10} {'old MB':>8} {'new MB':>8} {'CPU saved':>10} {'MB saved':>9}")
+    for name, extension, codec_args in SOURCES:
+        with tempfile.TemporaryDirectory() as workdir:
+            source = os.path.join(workdir, f"source.{extension}")
+            write_source(source, codec_args)
+
+            start = cpu_seconds()
+            old_bytes = old_ingest(source, workdir)
+            old_cpu = (cpu_seconds() - start) * scale
+
+            start = cpu_seconds()
+            new_bytes = new_ingest(source, canonical)
+            new_cpu = (cpu_seconds() - start) * scale
+
+            old_mb, new_mb = old_bytes * scale / 2**20, new_bytes * scale / 2**20
+            print(
+                f"{name:>15} {old_cpu:>10.1f} {new_cpu:>10.1f} {old_mb:>8.1f} {new_mb:>8.1f} "
+                f"{old_cpu - new_cpu:>10.1f} {old_mb - new_mb:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Per-turn segment extraction cost: re-decoding the file for every turn (old
+``AudioSegment.from_file`` path) vs slicing a buffer decoded once.
+
+The fixture is encoded to mp3 like real uploads, so every re-decode pays
+for the ffmpeg decode the old path ran on each turn.
+
+Run from the repository root:
+    python -m benchmarks.decoded_audio_slicing
+"""
+from src.services.audio.DecodedAudio import DecodedAudio
+from pydub import AudioSegment
+import numpy as np
+import subprocess
+import tempfile
+import time
+import wave
+import os
+
+TURN_SECONDS = 2.0
+TURN_COUNTS = [25, 100, 400]
+
+
+def write_synthetic_mp3(path: str, seconds: float, sample_rate: int = 44100):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = (0.1 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16)
+    wav_path = f"{path}.wav"
+    with wave.open(wav_path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    try:
+        subprocess.run(
+            ["ffmpeg", "-nostdin", "-y", "-v", "error", "-i", wav_path, "-ac", "2", "-b:a", "128k", path],
+            check=True
+        )
+    finally:
+        os.remove(wav_path)
+
+
+def per_turn_redecode(path: str, sample: int = 10) -> float:
+    # Measured on a sample of turns, every turn costs a full decode
+    start = time.perf_counter()
+    for i in range(sample):
+        audio = AudioSegment.from_file(path)
+        _ = audio[i * TURN_SECONDS * 1000:(i + 1) * TURN_SECONDS * 1000]
+    return (time.perf_counter() - start) / sample
+
+
+def per_turn_shared_buffer(path: str, turns: int) -> float:
+    start = time.perf_counter()
+    audio = DecodedAudio.from_file(path)
+    for i in range(turns):
+        _ = audio.slice(i * TURN_SECONDS, (i + 1) * TURN_SECONDS)
+    return (time.perf_counter() - start) / turns
+
+
+def main():
+    print(f"{'turns':>6} {'audio (s)':>10} {'re-decode ms/turn':>18} {'shared ms/turn':>15}")
+    for turns in TURN_COUNTS:
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+            path = f.name
+        try:
+            write_synthetic_mp3(path, turns * TURN_SECONDS)
+            old = per_turn_redecode(path)
+            new = per_turn_shared_buffer(path, turns)
+            print(f"{turns:>6} {turns * TURN_SECONDS:>10.0f} {old * 1000:>18.2f} {new * 1000:>15.3f}")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Import-time report for the API entry point, grouped per top-level package.
+
+Runs ``python -X importtime -c "import src.main"`` in a fresh interpreter and
+prints the slowest packages. Pass ``--json PATH`` to also append the totals to
+a JSON lines file so cold-start cost can be tracked over time.
+
+Run from the repository root:
+    python -m benchmarks.import_time_report [--module src.main] [--top 20] [--json import_times.jsonl]
+"""
+from collections import defaultdict
+from datetime import datetime
+import subprocess
+import argparse
+import json
+import sys
+
+
+def measure(module: str):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+
+    per_package = defaultdict(int)
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        package = name.strip().split(".")[0]
+        per_package[package] += int(self_us)
+        total_us += int(self_us)
+    return total_us, dict(per_package)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    total_us, per_package = measure(args.module)
+    print(f"import {args.module}: {total_us / 1e6:.2f}s total")
+    for package, self_us in sorted(per_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:>30} {self_us / 1e3:10.1f} ms")
+
+    if args.json_path:
+        with open(args.json_path, "a") as f:
+            f.write(json.dumps({
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "module": args.module,
+                "total_ms": round(total_us / 1e3, 1),
+                "packages_ms": {k: round(v / 1e3, 1) for k, v in per_package.items()},
+            }) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Per-segment whisper latency on CPU: temporary WAV round-trip vs feeding the
+NumPy samples straight into the model.
+
+GPUs are hidden so the numbers are CPU numbers on every host.
+
+Run from the repository root:
+    python -m benchmarks.in_memory_transcription path/to/audio.mp3 [model]
+"""
+import os
+
+# Before torch is imported anywhere
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+from src.services.transcription.AudioTranscription import AudioTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+import statistics
+import time
+import sys
+
+SEGMENT_SECONDS = [1.0, 3.0, 8.0]
+REPEATS = 5
+
+
+def time_call(fn, samples) -> float:
+    start = time.perf_counter()
+    fn(samples)
+    return time.perf_counter() - start
+
+
+def main():
+    audio_path = sys.argv[1]
+    model = sys.argv[2] if len(sys.argv) > 2 else "base"
+    audio = DecodedAudio.from_file(audio_path)
+    transcriber = AudioTranscription(audio, transcribe_model=model)
+
+    print(f"model: {model}, device: {transcriber.engine.device}")
+    print(f"{'segment (s)':>12} {'wav file ms':>12} {'in-memory ms':>13} {'saved ms':>9}")
+    for seconds in SEGMENT_SECONDS:
+        samples = audio.slice(0, seconds)
+        # Warm both paths once so model/kernel start-up is not counted
+        transcriber.transcribe_file(samples)
+        transcriber.transcribe_array(samples)
+        file_ms = statistics.median(time_call(transcriber.transcribe_file, samples) for _ in range(REPEATS)) * 1000
+        array_ms = statistics.median(time_call(transcriber.transcribe_array, samples) for _ in range(REPEATS)) * 1000
+        print(f"{seconds:>12.1f} {file_ms:>12.1f} {array_ms:>13.1f} {file_ms - array_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-turn transcription with whisper detecting the language on every call vs
+the language detected once per job and passed to every call.
+
+Run from the repository root:
+    python -m benchmarks.language_pinning path/to/meeting.mp3
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.transcription.AudioTranscription import AudioTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+import time
+import sys
+
+
+def run(transcriber: AudioTranscription, turns) -> float:
+    start = time.perf_counter()
+    for turn_start, turn_end in turns:
+        transcriber.transcribe_segment(transcriber.extract_segments(turn_start, turn_end))
+    return time.perf_counter() - start
+
+
+def main():
+    audio = DecodedAudio.from_file(sys.argv[1])
+    diarizer = AudioDiarization()
+    diarization = diarizer.pipeline(audio.to_pyannote())
+    turns = [(turn.start, turn.end) for turn, _ in diarization.itertracks()]
+    transcriber = AudioTranscription(audio)
+
+    start = time.perf_counter()
+    language = diarizer.detect_language(audio, diarization, transcriber=transcriber)
+    detection = time.perf_counter() - start
+
+    transcriber.language = None
+    per_call = run(transcriber, turns)
+    transcriber.language = language
+    pinned = run(transcriber, turns)
+
+    print(f"audio: {audio.duration / 60:.1f} min, turns: {len(turns)}, pinned language: {language}")
+    print(f"{'mode':>10} {'wall (s)':>9} {'ms/turn':>8}")
+    print(f"{'per call':>10} {per_call:>9.1f} {per_call / max(len(turns), 1) * 1000:>8.0f}")
+    print(f"{'pinned':>10} {pinned + detection:>9.1f} {(pinned + detection) / max(len(turns), 1) * 1000:>8.0f}"
+          f"  (detection once: {detection * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
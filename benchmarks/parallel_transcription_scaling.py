@@ -0,0 +1,44 @@
+"""
+Scaling of the process-pool transcription mode on CPU: wall time and speedup
+over one worker for the same diarization turns at 1/2/4/8/16 workers.
+Worker counts above the core count are skipped.
+
+Run from the repository root:
+    python -m benchmarks.parallel_transcription_scaling path/to/meeting.mp3 [threads_per_worker]
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.transcription.ParallelTranscription import ParallelTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+import time
+import sys
+import os
+
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+
+
+def main():
+    audio = DecodedAudio.from_file(sys.argv[1])
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    diarization = AudioDiarization().pipeline(audio.to_pyannote())
+    turns = [(turn.start, turn.end) for turn, _ in diarization.itertracks()]
+    cores = os.cpu_count() or 1
+
+    print(f"audio: {audio.duration / 60:.1f} min, turns: {len(turns)}, cores: {cores}, threads/worker: {threads}")
+    print(f"{'workers':>8} {'wall (s)':>9} {'speedup':>8} {'audio-min/wall-min':>19}")
+    baseline = None
+    for workers in WORKER_COUNTS:
+        if workers * threads > cores:
+            break
+        engine = ParallelTranscription(workers=workers, threads_per_worker=threads)
+        # Warm the pool so model loading is not counted
+        engine.transcribe(audio, turns[:workers * 4])
+        start = time.perf_counter()
+        engine.transcribe(audio, turns)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.1f} {baseline / elapsed:>8.2f} {audio.duration / elapsed:>19.1f}")
+        ParallelTranscription.shutdown()
+
+
+if __name__ == "__main__":
+    main()
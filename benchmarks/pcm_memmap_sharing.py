@@ -0,0 +1,62 @@
+"""
+Several worker processes reading turn slices of the same job: each worker
+decoding the file itself vs mapping the job's float32 PCM cache file.
+
+Run from the repository root:
+    python -m benchmarks.pcm_memmap_sharing
+"""
+from src.services.audio.DecodedAudio import DecodedAudio
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import subprocess
+import tempfile
+import resource
+import time
+import os
+
+MINUTES = 30
+WORKERS = 4
+TURN_SECONDS = 5.0
+
+
+def worker(args):
+    mode, path, turns = args
+    start = time.perf_counter()
+    audio = DecodedAudio.from_file(path) if mode == "decode" else DecodedAudio.from_pcm(path)
+    checksum = 0.0
+    for i in range(turns):
+        checksum += float(np.abs(audio.slice(i * TURN_SECONDS, (i + 1) * TURN_SECONDS)).mean())
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return time.perf_counter() - start, peak_mb
+
+
+def run(mode: str, path: str, turns: int):
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(worker, [(mode, path, turns)] * WORKERS))
+    wall = time.perf_counter() - start
+    per_worker = sum(r[0] for r in results) / WORKERS
+    peak = max(r[1] for r in results)
+    print(f"{mode:>8} {wall:>9.2f} {per_worker:>16.2f} {peak:>16.0f}")
+
+
+def main():
+    turns = int(MINUTES * 60 / TURN_SECONDS)
+    with tempfile.TemporaryDirectory() as workdir:
+        flac_path = os.path.join(workdir, "canonical.flac")
+        subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", f"sine=frequency=220:duration={MINUTES * 60}",
+             "-ac", "1", "-ar", "16000", "-c:a", "flac", flac_path],
+            check=True
+        )
+        pcm_path = os.path.join(workdir, "samples.f32")
+        DecodedAudio.from_file(flac_path).samples.astype(np.float32).tofile(pcm_path)
+
+        print(f"{WORKERS} workers, {MINUTES} min of audio, {turns} turns each")
+        print(f"{'mode':>8} {'wall (s)':>9} {'per worker (s)':>16} {'peak RSS (MB)':>16}")
+        run("decode", flac_path, turns)
+        run("memmap", pcm_path, turns)
+
+
+if __name__ == "__main__":
+    main()
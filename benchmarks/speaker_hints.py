@@ -0,0 +1,42 @@
+"""
+Diarization time with and without speaker-count hints on the same audio.
+The hinted runs use the number of speakers found by the unhinted run.
+
+Run from the repository root:
+    python -m benchmarks.speaker_hints path/to/meeting.mp3 [num_speakers]
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.audio.DecodedAudio import DecodedAudio
+import time
+import sys
+
+RUNS = 3
+
+
+def timed(diarizer: AudioDiarization, audio: DecodedAudio, hints: dict):
+    best, speakers = float("inf"), 0
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        diarization = diarizer.pipeline(audio.to_pyannote(), **hints)
+        best = min(best, time.perf_counter() - start)
+        speakers = len(diarization.labels())
+    return best, speakers
+
+
+def main():
+    audio = DecodedAudio.from_file(sys.argv[1])
+    diarizer = AudioDiarization()
+
+    baseline, found = timed(diarizer, audio, {})
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else found
+    print(f"audio: {audio.duration / 60:.1f} min, best of {RUNS} runs")
+    print(f"{'hints':>28} {'time (s)':>9} {'speedup':>8} {'speakers':>9}")
+    print(f"{'none':>28} {baseline:>9.1f} {1.0:>8.2f} {found:>9}")
+    for hints in ({"num_speakers": count}, {"min_speakers": max(1, count - 1), "max_speakers": count + 1}):
+        elapsed, speakers = timed(diarizer, audio, hints)
+        label = ", ".join(f"{key}={value}" for key, value in hints.items())
+        print(f"{label:>28} {elapsed:>9.1f} {baseline / elapsed:>8.2f} {speakers:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Throughput of the pipelined stage scheduler vs serial job execution on a
+mixed queue of short and long meetings.
+
+Stages are simulated with sleeps sized like real jobs (GPU diarization and
+ASR scale with audio length, the LLM and TTS are mostly network waits), so
+the benchmark measures scheduling overlap rather than model speed.
+
+Run from the repository root:
+    python -m benchmarks.stage_scheduler_throughput [--jobs 12] [--scale 0.01]
+"""
+from src.controllers.StageScheduler import Stage, StageScheduler
+from concurrent.futures import ThreadPoolExecutor, wait
+import argparse
+import time
+
+# Seconds per audio-minute for audio bound stages, fixed seconds otherwise
+STAGE_COST = {
+    "ingest": lambda minutes: 0.2 * minutes,
+    "diarization": lambda minutes: 1.5 * minutes,
+    "asr": lambda minutes: 3.0 * minutes,
+    "analysis": lambda minutes: 0.1 * minutes,
+    "llm": lambda minutes: 40.0,
+    "tts": lambda minutes: 8.0,
+}
+CONCURRENCY = {"ingest": 2, "diarization": 1, "asr": 2, "analysis": 2, "llm": 4, "tts": 4}
+MEETING_MINUTES = [5, 60, 15, 30, 5, 90]
+
+
+def simulate(stage: str, scale: float):
+    def run(job):
+        time.sleep(STAGE_COST[stage](job["minutes"]) * scale)
+    return run
+
+
+def serial(jobs, workers: int, scale: float) -> float:
+    def run_job(job):
+        for stage in STAGE_COST:
+            simulate(stage, scale)(job)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        wait([executor.submit(run_job, job) for job in jobs])
+    return time.perf_counter() - start
+
+
+def pipelined(jobs, scale: float) -> float:
+    scheduler = StageScheduler([Stage(name, simulate(name, scale), CONCURRENCY[name]) for name in STAGE_COST])
+    start = time.perf_counter()
+    wait([scheduler.submit(job) for job in jobs])
+    elapsed = time.perf_counter() - start
+    scheduler.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--scale", type=float, default=0.01, help="wall seconds per simulated second")
+    args = parser.parse_args()
+
+    jobs = [{"minutes": MEETING_MINUTES[i % len(MEETING_MINUTES)]} for i in range(args.jobs)]
+    audio_minutes = sum(job["minutes"] for job in jobs)
+
+    results = {
+        "serial, 1 worker": serial(jobs, 1, args.scale),
+        "serial, 2 workers": serial(jobs, 2, args.scale),
+        "pipelined": pipelined(jobs, args.scale),
+    }
+    print(f"{args.jobs} jobs, {audio_minutes} audio-minutes")
+    for name, elapsed in results.items():
+        simulated = elapsed / args.scale
+        print(f"{name:>18}: {simulated:8.0f}s simulated, {args.jobs / simulated * 3600:6.1f} jobs/hour")
+
+
+if __name__ == "__main__":
+    main()
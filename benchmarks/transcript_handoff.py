@@ -0,0 +1,83 @@
+"""
+Handing the diarized transcript from transcription to analysis and
+summarization: the previous CSV round trip (write, then pd.read_csv in
+DataLoader and again in load_csv) vs passing the in-memory Transcript.
+Reports wall time and peak Python allocations for a synthetic meeting.
+
+Run from the repository root:
+    python -m benchmarks.transcript_handoff [turns]
+"""
+from src.services.transcript.Transcript import Transcript
+import pandas as pd
+import numpy as np
+import tracemalloc
+import tempfile
+import time
+import sys
+import os
+
+WORDS = "we should ship the release after the review once the numbers look right".split()
+
+
+def synthetic_rows(turns: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    rows, cursor = [], 0.0
+    for _ in range(turns):
+        length = rng.uniform(1, 15)
+        text = " ".join(rng.choice(WORDS, size=int(length * 2.5)))
+        rows.append({"start": cursor, "end": cursor + length, "speaker": f"SPEAKER_0{rng.integers(4)}", "text": text})
+        cursor += length + rng.uniform(0.1, 1.0)
+    return rows
+
+
+def csv_handoff(rows, path: str):
+    # Transcription stage
+    df = pd.DataFrame(rows)
+    df["duration"] = df["end"] - df["start"]
+    df[["start", "end", "duration", "speaker", "text"]].to_csv(path, index=False)
+    # Analysis stage (DataLoader)
+    df = pd.read_csv(path)
+    df.groupby("speaker")["duration"].sum().to_dict()
+    df["speaker"].value_counts().index.tolist()
+    " ".join(df["text"].dropna()).lower()
+    # Summarization stage (load_csv)
+    summary_input = pd.read_csv(path)
+    return summary_input["text"].tolist()
+
+
+def transcript_handoff(rows, path: str):
+    transcript = Transcript.from_rows(rows)
+    transcript.speaker_totals(transcript.duration)
+    transcript.speaker_totals()
+    " ".join(transcript.texts()).lower()
+    return transcript.texts()
+
+
+def measure(handoff, rows, path: str):
+    start = time.perf_counter()
+    handoff(rows, path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    handoff(rows, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows = synthetic_rows(turns)
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
+        path = f.name
+    try:
+        print(f"{turns} turns")
+        print(f"{'handoff':>12} {'wall (ms)':>10} {'peak alloc (MB)':>16}")
+        for name, handoff in (("csv", csv_handoff), ("in-memory", transcript_handoff)):
+            elapsed, peak_mb = measure(handoff, rows, path)
+            print(f"{name:>12} {elapsed * 1000:>10.1f} {peak_mb:>16.2f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
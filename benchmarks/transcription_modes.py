@@ -0,0 +1,38 @@
+"""
+Transcription throughput of the per-turn and whole-file modes on the same
+diarization, reported in audio-minutes per wall-minute. per_turn is pinned to
+one whisper call per turn whatever TURN_CONSOLIDATION_ENABLED says, the
+consolidated variant has its own row.
+
+Run from the repository root:
+    python -m benchmarks.transcription_modes path/to/meeting.mp3
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.transcription.AudioTranscription import AudioTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+import time
+import sys
+
+
+def main():
+    audio = DecodedAudio.from_file(sys.argv[1])
+    diarizer = AudioDiarization()
+    diarization = diarizer.pipeline(audio.to_pyannote())
+    transcriber = AudioTranscription(audio)
+    turns = len(list(diarization.itertracks()))
+
+    print(f"audio: {audio.duration / 60:.1f} min, turns: {turns}")
+    modes = (
+        ("per_turn", lambda: diarizer.transcribe_turns(transcriber, diarization, consolidate=False)),
+        ("per_turn consolidated", lambda: diarizer.transcribe_turns(transcriber, diarization, consolidate=True)),
+        ("whole_file", lambda: diarizer.transcribe_whole_file(transcriber, diarization)),
+    )
+    for mode, run in modes:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{mode:>21}: {elapsed:8.1f}s wall, {audio.duration / elapsed:6.1f} audio-min/wall-min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+One ASR call per diarization turn vs consolidated turn groups on the same
+diarization: calls made, wall time, and how far the consolidated transcript
+drifts from the per-turn one (word error rate between the two).
+
+Run from the repository root:
+    python -m benchmarks.turn_consolidation path/to/meeting.mp3
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.diarization.TurnConsolidator import TurnConsolidator
+from src.services.transcription.AudioTranscription import AudioTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+from benchmarks.asr_engines import word_error_rate
+import time
+import sys
+
+
+def main():
+    audio = DecodedAudio.from_file(sys.argv[1])
+    diarizer = AudioDiarization()
+    diarization = diarizer.pipeline(audio.to_pyannote())
+    transcriber = AudioTranscription(audio)
+    turns = [(turn.start, turn.end, speaker) for turn, _, speaker in diarization.itertracks(yield_label=True)]
+    settings = diarizer.app_settings
+    groups = TurnConsolidator(settings.TURN_MERGE_GAP_SECONDS, settings.TURN_MIN_DURATION_SECONDS).group(turns)
+    short = sum(1 for start, end, _ in turns if end - start < settings.TURN_MIN_DURATION_SECONDS)
+
+    start = time.perf_counter()
+    per_turn = [transcriber.transcribe_segment(transcriber.extract_segments(s, e)) for s, e, _ in turns]
+    per_turn_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    consolidated = diarizer.transcribe_consolidated(transcriber, diarization)
+    consolidated_seconds = time.perf_counter() - start
+
+    print(f"audio: {audio.duration / 60:.1f} min, turns: {len(turns)} ({short} shorter than "
+          f"{settings.TURN_MIN_DURATION_SECONDS}s)")
+    print(f"{'mode':>13} {'ASR calls':>10} {'wall (s)':>9}")
+    print(f"{'per_turn':>13} {len(turns):>10} {per_turn_seconds:>9.1f}")
+    print(f"{'consolidated':>13} {len(groups):>10} {consolidated_seconds:>9.1f}")
+    print(f"ASR calls removed: {len(turns) - len(groups)} ({1 - len(groups) / max(len(turns), 1):.0%}), "
+          f"speedup {per_turn_seconds / max(consolidated_seconds, 1e-9):.2f}x")
+    drift = word_error_rate(" ".join(per_turn), " ".join(row["text"] for row in consolidated))
+    print(f"transcript difference vs per_turn (WER): {drift:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Peak memory of storing a large upload: reading the whole body into memory
+(old ``buffer.write(file.file.read())`` path) vs streaming it in chunks with
+StreamingIngest, which also hashes the content on the way.
+
+Each variant runs in its own process so peak RSS is measured independently.
+Run from the repository root:
+    python -m benchmarks.upload_ingest_memory [size_mb]
+"""
+from fastapi import UploadFile
+from pathlib import Path
+import subprocess
+import tempfile
+import resource
+import asyncio
+import time
+import sys
+import os
+
+DEFAULT_SIZE_MB = 1024
+CHUNK = b"\x01" * (1024 * 1024)
+
+
+def make_upload(size_mb: int) -> UploadFile:
+    # Same spooling as starlette's multipart parser: rolled over to an anonymous temp file
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    for _ in range(size_mb):
+        spooled.write(CHUNK)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename="large.mp3")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_variant(variant: str, size_mb: int):
+    upload = make_upload(size_mb)
+    baseline = peak_rss_mb()
+    with tempfile.TemporaryDirectory() as tmp:
+        destination = Path(tmp) / "large.mp3"
+        start = time.perf_counter()
+        if variant == "read_all":
+            with open(destination, "wb") as buffer:
+                buffer.write(upload.file.read())
+        else:
+            from src.services.file_transfer.StreamingIngest import StreamingIngest
+            asyncio.run(StreamingIngest().handle(upload, destination))
+        elapsed = time.perf_counter() - start
+    print(f"{variant:<10} {elapsed:>8.2f}s  peak RSS +{peak_rss_mb() - baseline:>8.1f} MB")
+
+
+def main():
+    if len(sys.argv) > 2:
+        run_variant(sys.argv[2], int(sys.argv[1]))
+        return
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE_MB
+    print(f"Storing a {size_mb} MB upload")
+    for variant in ("read_all", "stream"):
+        subprocess.run([sys.executable, "-m", "benchmarks.upload_ingest_memory", str(size_mb), variant],
+                       check=True, env=os.environ)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Voice-activity pre-filtering on a synthetic meeting with long silent stretches:
+fraction of audio removed before diarization/ASR, cost of the VAD pass, and
+how far mapped timestamps land from where the tone bursts really are.
+
+Run from the repository root:
+    python -m benchmarks.vad_skip
+"""
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.services.audio.VoiceActivity import VoiceActivityFilter
+import numpy as np
+import time
+
+SAMPLE_RATE = 16000
+# (silence before, speech) pairs in seconds; a waiting room, short pauses, a muted stretch
+LAYOUT = [(60, 20), (1, 15), (0.8, 30), (45, 25), (1.5, 10), (120, 40), (0.5, 20)]
+
+
+def synthetic_meeting(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    pieces, bursts, cursor = [], [], 0.0
+    for silence, speech in LAYOUT:
+        pieces.append(0.001 * rng.standard_normal(int(silence * SAMPLE_RATE)))
+        cursor += silence
+        t = np.arange(int(speech * SAMPLE_RATE)) / SAMPLE_RATE
+        pieces.append(0.2 * np.sin(2 * np.pi * 180 * t) + 0.001 * rng.standard_normal(len(t)))
+        bursts.append((cursor, cursor + speech))
+        cursor += speech
+    samples = np.concatenate(pieces).astype(np.float32)
+    return DecodedAudio(samples, source_path="synthetic", sample_rate=SAMPLE_RATE), bursts
+
+
+def main():
+    audio, bursts = synthetic_meeting()
+    vad = VoiceActivityFilter()
+
+    start = time.perf_counter()
+    compact, timestamp_map = vad.filter(audio)
+    elapsed = time.perf_counter() - start
+
+    # Map every burst's compact-timeline position back and compare with the truth
+    errors = []
+    for burst_start, burst_end in bursts:
+        middle = (burst_start + burst_end) / 2
+        for original_start, original_end, compact_start in timestamp_map.regions:
+            if original_start <= middle <= original_end:
+                compact_middle = compact_start + middle - original_start
+                mapped = timestamp_map.to_original(compact_middle, compact_middle + 1.0)
+                errors.append(abs(mapped[0][0] - middle))
+
+    print(f"original audio:     {audio.duration:>8.1f}s")
+    print(f"after VAD:          {compact.duration:>8.1f}s")
+    print(f"skipped fraction:   {timestamp_map.skipped_fraction:>8.1%}")
+    print(f"kept regions:       {len(timestamp_map.regions):>8}")
+    print(f"VAD time:           {elapsed * 1000:>8.1f} ms ({audio.duration / max(elapsed, 1e-9):.0f}x real time)")
+    print(f"bursts located:     {len(errors):>8} / {len(bursts)}")
+    print(f"max mapping error:  {max(errors) * 1000 if errors else float('nan'):>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
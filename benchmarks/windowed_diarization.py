@@ -0,0 +1,112 @@
+"""
+Single-pass vs windowed diarization on the same audio: peak memory, wall time
+and how consistently both label the speakers (share of speech time where the
+windowed label matches the single-pass label after the best label mapping).
+
+Without an argument a synthetic meeting is built from voice-like harmonic
+sources with different pitches and formants taking turns.
+
+Run from the repository root:
+    python -m benchmarks.windowed_diarization [path/to/meeting.mp3]
+"""
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.audio.DecodedAudio import DecodedAudio
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import tempfile
+import resource
+import time
+import wave
+import sys
+import os
+
+SAMPLE_RATE = 16000
+SPEAKERS = [(110, 700), (145, 950), (210, 1200), (260, 1600)]
+SYNTHETIC_MINUTES = 40
+WINDOW_SECONDS = 300
+OVERLAP_SECONDS = 30
+FRAME = 0.1
+
+
+def synthetic_meeting(path: str, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    pieces, total = [], 0
+    while total < SYNTHETIC_MINUTES * 60 * SAMPLE_RATE:
+        pitch, formant = SPEAKERS[rng.integers(len(SPEAKERS))]
+        t = np.arange(int(rng.uniform(3, 20) * SAMPLE_RATE)) / SAMPLE_RATE
+        f0 = pitch * (1 + 0.05 * np.sin(2 * np.pi * 0.7 * t))
+        phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+        voice = sum(np.exp(-((k * pitch - formant) / 400) ** 2) * np.sin(k * phase) for k in range(1, 20))
+        syllables = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+        pieces.append(0.1 * voice * syllables / np.abs(voice).max())
+        pieces.append(np.zeros(int(rng.uniform(0.2, 1.0) * SAMPLE_RATE)))
+        total += len(t)
+    samples = np.concatenate(pieces) + 0.002 * rng.standard_normal(sum(len(p) for p in pieces))
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes((np.clip(samples, -1, 1) * 32767).astype(np.int16).tobytes())
+
+
+def frame_labels(diarization, duration: float) -> np.ndarray:
+    labels = np.full(int(duration / FRAME) + 1, "", dtype=object)
+    for turn, _, speaker in diarization.itertracks(yield_label=True):
+        labels[int(turn.start / FRAME):int(turn.end / FRAME)] = speaker
+    return labels
+
+
+def run(args):
+    mode, path = args
+    audio = DecodedAudio.from_file(path)
+    diarizer = AudioDiarization()
+    start = time.perf_counter()
+    if mode == "single":
+        diarization = diarizer.pipeline(audio.to_pyannote())
+    else:
+        diarization = diarizer.find_speakers_windowed(audio, window_seconds=WINDOW_SECONDS, overlap_seconds=OVERLAP_SECONDS)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return elapsed, peak_mb, frame_labels(diarization, audio.duration), len(diarization.labels())
+
+
+def consistency(reference: np.ndarray, candidate: np.ndarray) -> float:
+    speech = (reference != "") & (candidate != "")
+    pairs = {}
+    for ref, cand in zip(reference[speech], candidate[speech]):
+        pairs[(ref, cand)] = pairs.get((ref, cand), 0) + 1
+    # Greedy one-to-one label mapping by overlap
+    matched, used_ref, used_cand = 0, set(), set()
+    for (ref, cand), count in sorted(pairs.items(), key=lambda item: -item[1]):
+        if ref not in used_ref and cand not in used_cand:
+            matched += count
+            used_ref.add(ref)
+            used_cand.add(cand)
+    return matched / max(int(speech.sum()), 1)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    if path is None:
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            path = f.name
+        synthetic_meeting(path)
+    try:
+        # A fresh process per mode so peak RSS belongs to that mode only
+        results = {}
+        for mode in ("single", "windowed"):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                results[mode] = pool.submit(run, (mode, path)).result()
+
+        print(f"{'mode':>9} {'wall (s)':>9} {'peak RSS (MB)':>14} {'speakers':>9}")
+        for mode, (elapsed, peak_mb, _, speakers) in results.items():
+            print(f"{mode:>9} {elapsed:>9.1f} {peak_mb:>14.0f} {speakers:>9}")
+        agreement = consistency(results["single"][2], results["windowed"][2])
+        print(f"speaker consistency vs single-pass: {agreement:.1%}")
+    finally:
+        if len(sys.argv) == 1:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,15 @@ class DoneTalkingRecorder {
         this.debugPanel = null;
         this.audioContext = null;
         this.startTime = null;
+        this.uploadChunkSize = 8 * 1024 * 1024;
+        this.uploadRetries = 5;
+        this.liveSessionId = null;
+        this.liveSeq = 0;
+        this.liveSentChunks = 0;
+        this.liveFailed = false;
+        this.liveSending = Promise.resolve();
+        this.liveTimer = null;
+        this.liveFlushMs = 5000;
         this.init();
     }
     
@@ -344,6 +353,7 @@ class DoneTalkingRecorder {
             this.recorder.start(100); // Collect data every 100ms for immediate feedback
             this.isRecording = true;
             this.startTime = new Date();
+            this.startLiveSession(this.recorder.mimeType || 'audio/webm');
             
             debugInfo += '▶️ Recording started!<br>';
             this.updateDebugPanel(debugInfo);
@@ -477,29 +487,14 @@ class DoneTalkingRecorder {
                 └ Type: ${audioBlob.type}`;
         }
         
-        // Create FormData for upload
-        const formData = new FormData();
         const filename = `meeting_${Date.now()}.${audioBlob.type.includes('mp4') ? 'm4a' : 'webm'}`;
-        formData.append('audio_file', audioBlob, filename);
-        formData.append('platform', this.detectPlatform());
-        formData.append('timestamp', new Date().toISOString());
-        formData.append('duration', duration.toString());
         
         try {
-            const response = await fetch(`${this.apiUrl}/receive_meeting`, {
-                method: 'POST',
-                headers: {
-                    'Authorization': `Bearer ${this.apiKey}`  
-                },
-                body: formData
-            });
-            
-            if (response.ok) {
-                this.showNotification('✅ Recording uploaded successfully!', 'success');
-                console.log('✅ Upload successful');
-            } else {
-                throw new Error(`Upload failed: ${response.status}`);
-            }
+            // Most of the meeting is already processed when it was streamed live
+            const jobId = await this.finishLiveSession() || await this.uploadResumable(audioBlob, filename);
+            this.showNotification('✅ Recording uploaded successfully!', 'success');
+            console.log('✅ Upload successful');
+            this.followJob(jobId);
         } catch (error) {
             console.warn('⚠️ Upload failed, downloading locally:', error);
             this.downloadAudio(audioBlob, filename);
@@ -511,6 +506,190 @@ class DoneTalkingRecorder {
         this.cleanup();
     }
     
+    async startLiveSession(mimeType) {
+        // Stream the recording while the meeting runs so processing keeps up with it
+        this.liveSessionId = null;
+        this.liveSeq = 0;
+        this.liveSentChunks = 0;
+        this.liveFailed = false;
+        this.liveSending = Promise.resolve();
+        try {
+            const formData = new FormData();
+            formData.append('content_type', mimeType);
+            formData.append('platform', this.detectPlatform());
+            formData.append('timestamp', new Date().toISOString());
+            const response = await fetch(`${this.apiUrl}/live`, {
+                method: 'POST',
+                headers: { 'Authorization': `Bearer ${this.apiKey}` },
+                body: formData
+            });
+            if (!response.ok) throw new Error(`Live session failed: ${response.status}`);
+            this.liveSessionId = (await response.json()).session_id;
+            this.liveTimer = setInterval(() => this.flushLive(), this.liveFlushMs);
+            console.log(`📡 Live session ${this.liveSessionId} started`);
+        } catch (error) {
+            console.warn('⚠️ Live processing unavailable, the recording will be uploaded at the end:', error);
+            this.liveFailed = true;
+        }
+    }
+    
+    flushLive() {
+        if (!this.liveSessionId || this.liveFailed) return this.liveSending;
+        const pending = this.audioChunks.slice(this.liveSentChunks);
+        if (pending.length === 0) return this.liveSending;
+        this.liveSentChunks = this.audioChunks.length;
+        const seq = this.liveSeq++;
+        const body = new Blob(pending);
+        
+        // Chunks must arrive in order, so sends are chained
+        this.liveSending = this.liveSending.then(async () => {
+            if (this.liveFailed) return;
+            for (let attempt = 0; attempt <= this.uploadRetries; attempt++) {
+                try {
+                    const response = await fetch(`${this.apiUrl}/live/${this.liveSessionId}/chunks?seq=${seq}`, {
+                        method: 'POST',
+                        headers: {
+                            'Authorization': `Bearer ${this.apiKey}`,
+                            'Content-Type': 'application/octet-stream'
+                        },
+                        body: body
+                    });
+                    if (!response.ok) throw new Error(`Live chunk failed: ${response.status}`);
+                    const { processed_seconds } = await response.json();
+                    console.log(`📡 Live chunk ${seq} sent, ${processed_seconds}s processed`);
+                    return;
+                } catch (error) {
+                    console.warn(`⚠️ Live chunk ${seq} failed (attempt ${attempt + 1}):`, error);
+                    await new Promise(resolve => setTimeout(resolve, 1000 * 2 ** attempt));
+                }
+            }
+            this.liveFailed = true;
+        });
+        return this.liveSending;
+    }
+    
+    async finishLiveSession() {
+        // Returns the job id, or null when the full recording has to be uploaded instead
+        clearInterval(this.liveTimer);
+        this.liveTimer = null;
+        if (!this.liveSessionId) return null;
+        await this.flushLive();
+        if (this.liveFailed) return null;
+        try {
+            const response = await fetch(`${this.apiUrl}/live/${this.liveSessionId}/finish`, {
+                method: 'POST',
+                headers: { 'Authorization': `Bearer ${this.apiKey}` }
+            });
+            if (!response.ok) throw new Error(`Live finish failed: ${response.status}`);
+            const { job_id } = await response.json();
+            return job_id;
+        } catch (error) {
+            console.warn('⚠️ Could not finish live session, uploading the recording instead:', error);
+            return null;
+        } finally {
+            this.liveSessionId = null;
+        }
+    }
+    
+    async uploadResumable(audioBlob, filename) {
+        // Chunked upload that survives dropped connections: only missing ranges are resent
+        const authHeaders = { 'Authorization': `Bearer ${this.apiKey}` };
+        const createResponse = await fetch(`${this.apiUrl}/uploads`, {
+            method: 'POST',
+            headers: { ...authHeaders, 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                filename: filename,
+                size: audioBlob.size,
+                source: 'recorded',
+                content_type: audioBlob.type,
+                platform: this.detectPlatform(),
+                timestamp: new Date().toISOString()
+            })
+        });
+        if (!createResponse.ok) throw new Error(`Upload session failed: ${createResponse.status}`);
+        const session = await createResponse.json();
+        const sessionUrl = `${this.apiUrl}/uploads/${session.upload_id}`;
+        const chunkSize = Math.min(session.max_chunk_bytes, this.uploadChunkSize);
+        let received = session.received;
+        
+        for (let attempt = 0; ; attempt++) {
+            try {
+                for (let start = 0; start < audioBlob.size; start += chunkSize) {
+                    const end = Math.min(start + chunkSize, audioBlob.size);
+                    if (received.some(([from, to]) => from <= start && end <= to)) continue;
+                    
+                    const chunk = await audioBlob.slice(start, end).arrayBuffer();
+                    const digest = await crypto.subtle.digest('SHA-256', chunk);
+                    const checksum = Array.from(new Uint8Array(digest)).map(b => b.toString(16).padStart(2, '0')).join('');
+                    const response = await fetch(sessionUrl, {
+                        method: 'PUT',
+                        headers: {
+                            ...authHeaders,
+                            'Content-Type': 'application/octet-stream',
+                            'Content-Range': `bytes ${start}-${end - 1}/${audioBlob.size}`,
+                            'X-Chunk-SHA256': checksum
+                        },
+                        body: chunk
+                    });
+                    if (!response.ok) throw new Error(`Chunk upload failed: ${response.status}`);
+                    console.log(`📤 Uploaded ${end}/${audioBlob.size} bytes`);
+                }
+                break;
+            } catch (error) {
+                if (attempt >= this.uploadRetries) throw error;
+                console.warn(`⚠️ Upload interrupted, resuming (attempt ${attempt + 1}):`, error);
+                await new Promise(resolve => setTimeout(resolve, 1000 * 2 ** attempt));
+                // Ask the server which ranges already arrived
+                const statusResponse = await fetch(sessionUrl, { headers: authHeaders });
+                if (statusResponse.ok) received = (await statusResponse.json()).received;
+            }
+        }
+        
+        const finalizeResponse = await fetch(`${sessionUrl}/finalize`, { method: 'POST', headers: authHeaders });
+        if (!finalizeResponse.ok) throw new Error(`Upload failed: ${finalizeResponse.status}`);
+        const { job_id } = await finalizeResponse.json();
+        return job_id;
+    }
+    
+    async followJob(jobId) {
+        // Read the job's Server-Sent Events stream (fetch so the token can be sent)
+        const debugContent = document.getElementById('debug-content');
+        try {
+            const response = await fetch(`${this.apiUrl}/jobs/${jobId}/events`, {
+                headers: { 'Authorization': `Bearer ${this.apiKey}` }
+            });
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const messages = buffer.split('\n\n');
+                buffer = messages.pop();
+                
+                for (const message of messages) {
+                    const dataLine = message.split('\n').find(line => line.startsWith('data: '));
+                    if (!dataLine) continue;
+                    const event = JSON.parse(dataLine.slice(6));
+                    const counts = event.total ? ` ${event.done || 0}/${event.total}` : '';
+                    const eta = event.eta_seconds != null ? `, ETA ${Math.round(event.eta_seconds)}s` : '';
+                    console.log(`⏳ ${event.stage} ${event.status}${counts} (${event.elapsed_seconds || 0}s${eta})`);
+                    if (debugContent) {
+                        debugContent.innerHTML += `<br>⏳ ${event.stage}: ${event.status}${counts}${eta}`;
+                    }
+                    if (event.stage === 'job') {
+                        const ok = event.status === 'completed';
+                        this.showNotification(ok ? '✅ Meeting summary is ready!' : `❌ Processing failed: ${event.error}`, ok ? 'success' : 'error');
+                    }
+                }
+            }
+        } catch (error) {
+            console.warn('⚠️ Lost progress stream:', error);
+        }
+    }
+    
     downloadAudio(audioBlob, filename) {
         const url = URL.createObjectURL(audioBlob);
 
@@ -0,0 +1,119 @@
+from fastapi import Form, HTTPException
+from pydantic import ValidationError
+from typing import Callable, Dict, Any, Optional
+import threading
+
+_instances: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def _shared(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Build a controller on first use and reuse it for every later request.
+    """
+    instance = _instances.get(name)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(name)
+            if instance is None:
+                instance = factory()
+                _instances[name] = instance
+    return instance
+
+
+def get_audio_controller():
+    def build():
+        from src.controllers import AudioController
+        return AudioController()
+    return _shared("audio", build)
+
+
+def get_upload_controller():
+    def build():
+        from src.controllers import UploadController
+        return UploadController()
+    return _shared("upload", build)
+
+
+def get_download_controller():
+    def build():
+        from src.controllers import DownloadController
+        return DownloadController()
+    return _shared("download", build)
+
+
+def get_recorded_controller():
+    def build():
+        from src.controllers import RecordedController
+        return RecordedController()
+    return _shared("recorded", build)
+
+
+def get_job_controller():
+    def build():
+        from src.controllers import JobController
+        from src.core import get_settings
+        settings = get_settings()
+        return JobController(
+            audio_controller_factory=get_audio_controller,
+            download_controller_factory=get_download_controller,
+            max_workers=settings.JOB_WORKERS,
+            max_pending=settings.JOB_MAX_PENDING,
+            scheduler=settings.JOB_SCHEDULER,
+            diarization_devices=[d.strip() for d in settings.DIARIZATION_DEVICES.split(",") if d.strip()],
+            asr_concurrency=settings.ASR_CONCURRENCY,
+            llm_concurrency=settings.LLM_CONCURRENCY,
+            tts_concurrency=settings.TTS_CONCURRENCY
+        )
+    return _shared("jobs", build)
+
+
+def get_upload_sessions():
+    def build():
+        from src.services.file_transfer.UploadSessions import UploadSessions
+        from src.core import get_settings
+        settings = get_settings()
+        return UploadSessions(
+            ttl_seconds=settings.UPLOAD_SESSION_TTL_HOURS * 3600,
+            max_chunk_bytes=settings.UPLOAD_CHUNK_MAX_MB * 1024 * 1024,
+            max_upload_bytes=settings.UPLOAD_MAX_MB * 1024 * 1024
+        )
+    return _shared("upload_sessions", build)
+
+
+def get_live_controller():
+    def build():
+        from src.controllers import LiveController
+        from src.core import get_settings
+        settings = get_settings()
+        return LiveController(
+            audio_controller_factory=get_audio_controller,
+            job_controller_factory=get_job_controller,
+            workers=settings.LIVE_WORKERS,
+            # Replicas after the ones owned by the job scheduler's ASR workers
+            first_replica=settings.ASR_CONCURRENCY,
+            window_seconds=settings.LIVE_WINDOW_SECONDS,
+            context_seconds=settings.LIVE_CONTEXT_SECONDS,
+            link_threshold=settings.SPEAKER_LINK_THRESHOLD,
+            idle_timeout_seconds=settings.LIVE_IDLE_TIMEOUT_MINUTES * 60
+        )
+    return _shared("live", build)
+
+
+def get_job_options(
+    num_speakers: Optional[int] = Form(None),
+    min_speakers: Optional[int] = Form(None),
+    max_speakers: Optional[int] = Form(None),
+    language: Optional[str] = Form(None)
+):
+    """
+    Job hints sent as form fields next to an uploaded file.
+    """
+    from src.schemas import JobOptions
+    try:
+        return JobOptions(
+            num_speakers=num_speakers, min_speakers=min_speakers, max_speakers=max_speakers,
+            language=language.strip().lower() if language else None
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
@@ -1,23 +1,31 @@
-from fastapi import HTTPException, APIRouter, Request
-from src.controllers import DownloadController, AudioController
+from fastapi import HTTPException, APIRouter, Request, Depends
+from fastapi.responses import FileResponse, JSONResponse
+from src.api.dependencies import get_job_controller
 from src.middleware.rate_limit import RateLimits, limiter
 from src.db import SourceType
 from src.schemas import DownloadRequest
-
-
-download_handler = DownloadController()
-audio_processor = AudioController()
+import asyncio
 
 
 download_router = APIRouter()
 @download_router.post("/download_audio")
 @limiter.limit(RateLimits.DOWNLOAD)
-async def download_audio(download_request: DownloadRequest, request: Request):
-    """Download and process audio file"""
+async def download_audio(
+    download_request: DownloadRequest,
+    request: Request,
+    wait: bool = True,
+    jobs = Depends(get_job_controller)
+):
+    """Download and process audio file.
+    With wait=false the job id is returned right away instead of the summary audio.
+    Optional num_speakers/min_speakers/max_speakers fields narrow the diarization search."""
     try:
         video_url = download_request.video_url
-        file_path = download_handler.get_file_path(video_url = video_url)
-        return await audio_processor.process(file_path, SourceType.URL)
+        job_id = await asyncio.to_thread(jobs.submit, video_url, SourceType.URL, options=download_request.to_options())
+        if not wait:
+            return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/v2/jobs/{job_id}"})
+        result = await jobs.wait(job_id)
+        return FileResponse(result["audio_summary_path"], media_type="audio/mpeg")
     except HTTPException:
         raise
     except Exception as e:
@@ -1,21 +1,36 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request
-from src.controllers import UploadController, AudioController
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Depends
+from fastapi.responses import FileResponse, JSONResponse
+from src.api.dependencies import get_upload_controller, get_job_controller, get_job_options
 from src.middleware.rate_limit import RateLimits, limiter
 from src.db import SourceType
-
-
-upload_handler = UploadController()
-audio_processor = AudioController()
+import asyncio
 
 
 upload_router = APIRouter()
 @upload_router.post("/upload_audio")
 @limiter.limit(RateLimits.UPLOAD)
-async def upload_audio(request: Request, audio: UploadFile = File(...)):
-    """Upload and process audio file"""
+async def upload_audio(
+    request: Request,
+    audio: UploadFile = File(...),
+    wait: bool = True,
+    options = Depends(get_job_options),
+    upload_handler = Depends(get_upload_controller),
+    jobs = Depends(get_job_controller)
+):
+    """Upload and process audio file.
+    With wait=false the job id is returned right away instead of the summary audio.
+    Optional num_speakers/min_speakers/max_speakers form fields narrow the diarization search."""
     try:
-        file_path = upload_handler.get_file_path(audio)
-        return await audio_processor.process(file_path, SourceType.UPLOAD)
+        stored = await upload_handler.ingest(audio)
+        # The job row is written synchronously, off the event loop
+        job_id = await asyncio.to_thread(
+            jobs.submit, stored["file_path"], SourceType.UPLOAD, content_hash=stored["content_hash"],
+            options=options.to_options()
+        )
+        if not wait:
+            return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/v2/jobs/{job_id}"})
+        result = await jobs.wait(job_id)
+        return FileResponse(result["audio_summary_path"], media_type="audio/mpeg")
     except HTTPException:
         raise
     except Exception as e:
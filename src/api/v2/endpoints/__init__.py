@@ -1 +1,5 @@
-from .receive_audio import accept_audio_router
\ No newline at end of file
+from .receive_audio import accept_audio_router
+from .jobs import jobs_router
+from .cache import cache_router
+from .uploads import uploads_router
+from .live import live_router
\ No newline at end of file
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Request
+from src.middleware.rate_limit import RateLimits, limiter
+
+cache_router = APIRouter()
+
+@cache_router.get("/cache/stats")
+@limiter.limit(RateLimits.JOBS)
+def get_cache_stats(request: Request):
+    """Result cache size and hit/miss counters, plus the PCM cache of running jobs"""
+    from src.services.cache.ResultCache import result_cache
+    from src.services.audio.PCMCache import pcm_cache
+    return {**result_cache.stats(), "pcm": pcm_cache.stats()}
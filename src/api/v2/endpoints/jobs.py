@@ -0,0 +1,107 @@
+from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi.responses import FileResponse, StreamingResponse
+from src.api.dependencies import get_job_controller
+from src.middleware.rate_limit import RateLimits, limiter
+from src.services.progress.JobProgress import progress_hub
+from src.db import JobStatus
+import asyncio
+import json
+
+KEEPALIVE_SECONDS = 15
+POLL_SECONDS = 2
+
+# Stored job states that end the event stream, named as JobProgress.finish names them
+FINISHED_STATUSES = {JobStatus.SUCCEEDED: "completed", JobStatus.FAILED: "failed"}
+
+ARTIFACTS = {
+    "audio": ("audio_summary_path", "audio/mpeg"),
+    "summary": ("summary_json_path", "application/json"),
+    "diarization": ("diarization_csv_path", "text/csv"),
+}
+
+jobs_router = APIRouter()
+
+@jobs_router.get("/jobs/{job_id}")
+@limiter.limit(RateLimits.JOBS)
+def get_job_status(request: Request, job_id: str, jobs = Depends(get_job_controller)):
+    """Return the current state of a processing job"""
+    return jobs.get(job_id).to_dict()
+
+@jobs_router.get("/jobs/{job_id}/result")
+@limiter.limit(RateLimits.JOBS)
+def get_job_result(request: Request, job_id: str, artifact: str = "audio", jobs = Depends(get_job_controller)):
+    """Download an artifact of a finished job: audio (default), summary or diarization"""
+    if artifact not in ARTIFACTS:
+        raise HTTPException(status_code=400, detail=f"Unknown artifact: {artifact}")
+
+    job = jobs.get(job_id)
+    if job.status == JobStatus.FAILED:
+        # The request itself is fine, the job it refers to has no result
+        raise HTTPException(status_code=409, detail=f"Job failed: {job.error}")
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.value.lower()}")
+
+    column, media_type = ARTIFACTS[artifact]
+    path = getattr(job, column)
+    if path is None:
+        # The diarization CSV is only written with TRANSCRIPT_CSV_EXPORT
+        raise HTTPException(status_code=404, detail=f"Job has no {artifact} artifact")
+    return FileResponse(path, media_type=media_type)
+
+
+@jobs_router.get("/jobs/{job_id}/events")
+@limiter.limit(RateLimits.JOBS)
+async def stream_job_events(request: Request, job_id: str, jobs = Depends(get_job_controller)):
+    """Server-Sent Events stream of stage progress (stage, status, elapsed and ETA) for a job"""
+    # 404 before the stream starts
+    await asyncio.to_thread(jobs.get, job_id)
+
+    async def stored_events():
+        # No progress in this process yet (queued, or run by another worker):
+        # follow the stored status until the job is over or its progress appears
+        last_status, waited = None, 0.0
+        while progress_hub.get(job_id) is None and not await request.is_disconnected():
+            job = await asyncio.to_thread(jobs.get, job_id)
+            if job.status in FINISHED_STATUSES:
+                snapshot = {"job_id": job_id, "stage": "job", "status": FINISHED_STATUSES[job.status], "error": job.error}
+                yield f"event: job\ndata: {json.dumps(snapshot)}\n\n"
+                return
+            if job.status != last_status:
+                last_status, waited = job.status, 0.0
+                snapshot = {"job_id": job_id, "stage": "queue", "status": job.status.value.lower()}
+                yield f"event: queue\ndata: {json.dumps(snapshot)}\n\n"
+            elif waited >= KEEPALIVE_SECONDS:
+                waited = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(POLL_SECONDS)
+            waited += POLL_SECONDS
+
+    async def event_stream():
+        async for message in stored_events():
+            yield message
+            if message.startswith("event: job"):
+                return
+        progress = progress_hub.get(job_id)
+        if progress is None:
+            return
+        queue = progress.subscribe()
+        try:
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield f"event: {event['stage']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            progress.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Request, Depends, Form
+from fastapi.responses import JSONResponse, FileResponse
+from src.api.dependencies import get_live_controller, get_job_controller
+from src.middleware.rate_limit import RateLimits, limiter
+import asyncio
+
+live_router = APIRouter()
+
+@live_router.post("/live")
+@limiter.limit(RateLimits.ACCEPT)
+def start_live_session(
+    request: Request,
+    content_type: str = Form("audio/webm"),
+    platform: str = Form(None),
+    timestamp: str = Form(None),
+    live = Depends(get_live_controller)
+):
+    """Open a live session, the recording is then streamed with POST /live/{session_id}/chunks"""
+    return JSONResponse(status_code=201, content=live.create(content_type=content_type, platform=platform, timestamp=timestamp))
+
+@live_router.post("/live/{session_id}/chunks")
+@limiter.limit(RateLimits.LIVE)
+async def append_live_chunk(request: Request, session_id: str, seq: int, live = Depends(get_live_controller)):
+    """Append the next piece of the recording, seq numbers start at 0 and retries of a seq are ignored"""
+    data = await request.body()
+    return await asyncio.to_thread(live.append, session_id, seq, data)
+
+@live_router.get("/live/{session_id}/transcript")
+@limiter.limit(RateLimits.JOBS)
+def get_live_transcript(request: Request, session_id: str, live = Depends(get_live_controller)):
+    """Running diarized transcript of the session so far"""
+    return live.transcript(session_id)
+
+@live_router.post("/live/{session_id}/finish")
+@limiter.limit(RateLimits.ACCEPT)
+async def finish_live_session(
+    request: Request,
+    session_id: str,
+    wait: bool = False,
+    live = Depends(get_live_controller),
+    jobs = Depends(get_job_controller)
+):
+    """Process the last window and queue the summary job from the running transcript"""
+    job_id = await asyncio.wrap_future(live.finish(session_id))
+    if not wait:
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/v2/jobs/{job_id}"})
+    result = await jobs.wait(job_id)
+    return FileResponse(result["audio_summary_path"], media_type="audio/mpeg")
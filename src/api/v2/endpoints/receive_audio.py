@@ -1,14 +1,13 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
-from fastapi.responses import JSONResponse
-from src.controllers import RecordedController, AudioController
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request, Depends
+from fastapi.responses import JSONResponse, FileResponse
+from src.api.dependencies import get_recorded_controller, get_job_controller, get_job_options
 from src.db import SourceType
 from src.middleware.rate_limit import RateLimits, limiter
+import asyncio
 
 
 
 accept_audio_router = APIRouter()
-recorded_controller = RecordedController()
-audio_processor = AudioController()
 
 @accept_audio_router.post("/receive_meeting")
 @limiter.limit(RateLimits.ACCEPT)
@@ -16,11 +15,15 @@ async def process_audio(
     request: Request,
     audio_file: UploadFile = File(...),
     platform: str = Form(...),
-    timestamp: str = Form(...)
+    timestamp: str = Form(...),
+    wait: bool = True,
+    options = Depends(get_job_options),
+    recorded_controller = Depends(get_recorded_controller),
+    jobs = Depends(get_job_controller)
 ):
     
     try:
-        file_result = recorded_controller.get_file_path(
+        file_result = await recorded_controller.get_file_path(
             audio_file=audio_file,
             platform=platform,
             timestamp=timestamp
@@ -29,9 +32,14 @@ async def process_audio(
         if isinstance(file_result, JSONResponse):
             return file_result
 
-        recorded_meeting, full_file_path, meeting_platform, meeting_timestamp = file_result
-        result = await audio_processor.process(full_file_path, SourceType.RECORDED)
-        return result
+        recorded_meeting, full_file_path, meeting_platform, meeting_timestamp, content_hash = file_result
+        job_id = await asyncio.to_thread(
+            jobs.submit, full_file_path, SourceType.RECORDED, content_hash=content_hash, options=options.to_options()
+        )
+        if not wait:
+            return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/v2/jobs/{job_id}"})
+        result = await jobs.wait(job_id)
+        return FileResponse(result["audio_summary_path"], media_type="audio/mpeg")
 
     except HTTPException:
         raise
@@ -0,0 +1,113 @@
+from fastapi import APIRouter, HTTPException, Request, Depends, Header
+from fastapi.responses import JSONResponse, FileResponse
+from src.api.dependencies import get_upload_sessions, get_job_controller
+from src.middleware.rate_limit import RateLimits, limiter
+from src.db import SourceType
+from src.schemas import JobOptions
+from typing import Optional
+import asyncio
+import re
+
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+uploads_router = APIRouter()
+
+
+class UploadSessionRequest(JobOptions):
+    filename: str
+    size: int
+    # "upload" behaves like /upload_audio, "recorded" like /receive_meeting
+    source: str = "upload"
+    content_type: Optional[str] = None
+    platform: Optional[str] = None
+    timestamp: Optional[str] = None
+
+
+@uploads_router.post("/uploads")
+@limiter.limit(RateLimits.UPLOAD)
+def create_upload(request: Request, body: UploadSessionRequest, sessions = Depends(get_upload_sessions)):
+    """Open a resumable upload session, chunks are then sent with PUT /uploads/{upload_id}"""
+    if body.source == "upload":
+        if not body.filename.lower().endswith(".mp3"):
+            raise HTTPException(status_code=400, detail="Invalid file type. Only .mp3 files are allowed.")
+        source_type = SourceType.UPLOAD
+    elif body.source == "recorded":
+        if not (body.content_type or "").startswith("audio/"):
+            raise HTTPException(status_code=400, detail="The file is not audio file, Refused")
+        source_type = SourceType.RECORDED
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown upload source: {body.source}")
+
+    state = sessions.create(
+        filename=body.filename,
+        size=body.size,
+        source_type=source_type.value,
+        metadata={"platform": body.platform, "timestamp": body.timestamp, "options": body.to_options()}
+    )
+    return JSONResponse(status_code=201, content=state)
+
+
+@uploads_router.put("/uploads/{upload_id}")
+@limiter.limit(RateLimits.UPLOAD_CHUNKS)
+async def upload_chunk(
+    request: Request,
+    upload_id: str,
+    content_range: str = Header(...),
+    x_chunk_sha256: str = Header(...),
+    sessions = Depends(get_upload_sessions)
+):
+    """Store one byte range, sent with Content-Range: bytes start-end/size and X-Chunk-SHA256"""
+    match = CONTENT_RANGE.fullmatch(content_range.strip())
+    if not match:
+        raise HTTPException(status_code=400, detail="Content-Range must look like 'bytes start-end/size'")
+    start, end = int(match.group(1)), int(match.group(2))
+
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > sessions.max_chunk_bytes:
+        raise HTTPException(status_code=413, detail=f"Chunks are limited to {sessions.max_chunk_bytes} bytes")
+    data = await request.body()
+    if len(data) != end - start + 1:
+        raise HTTPException(status_code=400, detail="Content-Range does not match the body length")
+
+    return await asyncio.to_thread(sessions.write_chunk, upload_id, start, data, x_chunk_sha256)
+
+
+@uploads_router.get("/uploads/{upload_id}")
+@limiter.limit(RateLimits.UPLOAD_CHUNKS)
+def get_upload(request: Request, upload_id: str, sessions = Depends(get_upload_sessions)):
+    """Received byte ranges of a session, used to resume after a dropped connection"""
+    return sessions.status(upload_id)
+
+
+@uploads_router.delete("/uploads/{upload_id}")
+@limiter.limit(RateLimits.UPLOAD_CHUNKS)
+def abort_upload(request: Request, upload_id: str, sessions = Depends(get_upload_sessions)):
+    """Discard a session and its received bytes"""
+    sessions.abort(upload_id)
+    return {"upload_id": upload_id, "status": "aborted"}
+
+
+@uploads_router.post("/uploads/{upload_id}/finalize")
+@limiter.limit(RateLimits.UPLOAD)
+async def finalize_upload(
+    request: Request,
+    upload_id: str,
+    wait: bool = False,
+    sessions = Depends(get_upload_sessions),
+    jobs = Depends(get_job_controller)
+):
+    """Assemble a complete upload and queue it for processing like a regular upload.
+    With wait=true the summary audio is returned once the job finishes."""
+    def submit(stored):
+        return jobs.submit(
+            stored["file_path"], SourceType(stored["source_type"]),
+            content_hash=stored["content_hash"], options=stored["metadata"].get("options")
+        )
+
+    # The session is only closed once the job exists, a full queue leaves it ready for another finalize
+    stored = await asyncio.to_thread(sessions.finalize, upload_id, submit)
+    job_id = stored["job_id"]
+    if not wait:
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status_url": f"/v2/jobs/{job_id}"})
+    result = await jobs.wait(job_id)
+    return FileResponse(result["audio_summary_path"], media_type="audio/mpeg")
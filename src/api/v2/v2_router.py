@@ -1,9 +1,13 @@
 from fastapi import APIRouter
-from src.api.v2.endpoints import accept_audio_router
+from src.api.v2.endpoints import accept_audio_router, jobs_router, cache_router, uploads_router, live_router
 
 v2_router = APIRouter(
     prefix="/v2",
     tags=["v2"]
 )
 v2_router.include_router(accept_audio_router)
+v2_router.include_router(jobs_router)
+v2_router.include_router(cache_router)
+v2_router.include_router(uploads_router)
+v2_router.include_router(live_router)
 
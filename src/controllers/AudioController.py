@@ -2,11 +2,15 @@ from .language_processor import EnglishController, ArabicController
 #from services import AudioDiarization, AnalysisService
 from src.services.diarization.AudioDiarization import AudioDiarization
 from src.services.analysis.AnalysisService import AnalysisService
+from src.services.audio.CanonicalAudio import CanonicalAudio
+from src.services.audio.AudioProbe import audio_probe
+from src.services.transcript.Transcript import Transcript
+from src.services.progress.JobProgress import JobProgress
+from src.services.cache.ResultCache import result_cache, hash_file, config_fingerprint
+from .ProcessingContext import ProcessingContext
 from src.db import SourceType, insert_into_db
 from fastapi import HTTPException
-from fastapi.responses import FileResponse
-from typing import Dict, Any, Tuple
-from pydub import AudioSegment
+from typing import Dict, Any, Optional
 import os
 
 class AudioController:
@@ -14,72 +18,202 @@ class AudioController:
     
     def __init__(self):
         self.diarization = AudioDiarization()
+        self.canonical = CanonicalAudio()
         self.processors = {
             'en': EnglishController(),
             'ar': ArabicController()
         }
+        self.fingerprint = self.config_fingerprint()
     
-    def _analyze_audio(self, file_path: str) -> Tuple[str, Dict[str, Any], str]:
-        """Analyze audio and return CSV path, analysis data, and language"""
-        print(file_path)
-        _, _, csv_path = self.diarization.diarize(audio_file=file_path)
-        analysis_service = AnalysisService(csv_path=csv_path)
+    def config_fingerprint(self) -> str:
+        """Hash of everything in the pipeline configuration that changes the output"""
+        settings = self.diarization.app_settings
+        config = {
+            "diarization_model": settings.DIARIZATION_MODEL,
+            "whisper_model": settings.WHISPER_MODEL,
+            "asr_engine": settings.ASR_ENGINE,
+            "asr_compute_type": settings.ASR_COMPUTE_TYPE if settings.ASR_ENGINE == "faster_whisper" else None,
+            "transcription_mode": settings.TRANSCRIPTION_MODE,
+            "turn_consolidation": [settings.TURN_MERGE_GAP_SECONDS, settings.TURN_MIN_DURATION_SECONDS]
+            if settings.TURN_CONSOLIDATION_ENABLED else None,
+            "language_detection_seconds": settings.LANGUAGE_DETECTION_SECONDS,
+            "vad": [settings.VAD_THRESHOLD_DB, settings.VAD_MIN_SILENCE_SECONDS] if settings.VAD_ENABLED else None,
+            "windowed_diarization": [
+                settings.DIARIZATION_LONG_AUDIO_MINUTES,
+                settings.DIARIZATION_WINDOW_MINUTES,
+                settings.DIARIZATION_WINDOW_OVERLAP_SECONDS,
+                settings.SPEAKER_LINK_THRESHOLD,
+            ],
+            # Entries stored without the CSV can not serve its download
+            "transcript_csv": settings.TRANSCRIPT_CSV_EXPORT,
+        }
+        for language, processor in self.processors.items():
+            llm = processor.summary_service.llm
+            config[language] = {
+                "llm": getattr(llm, "model", None) or getattr(llm, "model_name", None),
+                "prompt_version": config_fingerprint({"template": processor.summary_service.prompt.template}),
+                "voice": processor.tts.voice,
+            }
+        return config_fingerprint(config)
+    
+    # ----------------------------------------- Stages -----------------------------------------
+    # Each stage only touches the context, so the serial path and the stage
+    # scheduler run exactly the same code.
+
+    def lookup_cache(self, context: ProcessingContext):
+        """Reuse the artifacts of an earlier job on the same audio and configuration"""
+        if not self.diarization.app_settings.RESULT_CACHE_ENABLED:
+            return
+        if context.csv_path:
+            # Live jobs summarize the session's own transcript, their result is not the offline pipeline's
+            return
+        context.content_hash = context.content_hash or hash_file(context.file_path)
+        # Hints change the diarization, jobs with different hints do not share results
+        fingerprint = config_fingerprint({"pipeline": self.fingerprint, "options": context.options}) if context.options else self.fingerprint
+        context.cache_key = result_cache.key(context.content_hash, fingerprint)
+        paths = result_cache.get(context.cache_key)
+        if paths is not None:
+            context.csv_path = paths["diarization_csv_path"]
+            context.json_path = paths["summary_json_path"]
+            context.audio_path = paths["audio_summary_path"]
+            context.cached = True
+            context.progress.complete("cache", hit=True)
+
+    def store_cache(self, context: ProcessingContext):
+        """Keep a finished job's artifacts for identical future inputs"""
+        if context.cache_key and not context.cached:
+            result_cache.put(context.cache_key, context.result())
+
+    def decode(self, context: ProcessingContext):
+        """Transcode the input once into the canonical 16 kHz mono file and its shared PCM buffer.
+        The original file is kept as is, later stages only read the canonical audio."""
+        progress = context.progress
+        progress.start("decode")
+        # Headers first so the duration (and ETAs) are known before the decode finishes
+        context.metadata = audio_probe.probe(context.file_path, content_hash=context.content_hash)
+        progress.set_audio_duration(context.metadata.duration)
+        if context.csv_path:
+            # Live jobs are already transcribed, nothing reads the canonical audio
+            progress.complete("decode", live=True, audio_seconds=round(context.metadata.duration, 2))
+            return
+        context.canonical_path, context.audio = self.canonical.ingest(
+            context.file_path, expected_seconds=context.metadata.duration
+        )
+        progress.complete("decode", audio_seconds=round(context.audio.duration, 2))
+
+    def find_speakers(self, context: ProcessingContext, device: Optional[str] = None):
+        """Speaker diarization with pyannote"""
+        if context.csv_path:
+            # Already diarized incrementally while the meeting was recorded
+            context.progress.complete("diarization", live=True)
+            return
+        context.diarization = self.diarization.find_speakers(
+            context.audio, progress=context.progress, device=device, speaker_hints=context.speaker_hints
+        )
+
+    def transcribe(self, context: ProcessingContext, replica: int = 0):
+        """Transcribe the diarization turns and write the CSV"""
+        if context.csv_path:
+            context.progress.complete("transcription", live=True)
+            return
+        # Pinned once for the job: the client's hint, or whisper on the first seconds of speech
+        context.language = context.options.get("language") or self.diarization.detect_language(
+            context.audio, context.diarization, replica=replica
+        )
+        _, context.transcript, context.csv_path = self.diarization.transcribe(
+            context.audio, context.diarization, progress=context.progress, replica=replica, language=context.language,
+            save_csv=self.diarization.app_settings.TRANSCRIPT_CSV_EXPORT
+        )
+
+    def analyze(self, context: ProcessingContext):
+        """Speaker and text statistics plus language detection"""
+        progress = context.progress
+        progress.start("analysis")
+        if context.transcript is None:
+            # Live jobs skip transcription, their transcript comes from the session's CSV
+            context.transcript = Transcript.from_csv(context.csv_path)
+        # The pinned language, or for live jobs the hint / the session's language if there is one.
+        # AnalysisService is the one place that refuses a language without a processor
+        analysis_service = AnalysisService(context.transcript, language=context.language or context.options.get("language"))
         
-        analysis_data = {
+        context.analysis_data = {
             "most_talked_speakers": analysis_service.get_most_talked_speakers(top_n=2),
             "total_duration": analysis_service.get_total_duration_for_each_speaker(),
             "most_used_word": analysis_service.get_most_used_word(),
             "total_speakers": analysis_service.get_total_number_of_speakers(),
-            "audio_duration": analysis_service.get_total_audio_duration(audio_path=file_path)
+            # Live jobs have no decoded audio, the probe has the duration
+            "audio_duration": analysis_service.get_total_audio_duration(audio=context.audio)
+            if context.audio is not None else context.metadata.duration
         }
         
-        language = analysis_service.get_language_type()
-        return csv_path, analysis_data, language
+        context.language = analysis_service.get_language_type()
+        progress.complete("analysis", language=context.language)
+
+    def summarize(self, context: ProcessingContext):
+        """LLM summary of the transcript"""
+        processor = self.processors[context.language]
+        context.progress.start("summarization")
+        context.final_text, context.json_path = processor.process_text(context.transcript, context.analysis_data)
+        context.progress.complete("summarization")
+
+    async def synthesize(self, context: ProcessingContext):
+        """Text to speech of the final summary"""
+        processor = self.processors[context.language]
+        context.progress.start("tts")
+        # Per-job file, the converter is shared by every job of the process
+        context.audio_path = await processor.tts.convert(context.final_text, output_path=processor.tts.new_audio_path())
+        
+        if not os.path.exists(context.audio_path):
+            raise HTTPException(status_code=500, detail="Audio generation failed")
+        context.progress.complete("tts")
+
+    def save(self, context: ProcessingContext):
+        """Record the job's artifacts in the database"""
+        context.progress.start("db_write")
+        insert_into_db(
+            source_type=context.source_type,
+            source_location=context.file_path,
+            duration=context.metadata.duration if context.metadata else context.analysis_data["audio_duration"],
+            diarization_csv_path=context.csv_path,
+            summary_json_path=context.json_path,
+            audio_summary_path=context.audio_path
+        )
+        context.progress.complete("db_write")
     
-    async def process(self, file_path: str, source_type: SourceType) -> FileResponse:
-        """Process audio file and return result"""
-        try:
-            # Convert audio format to mp3
-            if file_path.endswith(".webm"):
-                print(f"Processing WebM file: {file_path}")
-                audio = AudioSegment.from_file(file_path, format="webm")
-                output_path = file_path.replace(".webm", ".mp3")
-                audio.export(output_path, format="mp3", bitrate="192k")
-                print(f"Converted to: {output_path}")
-                file_path = output_path
+    def release(self, context: ProcessingContext):
+        """Drop the job's working audio, the original input and the artifacts stay"""
+        self.canonical.release(context.canonical_path, context.audio)
+        context.audio = None
+        context.transcript = None
 
-            # Analyze audio
-            csv_path, analysis_data, language = self._analyze_audio(file_path)
-            
-            # Get processor for language
-            if language not in self.processors:
-                raise HTTPException(status_code=400, detail=f"Unsupported language: {language}")
-            
-            processor = self.processors[language]
-            
-            # Process text
-            final_text, json_path = processor.process_text(csv_path, analysis_data)
-            
-            # Convert to audio
-            audio_path = await processor.tts.convert(final_text)
-            
-            if not os.path.exists(audio_path):
-                raise HTTPException(status_code=500, detail="Audio generation failed")
-            
-            # Save to database
-            insert_into_db(
-                source_type=source_type,
-                source_location=file_path,
-                duration=analysis_data["audio_duration"],
-                diarization_csv_path=csv_path,
-                summary_json_path=json_path,
-                audio_summary_path=audio_path
-            )
-            
-            return FileResponse(audio_path, media_type="audio/mpeg")
+    async def process(self, file_path: str, source_type: SourceType, progress: Optional[JobProgress] = None,
+                      content_hash: Optional[str] = None, csv_path: Optional[str] = None,
+                      options: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Process audio file and return the paths of the generated artifacts.
+        This is the body of a processing job, stage events are reported to progress.
+        A content_hash computed during upload spares the cache lookup a second read of the file,
+        a csv_path from a live session skips diarization and transcription,
+        options carries the client hints (speaker counts)."""
+        context = ProcessingContext(file_path, source_type, progress, content_hash=content_hash, csv_path=csv_path,
+                                    options=options)
+        try:
+            self.lookup_cache(context)
+            if context.cached:
+                return context.result()
+            self.decode(context)
+            self.find_speakers(context)
+            self.transcribe(context)
+            self.analyze(context)
+            self.summarize(context)
+            await self.synthesize(context)
+            self.save(context)
+            self.store_cache(context)
+            return context.result()
             
         except HTTPException:
             raise
         except Exception as e:
             print(f"Processing error: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+        finally:
+            self.release(context)
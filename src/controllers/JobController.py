@@ -0,0 +1,270 @@
+from src.services.BaseService import BaseService
+from src.db import SourceType
+from src.db.jobs import create_job, mark_job_running, mark_job_finished, get_job, get_unfinished_jobs
+from src.services.progress.JobProgress import progress_hub
+from .ProcessingContext import ProcessingContext
+from .StageScheduler import Stage, StageScheduler
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from fastapi import HTTPException
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import threading
+import asyncio
+import queue
+import os
+
+base_service = BaseService()
+
+class JobController:
+    """
+    Runs meeting processing as background jobs off the event loop.
+    Job state lives in the database so queued work survives a restart.
+
+    In "pipelined" mode jobs flow through per-stage pools (see StageScheduler),
+    in "serial" mode each worker runs AudioController.process end to end.
+    """
+    def __init__(self,
+                 audio_controller_factory: Callable[[], Any],
+                 download_controller_factory: Callable[[], Any],
+                 max_workers: int = 2,
+                 max_pending: int = 100,
+                 scheduler: str = "pipelined",
+                 diarization_devices: Optional[List[str]] = None,
+                 asr_concurrency: int = 2,
+                 llm_concurrency: int = 1,
+                 tts_concurrency: int = 1):
+        self.logger = base_service.logger
+        self.audio_controller_factory = audio_controller_factory
+        self.download_controller_factory = download_controller_factory
+        self.max_pending = max_pending
+        self.mode = scheduler
+        self._futures: Dict[str, Future] = {}
+        # Slots taken by submissions whose job row is still being written
+        self._reserved = 0
+        self._lock = threading.Lock()
+
+        # Diarization runs once per device, for pipelined jobs and live sessions alike
+        self.diarization_devices: List[Optional[str]] = list(diarization_devices or [None])
+        self._devices: "queue.Queue[Optional[str]]" = queue.Queue()
+        for device in self.diarization_devices:
+            self._devices.put(device)
+
+        if self.mode == "pipelined":
+            self.executor = None
+            self.scheduler = self._build_scheduler(
+                max_workers, diarization_devices or [None], asr_concurrency, llm_concurrency, tts_concurrency
+            )
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+            self.scheduler = None
+
+    def submit(self, source_location: str, source_type: SourceType, content_hash: Optional[str] = None,
+               csv_path: Optional[str] = None, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Persist a new job and queue it.
+        
+        :param source_location: Local file path, or the video URL for SourceType.URL.
+        :param source_type: Origin of the input.
+        :param content_hash: SHA-256 of the input when already known from ingestion.
+        :param csv_path: Diarized transcript produced ahead of time (live sessions), skips diarization and ASR.
+        :param options: Client hints (see JobOptions), stored with the job so a resumed job keeps them.
+            content_hash and csv_path are stored as well.
+        :return: The job id.
+        """
+        # The slot is reserved under the lock, concurrent submissions can not overshoot max_pending
+        with self._lock:
+            pending = sum(1 for future in self._futures.values() if not future.done()) + self._reserved
+            if pending >= self.max_pending:
+                raise HTTPException(status_code=503, detail="Too many jobs in the queue, try again later")
+            self._reserved += 1
+        try:
+            job = create_job(source_type=source_type, source_location=source_location, options=options,
+                             content_hash=content_hash, csv_path=csv_path)
+            self._schedule(job["job_id"], source_location, source_type, content_hash=content_hash, csv_path=csv_path,
+                           options=options)
+        finally:
+            with self._lock:
+                self._reserved -= 1
+        self.logger.info(f"Queued job {job['job_id']} for {source_location}")
+        return job["job_id"]
+
+    async def wait(self, job_id: str) -> Dict[str, str]:
+        """Wait for a job of this process without blocking the event loop."""
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is None:
+            raise HTTPException(status_code=404, detail="Job is not running in this process")
+        return await asyncio.wrap_future(future)
+
+    def get(self, job_id: str):
+        job = get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+
+    def resume_pending(self) -> int:
+        """Re-queue jobs left queued or interrupted by a previous shutdown."""
+        resumed = 0
+        for job in get_unfinished_jobs():
+            if job.source_type != SourceType.URL and not os.path.exists(job.source_location):
+                mark_job_finished(job.id, error="Input file missing after restart")
+                continue
+            # A live job's transcript and an upload's hash were stored at submission, reuse them
+            csv_path = job.diarization_csv_path
+            if csv_path and not os.path.exists(csv_path):
+                csv_path = None
+            self._schedule(job.id, job.source_location, job.source_type, content_hash=job.content_hash,
+                           csv_path=csv_path, options=job.options)
+            resumed += 1
+        self.logger.info(f"Resumed {resumed} unfinished jobs")
+        return resumed
+
+    @contextmanager
+    def diarization_device(self) -> Iterator[Optional[str]]:
+        """Hold one diarization device (None: the default one) until the block exits."""
+        device = self._devices.get()
+        try:
+            yield device
+        finally:
+            self._devices.put(device)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.scheduler.stats() if self.scheduler else {}
+
+    def shutdown(self):
+        if self.scheduler:
+            self.scheduler.shutdown()
+        else:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule(self, job_id: str, source_location: str, source_type: SourceType,
+                  content_hash: Optional[str] = None, csv_path: Optional[str] = None,
+                  options: Optional[Dict[str, Any]] = None):
+        if self.scheduler:
+            future = self._submit_pipelined(job_id, source_location, source_type, content_hash, csv_path, options)
+        else:
+            # Created up front so /events can follow the job while it waits for a worker
+            progress = progress_hub.create(job_id)
+            future = self.executor.submit(self._run, job_id, progress, source_location, source_type, content_hash, csv_path,
+                                          options)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+
+    def _forget(self, job_id: str):
+        # Keep finished futures around briefly for callers still awaiting them
+        with self._lock:
+            done = [k for k, f in self._futures.items() if f.done()]
+            for key in done[:-self.max_pending]:
+                self._futures.pop(key, None)
+
+    def _run(self, job_id: str, progress, source_location: str, source_type: SourceType,
+             content_hash: Optional[str] = None, csv_path: Optional[str] = None,
+             options: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        mark_job_running(job_id)
+        try:
+            file_path = self._resolve_input(source_location, source_type, progress)
+            audio_controller = self.audio_controller_factory()
+            result = asyncio.run(audio_controller.process(
+                file_path, source_type, progress=progress, content_hash=content_hash, csv_path=csv_path,
+                options=options
+            ))
+            self._finish(job_id, progress, result=result)
+            return result
+        except Exception as e:
+            raise self._fail(job_id, progress, e)
+
+    def _submit_pipelined(self, job_id: str, source_location: str, source_type: SourceType,
+                          content_hash: Optional[str] = None, csv_path: Optional[str] = None,
+                          options: Optional[Dict[str, Any]] = None) -> Future:
+        progress = progress_hub.create(job_id)
+        context = ProcessingContext(source_location, source_type, progress, content_hash=content_hash, csv_path=csv_path,
+                                    options=options)
+        stages_done = self.scheduler.submit(context, on_start=lambda _: mark_job_running(job_id))
+
+        result: Future = Future()
+        result.set_running_or_notify_cancel()
+
+        def finish(finished: Future):
+            try:
+                self.audio_controller_factory().release(context)
+            except Exception as e:
+                self.logger.warning(f"Could not release working audio of job {job_id}: {e}")
+            try:
+                if finished.cancelled():
+                    raise RuntimeError("Job cancelled during shutdown")
+                error = finished.exception()
+                if error is not None:
+                    raise error
+                context_result = finished.result().result()
+                self._finish(job_id, progress, result=context_result)
+                result.set_result(context_result)
+            except Exception as e:
+                result.set_exception(self._fail(job_id, progress, e))
+
+        stages_done.add_done_callback(finish)
+        return result
+
+    def _build_scheduler(self, workers: int, devices: List[Optional[str]], asr: int, llm: int, tts: int) -> StageScheduler:
+        audio = self.audio_controller_factory
+
+        # ASR workers each own a whisper replica
+        replica_pool: "queue.Queue[int]" = queue.Queue()
+        for replica in range(max(1, asr)):
+            replica_pool.put(replica)
+
+        def ingest(context: ProcessingContext):
+            context.file_path = self._resolve_input(context.file_path, context.source_type, context.progress)
+            audio().lookup_cache(context)
+            if not context.cached:
+                audio().decode(context)
+
+        def diarize(context: ProcessingContext):
+            with self.diarization_device() as device:
+                audio().find_speakers(context, device=device)
+
+        def transcribe(context: ProcessingContext):
+            replica = replica_pool.get()
+            try:
+                audio().transcribe(context, replica=replica)
+            finally:
+                replica_pool.put(replica)
+
+        def synthesize(context: ProcessingContext):
+            asyncio.run(audio().synthesize(context))
+            audio().save(context)
+            audio().store_cache(context)
+
+        return StageScheduler([
+            Stage("ingest", ingest, workers),
+            Stage("diarization", diarize, len(devices)),
+            Stage("asr", transcribe, asr),
+            Stage("analysis", lambda context: audio().analyze(context), workers),
+            Stage("llm", lambda context: audio().summarize(context), llm),
+            Stage("tts", synthesize, tts),
+        ], is_complete=lambda context: context.cached)
+
+    def _resolve_input(self, source_location: str, source_type: SourceType, progress) -> str:
+        if source_type != SourceType.URL:
+            return source_location
+        progress.start("download")
+        file_path = self.download_controller_factory().get_file_path(video_url=source_location)
+        progress.complete("download")
+        return file_path
+
+    def _finish(self, job_id: str, progress, result: Dict[str, str]):
+        mark_job_finished(job_id, result=result)
+        progress.finish()
+        self.logger.info(f"Job {job_id} finished")
+
+    def _fail(self, job_id: str, progress, error: Exception) -> HTTPException:
+        if isinstance(error, HTTPException):
+            detail = str(error.detail)
+            self.logger.error(f"Job {job_id} failed: {detail}")
+        else:
+            detail = f"Processing failed: {str(error)}"
+            self.logger.exception(f"Job {job_id} failed: {error}")
+            error = HTTPException(status_code=500, detail=detail)
+        mark_job_finished(job_id, error=detail)
+        progress.finish(error=detail)
+        return error
@@ -0,0 +1,169 @@
+from src.services.BaseService import BaseService
+from src.db import SourceType
+from concurrent.futures import ThreadPoolExecutor, Future
+from fastapi import HTTPException
+from typing import Any, Callable, Dict, Optional
+import threading
+import queue
+import time
+import uuid
+
+base_service = BaseService()
+
+class LiveController:
+    """
+    Sessions of meetings processed while they are still being recorded.
+
+    Windows are processed on a small worker pool, each worker owning its own
+    whisper replica and diarizing on a device leased from the JobController,
+    so live windows and batch jobs never share a device. Finishing a session hands the recording and the running
+    transcript to the JobController, which then only has the analysis,
+    summary and speech left to do.
+    """
+    def __init__(self,
+                 audio_controller_factory: Callable[[], Any],
+                 job_controller_factory: Callable[[], Any],
+                 workers: int = 1,
+                 first_replica: int = 0,
+                 window_seconds: float = 30.0,
+                 context_seconds: float = 5.0,
+                 link_threshold: float = 0.5,
+                 idle_timeout_seconds: float = 1800.0):
+        self.logger = base_service.logger
+        self.audio_controller_factory = audio_controller_factory
+        self.job_controller_factory = job_controller_factory
+        self.window_seconds = window_seconds
+        self.context_seconds = context_seconds
+        self.link_threshold = link_threshold
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="live")
+        self.sessions: Dict[str, Any] = {}
+        self._scheduled = set()
+        self._lock = threading.Lock()
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._replicas: "queue.Queue[int]" = queue.Queue()
+        for replica in range(first_replica, first_replica + max(1, workers)):
+            self._replicas.put(replica)
+
+    def create(self, content_type: str = "audio/webm", platform: Optional[str] = None, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Open a live session for a recording of the given MIME type."""
+        from src.services.live.LiveSession import LiveSession
+
+        if not content_type.startswith("audio/"):
+            raise HTTPException(status_code=400, detail="The file is not audio file, Refused")
+        extension = "m4a" if "mp4" in content_type else "webm"
+        session_id = uuid.uuid4().hex
+        session = LiveSession(
+            session_id,
+            diarization=self.audio_controller_factory().diarization,
+            extension=extension,
+            window_seconds=self.window_seconds,
+            context_seconds=self.context_seconds,
+            link_threshold=self.link_threshold,
+            # Shares the job scheduler's one-per-device diarization limit
+            diarization_device=self.job_controller_factory().diarization_device,
+            metadata={"platform": platform, "timestamp": timestamp}
+        )
+        with self._lock:
+            self.sessions[session_id] = session
+            self._session_locks[session_id] = threading.Lock()
+        self.logger.info(f"Opened live session {session_id} ({content_type}, {platform})")
+        return {"session_id": session_id, "window_seconds": self.window_seconds}
+
+    def append(self, session_id: str, seq: int, data: bytes) -> Dict[str, Any]:
+        """Add the next recorded chunk and process any window it completes."""
+        session = self._get(session_id)
+        accepted = session.append(seq, data)
+        if accepted:
+            self._schedule(session_id)
+        return {
+            "session_id": session_id,
+            "accepted": accepted,
+            "next_seq": session.next_seq,
+            "processed_seconds": round(session.processed_seconds, 2),
+        }
+
+    def transcript(self, session_id: str) -> Dict[str, Any]:
+        return self._get(session_id).transcript()
+
+    def finish(self, session_id: str) -> Future:
+        """
+        Stop accepting chunks, process the remaining audio and queue the job.
+
+        :return: Future resolving to the job id.
+        """
+        session = self._get(session_id)
+        if session.next_seq == 0:
+            raise HTTPException(status_code=400, detail="No audio received in this live session")
+        session.close()
+        return self.executor.submit(self._finish, session_id)
+
+    def expire_idle(self) -> int:
+        """Drop sessions that stopped sending chunks without finishing."""
+        now = time.time()
+        with self._lock:
+            idle = [
+                session_id for session_id, session in self.sessions.items()
+                if not session.closed and now - session.last_activity > self.idle_timeout_seconds
+            ]
+            sessions = [self.sessions.pop(session_id) for session_id in idle]
+        for session in sessions:
+            session.discard()
+        if idle:
+            self.logger.info(f"Dropped {len(idle)} idle live sessions")
+        return len(idle)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get(self, session_id: str):
+        with self._lock:
+            session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Live session not found")
+        return session
+
+    def _schedule(self, session_id: str):
+        # One pending advance per session is enough, it consumes everything decoded so far
+        with self._lock:
+            if session_id in self._scheduled:
+                return
+            self._scheduled.add(session_id)
+        self.executor.submit(self._advance, session_id)
+
+    def _advance(self, session_id: str, final: bool = False):
+        with self._lock:
+            self._scheduled.discard(session_id)
+            session = self.sessions.get(session_id)
+            session_lock = self._session_locks.get(session_id)
+        if session is None or session.error:
+            return
+        replica = self._replicas.get()
+        try:
+            with session_lock:
+                session.replica = replica
+                session.advance(final=final)
+        except Exception as e:
+            session.error = str(e)
+            self.logger.exception(f"Live session {session_id} failed: {e}")
+        finally:
+            self._replicas.put(replica)
+
+    def _finish(self, session_id: str) -> str:
+        self._advance(session_id, final=True)
+        session = self._get(session_id)
+        jobs = self.job_controller_factory()
+        if session.error:
+            # Fall back to processing the whole recording from scratch
+            session.decoder.close(timeout=5)
+            job_id = jobs.submit(session.recording_path, SourceType.RECORDED)
+        else:
+            job_id = jobs.submit(
+                session.recording_path, SourceType.RECORDED, csv_path=session.save_csv(),
+                options={"language": session.language} if session.language else None
+            )
+        with self._lock:
+            self.sessions.pop(session_id, None)
+            self._session_locks.pop(session_id, None)
+        self.logger.info(f"Live session {session_id} finished as job {job_id}")
+        return job_id
@@ -0,0 +1,47 @@
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.services.audio.AudioProbe import AudioMetadata
+from src.services.transcript.Transcript import Transcript
+from src.services.progress.JobProgress import JobProgress
+from src.db import SourceType
+from typing import Dict, Any, Optional
+
+SPEAKER_HINTS = ("num_speakers", "min_speakers", "max_speakers")
+
+class ProcessingContext:
+    """State of one job as it moves through the processing stages"""
+    def __init__(self, file_path: str, source_type: SourceType, progress: Optional[JobProgress] = None,
+                 content_hash: Optional[str] = None, csv_path: Optional[str] = None,
+                 options: Optional[Dict[str, Any]] = None):
+        self.file_path = file_path
+        self.source_type = source_type
+        self.progress = progress or JobProgress()
+        # Client hints, see JobOptions
+        self.options: Dict[str, Any] = options or {}
+        self.metadata: Optional[AudioMetadata] = None
+        # 16 kHz mono working copy of file_path, the original is kept for archival
+        self.canonical_path: Optional[str] = None
+        self.audio: Optional[DecodedAudio] = None
+        self.diarization = None
+        # Handed in memory from transcription to analysis and summarization
+        self.transcript: Optional[Transcript] = None
+        # Optional CSV export, preset when the transcript already exists (live sessions)
+        self.csv_path = csv_path
+        self.analysis_data: Dict[str, Any] = {}
+        self.language: Optional[str] = None
+        self.final_text: Optional[str] = None
+        self.json_path: Optional[str] = None
+        self.audio_path: Optional[str] = None
+        self.content_hash = content_hash
+        self.cache_key: Optional[str] = None
+        self.cached = False
+
+    @property
+    def speaker_hints(self) -> Dict[str, int]:
+        return {key: self.options[key] for key in SPEAKER_HINTS if self.options.get(key)}
+
+    def result(self) -> Dict[str, str]:
+        return {
+            "diarization_csv_path": self.csv_path,
+            "summary_json_path": self.json_path,
+            "audio_summary_path": self.audio_path
+        }
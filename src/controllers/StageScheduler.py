@@ -0,0 +1,101 @@
+from src.services.BaseService import BaseService
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, List, Optional
+import threading
+import time
+
+base_service = BaseService()
+
+class Stage:
+    """One pipeline stage with its own worker pool and concurrency limit"""
+    def __init__(self, name: str, fn: Callable[[Any], None], concurrency: int):
+        self.name = name
+        self.fn = fn
+        self.concurrency = max(1, concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"stage-{name}")
+        self.in_flight = 0
+        self.completed = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "busy_seconds": round(self.busy_seconds, 2),
+            }
+
+
+class StageScheduler:
+    """
+    Moves jobs through a fixed sequence of stages, each with its own pool.
+
+    While one job waits on the LLM another can already be diarized, so GPU,
+    CPU and network bound stages overlap across jobs instead of running
+    strictly one job after the other.
+    """
+    def __init__(self, stages: List[Stage], is_complete: Optional[Callable[[Any], bool]] = None):
+        """
+        :param stages: Stages in execution order.
+        :param is_complete: Lets a job skip its remaining stages, e.g. on a result cache hit.
+        """
+        self.logger = base_service.logger
+        self.stages = stages
+        self.is_complete = is_complete
+
+    def submit(self, context: Any, on_start: Optional[Callable[[Any], None]] = None) -> Future:
+        """
+        Queue a job at the first stage.
+        
+        :param context: Job state passed to every stage function.
+        :param on_start: Called in the first stage's worker before it runs.
+        :return: Future resolved with the context after the last stage, or with the first stage error.
+        """
+        done: Future = Future()
+        done.set_running_or_notify_cancel()
+        self._run_stage(0, context, done, on_start)
+        return done
+
+    def stats(self) -> dict:
+        return {stage.name: stage.stats() for stage in self.stages}
+
+    def shutdown(self):
+        for stage in self.stages:
+            stage.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_stage(self, index: int, context: Any, done: Future, on_start: Optional[Callable[[Any], None]] = None):
+        if index == len(self.stages) or (index > 0 and self.is_complete and self.is_complete(context)):
+            done.set_result(context)
+            return
+        stage = self.stages[index]
+
+        def work():
+            if on_start:
+                on_start(context)
+            with stage._lock:
+                stage.in_flight += 1
+            started = time.perf_counter()
+            try:
+                stage.fn(context)
+            finally:
+                with stage._lock:
+                    stage.in_flight -= 1
+                    stage.completed += 1
+                    stage.busy_seconds += time.perf_counter() - started
+
+        future = stage.executor.submit(work)
+
+        def advance(finished: Future):
+            if finished.cancelled():
+                done.set_exception(RuntimeError(f"Stage {stage.name} was cancelled"))
+                return
+            error = finished.exception()
+            if error is not None:
+                self.logger.error(f"Stage {stage.name} failed: {error}")
+                done.set_exception(error)
+            else:
+                self._run_stage(index + 1, context, done)
+
+        future.add_done_callback(advance)
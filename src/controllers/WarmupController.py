@@ -0,0 +1,141 @@
+from src.services.BaseService import BaseService
+from contextlib import ExitStack
+from typing import Any, Callable, Dict
+import threading
+import tempfile
+import asyncio
+import time
+import os
+
+base_service = BaseService()
+
+class WarmupController:
+    """
+    Loads the inference backends and pushes a tiny synthetic clip through each
+    of them so the first real request does not pay for cold models and connections.
+    Every configured copy is warmed: the diarization pipeline of each device,
+    each whisper replica of the job scheduler and live sessions, and the
+    transcription process pool in parallel mode.
+    """
+    PENDING = "pending"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    def __init__(self, audio_controller_factory: Callable[[], Any], job_controller_factory: Callable[[], Any],
+                 enabled: bool = True):
+        self.logger = base_service.logger
+        self.audio_controller_factory = audio_controller_factory
+        self.job_controller_factory = job_controller_factory
+        self.settings = base_service.app_settings
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        initial = self.PENDING if enabled else self.SKIPPED
+        self.components: Dict[str, Dict[str, Any]] = {
+            name: {"state": initial, "latency_seconds": None, "error": None}
+            for name in ("diarization", "speaker_embedding", "asr", "asr_pool", "llm", "tts")
+        }
+        if self.settings.TRANSCRIPTION_MODE != "parallel":
+            self.components["asr_pool"]["state"] = self.SKIPPED
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return all(c["state"] in (self.READY, self.SKIPPED) for c in self.components.values())
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: dict(component) for name, component in self.components.items()}
+
+    def run(self):
+        """
+        Warm every component in order. Meant to run in a worker thread started from the app lifespan.
+        """
+        from src.services.audio.DecodedAudio import DecodedAudio
+
+        try:
+            audio_controller = self.audio_controller_factory()
+        except Exception as e:
+            self.logger.exception(f"Warm-up could not build the audio controller: {e}")
+            for name in self.components:
+                self._set(name, self.FAILED, error=str(e))
+            return
+
+        clip = DecodedAudio(self._synthetic_clip(), source_path="warmup.wav")
+        self._warm("diarization", lambda: self._warm_diarization(audio_controller, clip))
+        self._warm("speaker_embedding", lambda: self._warm_speaker_embedding(audio_controller, clip))
+        self._warm("asr", lambda: self._warm_asr(clip))
+        if self.settings.TRANSCRIPTION_MODE == "parallel":
+            self._warm("asr_pool", self._warm_asr_pool)
+        self._warm("llm", lambda: self._warm_llm(audio_controller))
+        self._warm("tts", lambda: self._warm_tts(audio_controller))
+        self.logger.info(f"Warm-up finished: {self.status()}")
+
+    def _warm(self, name: str, fn: Callable[[], Any]):
+        self._set(name, self.WARMING)
+        started = time.perf_counter()
+        try:
+            fn()
+            self._set(name, self.READY, latency=time.perf_counter() - started)
+        except Exception as e:
+            self.logger.exception(f"Warm-up of {name} failed: {e}")
+            self._set(name, self.FAILED, latency=time.perf_counter() - started, error=str(e))
+
+    def _set(self, name: str, state: str, latency: float = None, error: str = None):
+        with self._lock:
+            self.components[name] = {
+                "state": state,
+                "latency_seconds": round(latency, 3) if latency is not None else None,
+                "error": error,
+            }
+
+    def _warm_diarization(self, audio_controller, clip):
+        jobs = self.job_controller_factory()
+        # Holds every device lease, jobs resumed meanwhile wait instead of sharing a device with the warm-up
+        with ExitStack() as leases:
+            devices = [leases.enter_context(jobs.diarization_device()) for _ in jobs.diarization_devices]
+            for device in devices:
+                audio_controller.diarization.find_speakers(clip, device=device)
+
+    def _warm_speaker_embedding(self, audio_controller, clip):
+        # Used by windowed diarization and live sessions to link speakers
+        import torch
+        from src.services.models.ModelRegistry import model_registry
+        inference = model_registry.get_speaker_embedding(
+            self.settings.SPEAKER_EMBEDDING_MODEL, device=str(audio_controller.diarization.device)
+        )
+        inference({"waveform": torch.from_numpy(clip.samples).unsqueeze(0), "sample_rate": clip.sample_rate})
+
+    def _warm_asr(self, clip):
+        from src.services.transcription.AudioTranscription import AudioTranscription
+        # Replicas of the scheduler's ASR workers, then the live workers' (see get_live_controller)
+        for replica in range(max(1, self.settings.ASR_CONCURRENCY) + max(1, self.settings.LIVE_WORKERS)):
+            transcriber = AudioTranscription(clip, replica=replica)
+            transcriber.transcribe_segment(clip.samples)
+
+    def _warm_asr_pool(self):
+        from src.services.transcription.ParallelTranscription import ParallelTranscription
+        ParallelTranscription(
+            workers=self.settings.ASR_PROCESS_WORKERS, threads_per_worker=self.settings.ASR_THREADS_PER_WORKER
+        ).warm()
+
+    def _warm_llm(self, audio_controller):
+        for processor in audio_controller.processors.values():
+            processor.summary_service.llm.invoke("Reply with OK.")
+
+    def _warm_tts(self, audio_controller):
+        for processor in audio_controller.processors.values():
+            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+                output_path = f.name
+            try:
+                asyncio.run(processor.tts.convert("Ready.", output_path=output_path))
+            finally:
+                os.remove(output_path)
+
+    def _synthetic_clip(self, seconds: float = 2.0, sample_rate: int = 16000):
+        import numpy as np
+        # Two alternating tones over light noise, enough to exercise every model path
+        t = np.arange(int(seconds * sample_rate)) / sample_rate
+        tone = np.where(t < seconds / 2, np.sin(2 * np.pi * 180 * t), np.sin(2 * np.pi * 260 * t))
+        noise = np.random.default_rng(0).normal(0, 0.01, t.shape)
+        return (0.2 * tone + noise).astype(np.float32)
@@ -1,3 +1,22 @@
-from .AudioController import AudioController
-from .file_transfer import DownloadController, UploadController, RecordedController
-from .AudioController import AudioController
\ No newline at end of file
+# Resolved lazily, building the import graph of AudioController loads the whole ML stack
+from importlib import import_module
+
+_EXPORTS = {
+    "AudioController": ".AudioController",
+    "DownloadController": ".file_transfer",
+    "UploadController": ".file_transfer",
+    "RecordedController": ".file_transfer",
+    "WarmupController": ".WarmupController",
+    "JobController": ".JobController",
+    "LiveController": ".LiveController",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,13 @@
 from fastapi.responses import JSONResponse
-from fastapi import File, UploadFile, Form
+from fastapi import File, UploadFile, Form, HTTPException
 from .AbstractHandler import AbstractHandler
 #from services import BaseService
 from src.services.BaseService import BaseService
-import shutil
+from src.services.file_transfer.StreamingIngest import StreamingIngest
+from src.services.audio.AudioProbe import audio_probe
+from src.helpers import unique_upload_name
+import asyncio
+from pathlib import Path
 import os
 
 base_service = BaseService()
@@ -12,8 +16,9 @@ class RecordedController(AbstractHandler):
     def __init__(self):
         self.logger = base_service.logger
         self.output_dir = base_service.recorded_meetings_path
+        self.ingest = StreamingIngest()
         
-    def get_file_path(self, audio_file: UploadFile = File(...), platform: str = Form(...), timestamp: str = Form(...)):
+    async def get_file_path(self, audio_file: UploadFile = File(...), platform: str = Form(...), timestamp: str = Form(...)):
         """
         Download the audio file from the given URL.
         
@@ -33,11 +38,15 @@ class RecordedController(AbstractHandler):
                         "error":"The file is not audio file, Refused"
                     }
                 ) 
-            full_file_path = os.path.join(self.output_dir, recorded_meeting.filename)
-            with open(full_file_path, "wb") as buffer:
-                shutil.copyfileobj(recorded_meeting.file, buffer)
+            full_file_path = os.path.join(self.output_dir, unique_upload_name(recorded_meeting.filename))
+            stored = await self.ingest.handle(recorded_meeting, Path(full_file_path))
+            try:
+                await asyncio.to_thread(audio_probe.validate, full_file_path, stored["content_hash"])
+            except HTTPException as e:
+                os.remove(full_file_path)
+                return JSONResponse(status_code=400, content={"error": e.detail})
             self.logger.info(f"Received recorded meeting and its full path is {full_file_path}")
-            return recorded_meeting ,full_file_path, meeting_platform, meeting_timestamp
+            return recorded_meeting ,full_file_path, meeting_platform, meeting_timestamp, stored["content_hash"]
         except Exception as e:
             self.logger.exception(f"Error While saving recorded meeting locally: {e}")
             raise
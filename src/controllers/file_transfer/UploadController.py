@@ -13,16 +13,29 @@ class UploadController(AbstractHandler):
         base_service = BaseService()
         self.logger = base_service.logger
         
-    def get_file_path(self, audio_file: UploadFile) -> str:
+    async def get_file_path(self, audio_file: UploadFile) -> str:
         """
         Returns the file path for the uploaded file.
         """
+        result = await self.ingest(audio_file)
+        return result["file_path"]
+
+    async def ingest(self, audio_file: UploadFile) -> dict:
+        """
+        Stores the uploaded file and returns its path, content hash and size.
+        """
         try:
-            result = self.upload_service.handle(file=audio_file)
+            result = await self.upload_service.handle(file=audio_file)
             if result["status"] != "success" or "file_path" not in result:
                 self.logger.error("Failed to upload file.")
                 raise HTTPException(status_code=400, detail="Failed to upload file")
-            return result["file_path"]
+            return result
+        except HTTPException as e:
+            # Keep the reason a file was rejected (type, unreadable audio)
+            if e.status_code == 400:
+                raise
+            self.logger.exception(f"Error during file upload: {str(e)}")
+            raise HTTPException(status_code=400, detail="Internal server error during file upload")
         except Exception as e:
             self.logger.exception(f"Error during file upload: {str(e)}")
             raise HTTPException(status_code=400, detail="Internal server error during file upload")
@@ -1,13 +1,14 @@
 from abc import ABC, abstractmethod
+from src.services.transcript.Transcript import Transcript
 from typing import Any, Dict, Tuple
 
 class AbstractLanguage(ABC):
     @abstractmethod
-    def process_text(self,csv_path: str, analysis_data: Dict[str, Any]) -> Tuple[str, str]:
+    def process_text(self, transcript: Transcript, analysis_data: Dict[str, Any]) -> Tuple[str, str]:
         """
-        Process the text from the CSV file and return the summary and TTS file paths.
+        Process the text of the transcript and return the summary and TTS file paths.
         
-        :param csv_path: Path to the CSV file containing the text data.
+        :param transcript: Transcript of the job, passed in memory.
         :param analysis_data: Dictionary containing analysis data such as most talked speakers, total duration, etc.
         :return: Tuple containing the summary json file and formatted text.
         """
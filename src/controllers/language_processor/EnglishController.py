@@ -4,7 +4,8 @@ from src.services.BaseService import BaseService
 from src.services.summarization.EnglishSummary import EnglishSummary
 from src.services.formatters.EnglishFormatter import EnglishFormatter
 from src.services.text_to_speech.EnglishConverter import EnglishConverter
-from src.helpers import load_csv, load_json
+from src.services.transcript.Transcript import Transcript
+from src.helpers import load_json
 from typing import Tuple, Dict, Any
 from fastapi import HTTPException
 import os
@@ -18,11 +19,11 @@ class EnglishController(AbstractLanguage):
         base_service = BaseService()
         self.logger = base_service.logger
         
-    def process_text(self, csv_path: str, analysis_data: Dict[str, Any]) -> Tuple[str, str]:
+    def process_text(self, transcript: Transcript, analysis_data: Dict[str, Any]) -> Tuple[str, str]:
         """
-        Process the text from the CSV file and return the summary and TTS file paths.
+        Process the text of the transcript and return the summary and TTS file paths.
         
-        :param csv_path: Path to the CSV file containing the text data.
+        :param transcript: Transcript of the job, passed in memory.
         :param analysis_data: Dictionary containing analysis data such as most talked speakers, total duration, etc.
         :return: Tuple containing the summary json file and formatted text.
         """
@@ -39,7 +40,7 @@ class EnglishController(AbstractLanguage):
         
         try:    
             # Create Summary
-            _, text = load_csv(csv_path=csv_path)
+            text = transcript.texts()
             
             json_summary_path = self.summary_service.create_summary(text=text)
             if not os.path.exists(json_summary_path):
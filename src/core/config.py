@@ -25,6 +25,89 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     DB_DRIVER: str
     
+    # ----------------------------------------- Transcription ----------------------------------
+    # "per_turn": one whisper call per diarization turn
+    # "whole_file": one whisper call with word timestamps, words joined onto turns
+    # "batched": turns decoded together in padded mel batches
+    # "parallel": turns sharded across CPU worker processes, each with its own model
+    TRANSCRIPTION_MODE: str = "per_turn"
+    WHISPER_BATCH_SIZE: int = 16
+    # per_turn mode: same-speaker turns closer than the gap share one ASR call,
+    # shorter turns join a neighbour, words are split back onto the original turns.
+    # Off by default so per_turn keeps one whisper call per turn
+    TURN_CONSOLIDATION_ENABLED: bool = False
+    TURN_MERGE_GAP_SECONDS: float = 0.5
+    TURN_MIN_DURATION_SECONDS: float = 0.3
+    # Language detected once per job from this much speech and passed to every ASR call, 0: detect per call
+    LANGUAGE_DETECTION_SECONDS: float = 30.0
+    # Write the diarized transcript to CSV, later stages use the in-memory transcript either way
+    TRANSCRIPT_CSV_EXPORT: bool = True
+    # Worker processes of the parallel mode, 0: one per ASR_THREADS_PER_WORKER cores
+    ASR_PROCESS_WORKERS: int = 0
+    ASR_THREADS_PER_WORKER: int = 1
+    
+    # ----------------------------------------- Voice Activity ---------------------------------
+    # Cut silences longer than VAD_MIN_SILENCE_SECONDS before diarization and ASR
+    VAD_ENABLED: bool = False
+    VAD_THRESHOLD_DB: float = 12.0
+    VAD_MIN_SILENCE_SECONDS: float = 2.0
+    
+    # ----------------------------------------- Long Audio -------------------------------------
+    # Longer recordings are diarized in overlapping windows with speakers linked across them
+    DIARIZATION_LONG_AUDIO_MINUTES: float = 60.0
+    DIARIZATION_WINDOW_MINUTES: float = 10.0
+    DIARIZATION_WINDOW_OVERLAP_SECONDS: float = 30.0
+    
+    # ----------------------------------------- Models -----------------------------------------
+    WHISPER_MODEL: str = "base"
+    # "whisper": openai-whisper (PyTorch), "faster_whisper": CTranslate2, int8 by default for CPU nodes
+    ASR_ENGINE: str = "whisper"
+    ASR_COMPUTE_TYPE: str = "int8"
+    # CPU threads per faster-whisper model, 0 lets CTranslate2 decide
+    ASR_CPU_THREADS: int = 0
+    DIARIZATION_MODEL: str = "pyannote/speaker-diarization"
+    MAX_LOADED_WHISPER_MODELS: int = 2
+    SPEAKER_EMBEDDING_MODEL: str = "pyannote/embedding"
+    
+    # ----------------------------------------- Startup ----------------------------------------
+    WARMUP_ON_STARTUP: bool = False
+    
+    # ----------------------------------------- Jobs -------------------------------------------
+    JOB_WORKERS: int = 2
+    JOB_MAX_PENDING: int = 100
+    # "pipelined": per-stage pools so stages of different jobs overlap, "serial": one job per worker
+    JOB_SCHEDULER: str = "pipelined"
+    # Comma separated devices for diarization, one concurrent job each (empty: default device)
+    DIARIZATION_DEVICES: str = ""
+    ASR_CONCURRENCY: int = 2
+    # Summaries and TTS run on the language processors shared by every job, keep them one at a time
+    LLM_CONCURRENCY: int = 1
+    TTS_CONCURRENCY: int = 1
+    
+    # ----------------------------------------- Result Cache -----------------------------------
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_MB: int = 2048
+    RESULT_CACHE_MAX_AGE_HOURS: int = 720
+    
+    # ----------------------------------------- PCM Cache --------------------------------------
+    # Decoded samples of running jobs, memory-mapped by every stage and worker
+    PCM_CACHE_ENABLED: bool = True
+    PCM_CACHE_MAX_MB: int = 4096
+    
+    # ----------------------------------------- Resumable Uploads ------------------------------
+    UPLOAD_SESSION_TTL_HOURS: int = 24
+    UPLOAD_CHUNK_MAX_MB: int = 16
+    # Largest file a session accepts, the data file is preallocated at this size
+    UPLOAD_MAX_MB: int = 4096
+    
+    # ----------------------------------------- Live Sessions ----------------------------------
+    LIVE_WINDOW_SECONDS: float = 30.0
+    LIVE_CONTEXT_SECONDS: float = 5.0
+    LIVE_WORKERS: int = 1
+    LIVE_IDLE_TIMEOUT_MINUTES: int = 30
+    # Cosine similarity above which speakers of different windows are the same person
+    SPEAKER_LINK_THRESHOLD: float = 0.5
+    
     class Config:
         env_file = Path(__file__).parent.parent.parent / ".env"
         extra = "forbid"
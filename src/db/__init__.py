@@ -1,4 +1,4 @@
 from .base import Base
-from .models import MediaInput, SourceType
+from .models import MediaInput, SourceType, ProcessingJob, JobStatus
 from .insert_into_db import insert_into_db
-from .session import get_db
\ No newline at end of file
+from .session import get_db
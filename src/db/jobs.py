@@ -0,0 +1,57 @@
+from src.db.models import ProcessingJob, JobStatus, SourceType
+from src.db.session import get_db
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import uuid
+
+def create_job(source_type: SourceType, source_location: str, options: Optional[Dict[str, Any]] = None,
+               content_hash: Optional[str] = None, csv_path: Optional[str] = None) -> dict:
+    db = next(get_db())
+    job = ProcessingJob(
+        id = uuid.uuid4().hex,
+        status = JobStatus.QUEUED,
+        source_type = source_type,
+        source_location = source_location,
+        options = options or None,
+        content_hash = content_hash,
+        # A live session's transcript exists before the job runs
+        diarization_csv_path = csv_path
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job.to_dict()
+
+def update_job(job_id: str, **fields) -> None:
+    db = next(get_db())
+    job = db.get(ProcessingJob, job_id)
+    if job is None:
+        return
+    for key, value in fields.items():
+        setattr(job, key, value)
+    db.commit()
+
+def mark_job_running(job_id: str) -> None:
+    update_job(job_id, status=JobStatus.RUNNING, started_at=datetime.utcnow(), error=None)
+
+def mark_job_finished(job_id: str, result: Optional[dict] = None, error: Optional[str] = None) -> None:
+    update_job(
+        job_id,
+        status=JobStatus.FAILED if error else JobStatus.SUCCEEDED,
+        finished_at=datetime.utcnow(),
+        error=error,
+        **(result or {})
+    )
+
+def get_job(job_id: str) -> Optional[ProcessingJob]:
+    db = next(get_db())
+    return db.get(ProcessingJob, job_id)
+
+def get_unfinished_jobs() -> List[ProcessingJob]:
+    db = next(get_db())
+    return (
+        db.query(ProcessingJob)
+        .filter(ProcessingJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+        .order_by(ProcessingJob.created_at)
+        .all()
+    )
@@ -1,3 +1,4 @@
 from .media_input import MediaInput, SourceType
+from .processing_job import ProcessingJob, JobStatus
 
-__all__ = ['MediaInput']
\ No newline at end of file
+__all__ = ['MediaInput', 'ProcessingJob']
@@ -0,0 +1,46 @@
+#from ..base import Base
+from src.db.base import Base
+from src.db.models.media_input import SourceType
+from sqlalchemy import Column, Enum, DateTime, String, Text, JSON
+from datetime import datetime
+import enum
+
+class JobStatus(enum.Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+class ProcessingJob(Base):
+    __tablename__ = "processing_jobs"
+    
+    id = Column(String(32), primary_key=True)
+    status = Column(Enum(JobStatus, name="job_status"), nullable=False, default=JobStatus.QUEUED)
+    source_type = Column(Enum(SourceType, name="source_type", create_type=False), nullable=False)
+    source_location = Column(String, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    diarization_csv_path = Column(String, nullable=True)
+    summary_json_path = Column(String, nullable=True)
+    audio_summary_path = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    # Client hints given at submission (speaker counts, ...)
+    options = Column(JSON, nullable=True)
+    # SHA-256 of the input when known at submission, a resumed job skips re-hashing
+    content_hash = Column(String(64), nullable=True)
+    
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "status": self.status.value,
+            "source_type": self.source_type.value,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+            "options": self.options or {},
+        }
+    
+    def __repr__(self):
+        return f"<ProcessingJob(id={self.id}, status={self.status.value}, source_type={self.source_type.value})>"
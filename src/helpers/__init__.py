@@ -1,4 +1,5 @@
 from .load_csv import load_csv
 from .load_json import load_json
 from .format_analized_data import format_analized_data
-from .unique_file_name import unique_file_name
\ No newline at end of file
+from .unique_file_name import unique_file_name
+from .unique_upload_name import unique_upload_name
\ No newline at end of file
@@ -0,0 +1,6 @@
+from pathlib import Path
+import uuid
+
+def unique_upload_name(filename: str):
+    # Client file names collide across concurrent uploads, the uuid keeps them apart
+    return f"{uuid.uuid4().hex}_{Path(filename).name}"
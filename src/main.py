@@ -1,15 +1,58 @@
 from fastapi import FastAPI, Depends, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
 from src.api.v1 import v1_router
 from src.api.v2 import v2_router
 from src.api.security import get_api_key
+from src.api.dependencies import get_audio_controller, get_job_controller, get_upload_sessions, get_live_controller
+from src.controllers.WarmupController import WarmupController
 from src.core import Settings, get_settings
 from src.middleware.rate_limit import limiter
+from contextlib import asynccontextmanager
+import asyncio
+
+SESSION_CLEANUP_INTERVAL_SECONDS = 15 * 60
+
+
+def resume_pending_jobs():
+    try:
+        get_job_controller().resume_pending()
+    except Exception as e:
+        print(f"Could not resume pending jobs: {str(e)}")
+
+
+async def expire_stale_sessions():
+    # Partial resumable uploads past their TTL and abandoned live sessions are dropped
+    while True:
+        try:
+            await asyncio.to_thread(get_upload_sessions().cleanup_expired)
+            await asyncio.to_thread(get_live_controller().expire_idle)
+        except Exception as e:
+            print(f"Could not clean up stale sessions: {str(e)}")
+        await asyncio.sleep(SESSION_CLEANUP_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.warmup = WarmupController(get_audio_controller, get_job_controller, enabled=get_settings().WARMUP_ON_STARTUP)
+    if app.state.warmup.enabled:
+        # Runs in the background so /ready can answer while models load
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(app.state.warmup.run))
+    # Pick up jobs that were queued or running when the process stopped
+    app.state.resume_task = asyncio.create_task(asyncio.to_thread(resume_pending_jobs))
+    app.state.session_cleanup_task = asyncio.create_task(expire_stale_sessions())
+    yield
+    app.state.session_cleanup_task.cancel()
+    get_live_controller().shutdown()
+    get_job_controller().shutdown()
+    if get_settings().TRANSCRIPTION_MODE == "parallel":
+        from src.services.transcription.ParallelTranscription import ParallelTranscription
+        ParallelTranscription.shutdown()
+
 
 app = FastAPI(
     title="Done-Talking",
@@ -17,7 +60,8 @@ app = FastAPI(
     version="0.2.0",
     contact={
         "name": "Hossam Eldein Rizk",
-        "email": "hossamrizk048@gmail.com"}
+        "email": "hossamrizk048@gmail.com"},
+    lifespan=lifespan
 )
 
 app.state.limiter = limiter
@@ -27,7 +71,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  
     allow_credentials=True,
-    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*", "Content-Type"], 
 )
 
@@ -38,6 +82,16 @@ templates = Jinja2Templates(directory="src/templates")
 app.include_router(v1_router, dependencies=[Depends(get_api_key)])
 app.include_router(v2_router, dependencies=[Depends(get_api_key)])
 
+@app.get("/ready")
+async def ready(request: Request):
+    """Readiness probe: 200 once every inference backend is warm, 503 before that."""
+    warmup = request.app.state.warmup
+    is_ready = warmup.is_ready()
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={"ready": is_ready, "components": warmup.status()}
+    )
+
 @app.get("/", response_class=HTMLResponse)
 async def read_index(request: Request, app_settings: Settings = Depends(get_settings)):
     return templates.TemplateResponse("Done-Talking.html", {
@@ -7,4 +7,7 @@ class RateLimits:
     UPLOAD = "10/hour"
     DOWNLOAD = "20/hour"
     HOME = "100/minute"
-    ACCEPT = "30/hour"
\ No newline at end of file
+    ACCEPT = "30/hour"
+    JOBS = "300/minute"
+    UPLOAD_CHUNKS = "600/minute"
+    LIVE = "600/minute"
\ No newline at end of file
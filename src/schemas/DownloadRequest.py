@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
+from .JobOptions import JobOptions
 
-class DownloadRequest(BaseModel):
+class DownloadRequest(JobOptions):
     """
     Request model for downloading a file.
     """
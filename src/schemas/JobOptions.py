@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, Literal, Optional
+
+class JobOptions(BaseModel):
+    """
+    Optional hints a client can send with any processing request.
+    """
+    num_speakers: Optional[int] = Field(None, ge=1, description="Exact number of speakers in the meeting")
+    min_speakers: Optional[int] = Field(None, ge=1, description="Lower bound on the number of speakers")
+    max_speakers: Optional[int] = Field(None, ge=1, description="Upper bound on the number of speakers")
+    # Only the languages with a processor, anything else is refused at submission
+    language: Optional[Literal["en", "ar"]] = Field(None, description="Spoken language code (en, ar), skips detection")
+
+    @model_validator(mode="after")
+    def check_speaker_bounds(self):
+        if self.min_speakers and self.max_speakers and self.min_speakers > self.max_speakers:
+            raise ValueError("min_speakers cannot be larger than max_speakers")
+        return self
+
+    def to_options(self) -> Dict[str, Any]:
+        """Options stored with the job, unset hints are left out."""
+        return self.model_dump(include=set(JobOptions.model_fields), exclude_none=True)
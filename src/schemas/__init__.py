@@ -1,3 +1,4 @@
 from .DownloadRequest import DownloadRequest
 from .MeetingSummary import MeetingSummary
-from .AcceptAudio import AcceptAudio
\ No newline at end of file
+from .AcceptAudio import AcceptAudio
+from .JobOptions import JobOptions
\ No newline at end of file
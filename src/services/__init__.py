@@ -1,9 +1,46 @@
-from .BaseService import BaseService
-from .formatters import ArabicFormatter, EnglishFormatter
-from .analysis import AnalysisService
-from . diarization import AudioDiarization
-from .file_transfer import UploadAudio, DownloadAudio
-from .llm import EnglishPrompt, ArabicPrompt, OllamaProvider, GoogleProvider
-from .summarization import ArabicSummary, EnglishSummary
-from .text_to_speech import ArabicConverter, EnglishConverter
-from .transcription import AudioTranscription
\ No newline at end of file
+# Public names are resolved lazily so importing one service does not pull in
+# torch, pyannote, whisper, langchain and edge_tts for every other one.
+from importlib import import_module
+
+_EXPORTS = {
+    "BaseService": ".BaseService",
+    "DecodedAudio": ".audio",
+    "StreamingDecoder": ".audio",
+    "AudioProbe": ".audio",
+    "CanonicalAudio": ".audio",
+    "PCMCache": ".audio",
+    "pcm_cache": ".audio",
+    "VoiceActivityFilter": ".audio",
+    "TimestampMap": ".audio",
+    "audio_probe": ".audio",
+    "ModelRegistry": ".models",
+    "model_registry": ".models",
+    "ArabicFormatter": ".formatters",
+    "EnglishFormatter": ".formatters",
+    "AnalysisService": ".analysis",
+    "AudioDiarization": ".diarization",
+    "SpeakerLinker": ".diarization",
+    "UploadAudio": ".file_transfer",
+    "DownloadAudio": ".file_transfer",
+    "EnglishPrompt": ".llm",
+    "ArabicPrompt": ".llm",
+    "OllamaProvider": ".llm",
+    "GoogleProvider": ".llm",
+    "ArabicSummary": ".summarization",
+    "EnglishSummary": ".summarization",
+    "ArabicConverter": ".text_to_speech",
+    "EnglishConverter": ".text_to_speech",
+    "AudioTranscription": ".transcription",
+    "LiveSession": ".live",
+    "Transcript": ".transcript",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -4,32 +4,41 @@ from src.services.analysis.SpeakerAnalyzer import SpeakerAnalyzer
 from src.services.analysis.TextAnalyzer import TextAnalyzer
 from src.services.analysis.stopwords.ArabicStopWords import ArabicStopWords
 from src.services.analysis.stopwords.EnglishStopWords import EnglishStopWords
+from src.services.transcript.Transcript import Transcript
+from fastapi import HTTPException
 from langdetect import detect
+from typing import Optional, Union
 
 class AnalysisService(BaseService):
-    def __init__(self, csv_path: str):
+    def __init__(self, transcript: Union[Transcript, str], language: Optional[str] = None):
         """
-        Initialize the AnalysisService with a CSV file path.
+        Initialize the AnalysisService with a job's transcript.
         
         Args:
-            csv_path (str): Path to the CSV file containing diarization results.
+            transcript (Transcript | str): Transcript handed over by transcription, or a diarization CSV path.
+            language (str, optional): Language already known for the job (pinned during transcription).
+                Detected from the first rows of text when not given.
         """
         super().__init__()
-        loader = DataLoader(csv_path)
-        self.df = loader.get_data()
-        sample_text = ' '.join(self.df['text'].dropna().astype(str).head(5).tolist())
-        self.language_code = detect(sample_text)
-        self.logger.info(f"Detected language is {self.language_code}")
+        self.transcript = transcript if isinstance(transcript, Transcript) else DataLoader(transcript).get_data()
+        if language:
+            self.language_code = language
+            self.logger.info(f"Language is {self.language_code}")
+        else:
+            sample_text = ' '.join([text for text in self.transcript.texts() if text][:5])
+            self.language_code = detect(sample_text)
+            self.logger.info(f"Detected language is {self.language_code}")
 
         if self.language_code == 'ar':
             stopwords_provider = ArabicStopWords()
         elif self.language_code == 'en':
             stopwords_provider = EnglishStopWords()
+        else:
+            raise HTTPException(status_code=400, detail=f"Unsupported language: {self.language_code}")
         
-        self.df = loader.get_data()
-        self.text_analyzer = TextAnalyzer(self.df, stopwords_provider.get())
-        self.speaker_analyzer = SpeakerAnalyzer(self.df)
-        self.logger.info("AnalysisService initialized with CSV data.")
+        self.text_analyzer = TextAnalyzer(self.transcript, stopwords_provider.get())
+        self.speaker_analyzer = SpeakerAnalyzer(self.transcript)
+        self.logger.info("AnalysisService initialized with transcript data.")
 
     def get_language_type(self):
         return self.language_code
@@ -49,5 +58,5 @@ class AnalysisService(BaseService):
     def get_total_number_of_speakers(self):
         return self.speaker_analyzer.get_total_number_of_speakers()
     
-    def get_total_audio_duration(self, audio_path: str):
-        return self.speaker_analyzer.get_total_audio_duration(audio_path=audio_path)
\ No newline at end of file
+    def get_total_audio_duration(self, audio, content_hash=None):
+        return self.speaker_analyzer.get_total_audio_duration(audio=audio, content_hash=content_hash)
\ No newline at end of file
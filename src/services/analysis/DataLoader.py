@@ -1,5 +1,5 @@
 from src.services.BaseService import BaseService
-import pandas as pd
+from src.services.transcript.Transcript import Transcript
 
 class DataLoader(BaseService):
     def __init__(self, csv_path: str):
@@ -11,15 +11,15 @@ class DataLoader(BaseService):
         """
         super().__init__()
         self.csv_path = csv_path
-        self.data = pd.read_csv(csv_path)
+        self.data = Transcript.from_csv(csv_path)
         self.logger.info(f"DataLoader initialized with CSV file: {csv_path}")
     
-    def get_data(self) -> pd.DataFrame:
+    def get_data(self) -> Transcript:
         """
         Load the data from the CSV file.
         
         Returns:
-            pd.DataFrame: DataFrame containing the diarization results.
+            Transcript: Transcript holding the diarization results.
         """
         self.logger.info("Data loaded successfully.")
         return self.data
\ No newline at end of file
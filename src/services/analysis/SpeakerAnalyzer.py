@@ -1,24 +1,24 @@
 from src.services.BaseService import BaseService
-from typing import List, Dict
-import pandas as pd 
-from langdetect import detect
-from pydub import AudioSegment
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.services.audio.AudioProbe import audio_probe
+from src.services.transcript.Transcript import Transcript
+from typing import List, Dict, Optional, Union
 
 class SpeakerAnalyzer(BaseService):
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, transcript: Transcript):
         """
-        Initialize the SpeakerAnalyzer with a DataFrame containing diarization results.
+        Initialize the SpeakerAnalyzer with a Transcript containing diarization results.
         
         Args:
-            df (pd.DataFrame): DataFrame containing the diarization results.
+            transcript (Transcript): Transcript containing the diarization results.
         """
         super().__init__()
-        self.df = df
-        self.logger.info("SpeakerAnalyzer initialized with DataFrame.")
+        self.transcript = transcript
+        self.logger.info("SpeakerAnalyzer initialized with Transcript.")
 
     def get_most_talked(self, n: int = 5) -> List[str]:
         """
-        Get the most talked speakers from the DataFrame.
+        Get the speakers with the most turns.
         
         Args:
             n (int): Number of top speakers to return.
@@ -27,7 +27,8 @@ class SpeakerAnalyzer(BaseService):
             List[str]: List of most talked speakers.
         """
         self.logger.info(f"Getting the top {n} most talked speakers.")
-        return self.df['speaker'].value_counts().head(n).index.tolist()
+        turns = self.transcript.speaker_totals()
+        return sorted(turns, key=lambda speaker: -turns[speaker])[:n]
     
     def get_total_duration(self) -> Dict[str, int]:
         """
@@ -37,8 +38,8 @@ class SpeakerAnalyzer(BaseService):
             Dict[str, int]: Dictionary with speakers as keys and their total duration (int) as values.
         """
         self.logger.info("Calculating total duration for each speaker.")
-        total_duration = self.df.groupby('speaker')['duration'].sum().to_dict()
-        return {speaker: int(duration) for speaker, duration in total_duration.items()}
+        total_duration = self.transcript.speaker_totals(self.transcript.duration)
+        return {speaker: int(duration) for speaker, duration in sorted(total_duration.items())}
     
     def get_total_number_of_speakers(self) -> int:
         """
@@ -48,18 +49,20 @@ class SpeakerAnalyzer(BaseService):
             int: Total number of unique speakers
         """
         self.logger.info("Calculating total number of unique speakers")
-        return self.df['speaker'].unique().size
+        return len(self.transcript.speakers)
     
-    def get_total_audio_duration(self, audio_path: str) -> float:
+    def get_total_audio_duration(self, audio: Union[str, DecodedAudio], content_hash: Optional[str] = None) -> float:
         """
         Get the total audio duration.
         
         Args:
-            audio_path: str = Audio directory.
+            audio: Union[str, DecodedAudio] = Audio path or the job's decoded audio buffer.
+            content_hash: Optional[str] = SHA-256 of the file, reuses an earlier probe of the same content.
         
         returns:
             duration_seconds: float = Audio duration in seconds
         """ 
-        audio = AudioSegment.from_file(audio_path)
-        duration_seconds = len(audio) / 1000.0
-        return duration_seconds
\ No newline at end of file
+        if isinstance(audio, DecodedAudio):
+            return audio.duration
+        # Read from the container headers, the file is not decoded
+        return audio_probe.probe(audio, content_hash=content_hash).duration
@@ -1,47 +1,47 @@
 from src.services.BaseService import BaseService
+from src.services.transcript.Transcript import Transcript
 from collections import Counter, defaultdict
 from typing import List, Dict, Tuple
 import re
 
 class TextAnalyzer(BaseService):
-    def __init__(self, df, stopwords: set):
+    def __init__(self, transcript: Transcript, stopwords: set):
         """
-        Initialize the TextAnalyzerService with a DataFrame and a set of stopwords.
+        Initialize the TextAnalyzerService with a Transcript and a set of stopwords.
         
         Args:
-            df (pd.DataFrame): DataFrame containing the text data.
+            transcript (Transcript): Transcript containing the text data.
             stopwords (set): Set of stopwords to be ignored in analysis.
         """
         super().__init__()
-        self.df = df
+        self.transcript = transcript
         self.stopwords = stopwords
-        self.logger.info("TextAnalyzerService initialized with DataFrame and stopwords.")
+        self.logger.info("TextAnalyzerService initialized with Transcript and stopwords.")
 
     def get_all_words(self) -> List[str]:
         """
-        Get all words from the DataFrame, excluding stopwords.
+        Get all words from the Transcript, excluding stopwords.
         
         Returns:
             List[str]: List of all words.
         """
-        self.logger.info("Extracting all words from the DataFrame.")
-        text = ' '.join(self.df['text'].dropna()).lower()
+        self.logger.info("Extracting all words from the Transcript.")
+        text = ' '.join(self.transcript.texts()).lower()
         return re.findall(r'\b\w+\b', text)
     
     def get_most_used_word(self) -> Tuple[str, int, Dict[str, int]]:
         """
-        Get the most used word in the DataFrame, excluding stopwords.
+        Get the most used word in the Transcript, excluding stopwords.
         
         Returns:
             Tuple[str, int, Dict[str, int]]: Most used word, its count, and a dictionary of all words with their counts.
         """
-        self.logger.info("Calculating the most used word in the DataFrame.")
+        self.logger.info("Calculating the most used word in the Transcript.")
         word_counts = Counter()
         speaker_word_map = defaultdict(Counter)
 
-        for _, row in self.df.iterrows():
-            test = str(row['text']).lower()
-            speaker = row['speaker']
+        for test, speaker in zip(self.transcript.texts(), self.transcript.speaker_labels()):
+            test = test.lower()
             words = re.findall(r'\b\w+\b', test)
             filtered = [w for w in words if w not in self.stopwords]
             word_counts.update(filtered)
@@ -0,0 +1,138 @@
+from src.services.BaseService import BaseService
+from fastapi import HTTPException
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+import subprocess
+import threading
+import json
+import os
+
+
+class AudioMetadata(NamedTuple):
+    duration: float
+    sample_rate: Optional[int]
+    channels: Optional[int]
+    codec: Optional[str]
+    format_name: Optional[str]
+    bit_rate: Optional[int]
+    size_bytes: int
+    # "header" when read from the container, "frame_count" when packets had to be counted
+    method: str
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+
+class AudioProbe(BaseService):
+    """
+    Reads duration, sample rate, channels and codec without decoding the audio.
+
+    ffprobe answers from the container headers; streams without a duration in
+    their headers (MediaRecorder webm) are measured by remuxing the packets to
+    a null muxer, which reads the file once but never decodes it. Results are
+    cached per content hash, or per path, size and mtime when no hash is known.
+    """
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, AudioMetadata]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def probe(self, path: str, content_hash: Optional[str] = None) -> AudioMetadata:
+        """
+        Return the metadata of an audio file.
+
+        :param path: Audio file to inspect.
+        :param content_hash: SHA-256 of the file if known, used as cache key.
+        :return: AudioMetadata of the first audio stream.
+        """
+        stat = os.stat(path)
+        key = content_hash or f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+        with self._lock:
+            metadata = self._cache.get(key)
+            if metadata is not None:
+                self._cache.move_to_end(key)
+                return metadata
+
+        metadata = self._probe_headers(path, stat.st_size)
+        if not metadata.duration:
+            metadata = metadata._replace(duration=self._count_frames(path), method="frame_count")
+        self.logger.info(f"Probed {path}: {metadata.duration:.2f}s {metadata.codec} ({metadata.method})")
+
+        with self._lock:
+            self._cache[key] = metadata
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return metadata
+
+    def validate(self, path: str, content_hash: Optional[str] = None) -> AudioMetadata:
+        """
+        Probe an ingested file and reject it if it holds no playable audio.
+        """
+        try:
+            metadata = self.probe(path, content_hash)
+        except RuntimeError as e:
+            self.logger.error(f"Rejected {path}: {e}")
+            raise HTTPException(status_code=400, detail="The file is not a readable audio file")
+        if metadata.duration <= 0:
+            raise HTTPException(status_code=400, detail="The audio file is empty")
+        return metadata
+
+    def _probe_headers(self, path: str, size_bytes: int) -> AudioMetadata:
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "format=duration,format_name,bit_rate:stream=codec_name,sample_rate,channels,duration",
+            "-of", "json",
+            str(path)
+        ]
+        try:
+            out = subprocess.run(cmd, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to probe audio {path}: {e.stderr.decode(errors='ignore')}") from e
+
+        info = json.loads(out or b"{}")
+        streams = info.get("streams") or []
+        if not streams:
+            raise RuntimeError(f"No audio stream in {path}")
+        stream, container = streams[0], info.get("format", {})
+        duration = self._number(stream.get("duration"), float) or self._number(container.get("duration"), float) or 0.0
+        return AudioMetadata(
+            duration=duration,
+            sample_rate=self._number(stream.get("sample_rate"), int),
+            channels=stream.get("channels"),
+            codec=stream.get("codec_name"),
+            format_name=container.get("format_name"),
+            bit_rate=self._number(container.get("bit_rate"), int),
+            size_bytes=size_bytes,
+            method="header"
+        )
+
+    def _count_frames(self, path: str) -> float:
+        # Copies packets to the null muxer, the last reported timestamp is the duration
+        cmd = [
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-i", str(path),
+            "-map", "0:a:0", "-c", "copy", "-f", "null",
+            "-progress", "pipe:1", "-"
+        ]
+        try:
+            out = subprocess.run(cmd, capture_output=True, check=True).stdout.decode(errors="ignore")
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to read audio {path}: {e.stderr.decode(errors='ignore')}") from e
+
+        duration = 0.0
+        for line in out.splitlines():
+            if line.startswith("out_time_us="):
+                duration = max(duration, (self._number(line.split("=", 1)[1], int) or 0) / 1e6)
+        return duration
+
+    @staticmethod
+    def _number(value, cast):
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return None
+
+
+audio_probe = AudioProbe()
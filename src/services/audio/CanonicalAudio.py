@@ -0,0 +1,102 @@
+from src.services.BaseService import BaseService
+from .DecodedAudio import DecodedAudio
+from .PCMCache import pcm_cache
+from typing import Optional, Tuple
+import numpy as np
+import subprocess
+import tempfile
+import shutil
+import uuid
+import os
+
+# Even, so int16 samples never straddle two reads
+READ_SIZE = 1024 * 1024
+
+
+class CanonicalAudio(BaseService):
+    """
+    Produces the one working file every stage of a job reads: 16 kHz mono FLAC.
+
+    A single ffmpeg run writes the FLAC and streams the same samples as PCM,
+    so the input is decoded exactly once. The original upload or download is
+    left untouched for archival.
+    """
+    SAMPLE_RATE = DecodedAudio.SAMPLE_RATE
+
+    def __init__(self):
+        super().__init__()
+        self.canonical_dir = self.ensure_path("canonical_audio")
+
+    def ingest(self, source_path: str, expected_seconds: Optional[float] = None) -> Tuple[str, DecodedAudio]:
+        """
+        Transcode an input into the canonical format and decode it.
+
+        :param source_path: Original audio or video file, any format ffmpeg reads.
+        :param expected_seconds: Probed duration, lets the samples go to the PCM cache.
+        :return: Path of the canonical FLAC and its decoded samples.
+        """
+        job_dir = os.path.join(self.canonical_dir, uuid.uuid4().hex)
+        os.makedirs(job_dir)
+        # Keep the original name so artifacts derived from it (CSV name) stay readable
+        canonical_path = os.path.join(job_dir, f"{os.path.splitext(os.path.basename(source_path))[0]}.flac")
+
+        partial_path = f"{canonical_path}.part"
+        cmd = [
+            "ffmpeg", "-nostdin", "-y", "-v", "error", "-threads", "0",
+            "-i", str(source_path),
+            "-map", "0:a:0", "-ac", "1", "-ar", str(self.SAMPLE_RATE),
+            "-c:a", "flac", "-sample_fmt", "s16", "-f", "flac", partial_path,
+            "-map", "0:a:0", "-ac", "1", "-ar", str(self.SAMPLE_RATE),
+            "-f", "s16le", "-acodec", "pcm_s16le", "-"
+        ]
+        pcm_path = pcm_cache.reserve(expected_seconds, self.SAMPLE_RATE) if expected_seconds else None
+        try:
+            samples = self._run(cmd, pcm_path)
+        except Exception:
+            pcm_cache.release(pcm_path)
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        os.replace(partial_path, canonical_path)
+
+        self.logger.info(
+            f"Canonical audio for {source_path}: {canonical_path} "
+            f"({os.path.getsize(canonical_path)} bytes, {len(samples) / self.SAMPLE_RATE:.1f}s, "
+            f"{'memory-mapped' if pcm_path else 'in memory'})"
+        )
+        return canonical_path, DecodedAudio(samples, source_path=canonical_path, sample_rate=self.SAMPLE_RATE, pcm_path=pcm_path)
+
+    def _run(self, cmd, pcm_path: Optional[str]) -> np.ndarray:
+        # PCM is converted to float32 chunk by chunk, straight into the cache file when there is one.
+        # stderr goes to a file: a full stderr pipe would block ffmpeg while we wait on stdout
+        with tempfile.TemporaryFile() as errors:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors)
+            pieces = []
+            sink = open(pcm_path, "wb") if pcm_path else None
+            try:
+                for chunk in iter(lambda: process.stdout.read(READ_SIZE), b""):
+                    samples = np.frombuffer(chunk, np.int16).astype(np.float32) / 32768.0
+                    if sink:
+                        sink.write(samples.tobytes())
+                    else:
+                        pieces.append(samples)
+                returncode = process.wait()
+            finally:
+                if sink:
+                    sink.close()
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+                process.stdout.close()
+            if returncode != 0:
+                errors.seek(0)
+                raise RuntimeError(f"Failed to transcode audio: {errors.read().decode(errors='ignore')}")
+        if pcm_path:
+            return pcm_cache.commit(pcm_path)
+        return np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+
+    def release(self, canonical_path: Optional[str], audio: Optional[DecodedAudio] = None):
+        """Delete a job's working files once the job is over."""
+        if audio is not None:
+            pcm_cache.release(audio.pcm_path)
+        if canonical_path and os.path.dirname(canonical_path).startswith(self.canonical_dir):
+            shutil.rmtree(os.path.dirname(canonical_path), ignore_errors=True)
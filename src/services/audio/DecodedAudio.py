@@ -0,0 +1,78 @@
+from typing import Optional
+import subprocess
+import numpy as np
+
+
+class DecodedAudio:
+    """
+    Audio decoded once into 16 kHz mono float32 PCM.
+
+    The same buffer is shared by diarization, transcription and analysis so the
+    input file goes through ffmpeg a single time per job.
+    """
+    SAMPLE_RATE = 16000
+
+    def __init__(self, samples: np.ndarray, source_path: Optional[str] = None, sample_rate: int = SAMPLE_RATE,
+                 pcm_path: Optional[str] = None):
+        self.samples = samples
+        self.source_path = source_path
+        self.sample_rate = sample_rate
+        # float32 file behind samples when they are memory-mapped (see PCMCache)
+        self.pcm_path = pcm_path
+
+    @classmethod
+    def from_pcm(cls, pcm_path: str, source_path: Optional[str] = None, sample_rate: int = SAMPLE_RATE) -> "DecodedAudio":
+        """
+        Map samples another stage or process already decoded, nothing is read until sliced.
+        """
+        from .PCMCache import PCMCache
+        return cls(PCMCache.open(pcm_path), source_path=source_path, sample_rate=sample_rate, pcm_path=pcm_path)
+
+    @classmethod
+    def from_file(cls, audio_path: str, sample_rate: int = SAMPLE_RATE) -> "DecodedAudio":
+        """
+        Decode an audio file with ffmpeg into mono float32 samples.
+
+        :param audio_path: Path to the audio file to decode.
+        :param sample_rate: Target sample rate.
+        :return: DecodedAudio holding the whole recording.
+        """
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0",
+            "-i", str(audio_path),
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+            "-"
+        ]
+        try:
+            out = subprocess.run(cmd, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to decode audio {audio_path}: {e.stderr.decode(errors='ignore')}") from e
+
+        samples = np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+        return cls(samples, source_path=str(audio_path), sample_rate=sample_rate)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the audio in seconds."""
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start_time: float, end_time: float) -> np.ndarray:
+        """
+        Return the samples between two timestamps as a view (no copy).
+
+        :param start_time: Start time in seconds.
+        :param end_time: End time in seconds.
+        :return: NumPy view over the shared buffer.
+        """
+        start = max(0, int(round(start_time * self.sample_rate)))
+        end = min(len(self.samples), int(round(end_time * self.sample_rate)))
+        return self.samples[start:max(start, end)]
+
+    def to_pyannote(self) -> dict:
+        """
+        Return the in-memory input format expected by pyannote pipelines.
+        The tensor shares memory with the NumPy buffer.
+        """
+        import torch
+        waveform = torch.from_numpy(self.samples).unsqueeze(0)
+        return {"waveform": waveform, "sample_rate": self.sample_rate}
@@ -0,0 +1,102 @@
+from src.services.BaseService import BaseService
+from src.core import get_settings
+from typing import Dict, Optional
+import numpy as np
+import threading
+import shutil
+import uuid
+import os
+
+
+class PCMCache(BaseService):
+    """
+    Decoded float32 samples of running jobs, kept in files on local disk.
+
+    Every stage and worker process opens a job's file with numpy.memmap, so
+    turn slices are zero-copy views and repeated reads come from the page
+    cache instead of another decode. Space is reserved before a file is
+    written; when the cap would be exceeded the caller keeps the samples in
+    memory instead. Files live until the job releases them.
+    """
+    SAMPLE_BYTES = 4
+
+    def __init__(self, max_bytes: int, enabled: bool = True):
+        super().__init__()
+        self.cache_dir = self.ensure_path("pcm_cache")
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._reserved: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Files are grouped per owning process, worker processes only open them
+        self.process_dir = os.path.join(self.cache_dir, str(os.getpid()))
+        self._remove_orphans()
+
+    def reserve(self, seconds: float, sample_rate: int) -> Optional[str]:
+        """
+        Reserve room for a job's samples.
+
+        :param seconds: Expected duration, a small margin is added.
+        :return: Path to write the samples to, or None if the cache is full or disabled.
+        """
+        if not self.enabled:
+            return None
+        size = int((seconds + 1.0) * sample_rate * self.SAMPLE_BYTES)
+        path = os.path.join(self.process_dir, f"{uuid.uuid4().hex}.f32")
+        with self._lock:
+            if sum(self._reserved.values()) + size > self.max_bytes:
+                self.logger.warning(f"PCM cache full, keeping {seconds:.0f}s of samples in memory")
+                return None
+            self._reserved[path] = size
+        os.makedirs(self.process_dir, exist_ok=True)
+        return path
+
+    def commit(self, path: str) -> np.memmap:
+        """Record the real size of a written file and map it."""
+        with self._lock:
+            if path in self._reserved:
+                self._reserved[path] = os.path.getsize(path)
+        return self.open(path)
+
+    @staticmethod
+    def open(path: str) -> np.memmap:
+        """
+        Map a samples file. Copy-on-write, so callers that modify the array
+        (torch tensors built on it) never touch the file or other readers.
+        """
+        if os.path.getsize(path) == 0:
+            return np.zeros(0, dtype=np.float32)
+        return np.memmap(path, dtype=np.float32, mode="c")
+
+    def release(self, path: Optional[str]):
+        if not path:
+            return
+        with self._lock:
+            self._reserved.pop(path, None)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _remove_orphans(self):
+        # Directories of processes that are gone, none of their jobs can still be running
+        for name in os.listdir(self.cache_dir):
+            if not name.isdigit() or int(name) == os.getpid():
+                continue
+            try:
+                os.kill(int(name), 0)
+            except ProcessLookupError:
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+            except PermissionError:
+                pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "files": len(self._reserved),
+                "bytes": sum(self._reserved.values()),
+                "max_bytes": self.max_bytes,
+            }
+
+
+pcm_cache = PCMCache(
+    max_bytes=get_settings().PCM_CACHE_MAX_MB * 1024 * 1024,
+    enabled=get_settings().PCM_CACHE_ENABLED
+)
@@ -0,0 +1,67 @@
+from .DecodedAudio import DecodedAudio
+import subprocess
+import threading
+import numpy as np
+import os
+
+
+class StreamingDecoder:
+    """
+    Incremental decoder for an audio byte stream that arrives in pieces.
+
+    Container chunks from MediaRecorder cannot be decoded on their own, so a
+    single ffmpeg process reads the stream on stdin for the whole session and
+    its 16 kHz mono PCM output is collected as it is produced.
+    """
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, sample_rate: int = DecodedAudio.SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.process = subprocess.Popen(
+            [
+                "ffmpeg", "-nostdin", "-loglevel", "error",
+                "-i", "pipe:0",
+                "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate),
+                "pipe:1"
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._pcm = bytearray()
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def feed(self, data: bytes):
+        """Pass the next bytes of the encoded stream to ffmpeg."""
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def take(self) -> np.ndarray:
+        """Return the samples decoded since the previous call as float32."""
+        with self._lock:
+            usable = len(self._pcm) - len(self._pcm) % 2
+            pcm = bytes(self._pcm[:usable])
+            del self._pcm[:usable]
+        return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+    def close(self, timeout: float = 60.0) -> np.ndarray:
+        """End the stream and return the remaining samples."""
+        if not self.process.stdin.closed:
+            self.process.stdin.close()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self._reader.join(timeout=timeout)
+        return self.take()
+
+    def _read(self):
+        fd = self.process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, self.READ_SIZE)
+            if not chunk:
+                break
+            with self._lock:
+                self._pcm.extend(chunk)
@@ -0,0 +1,120 @@
+from .DecodedAudio import DecodedAudio
+from typing import List, Tuple
+import numpy as np
+
+
+class TimestampMap:
+    """
+    Maps times on the compacted (silence removed) timeline back to the original recording.
+
+    Each kept region is (original_start, original_end, compact_start).
+    """
+    def __init__(self, regions: List[Tuple[float, float, float]], original_duration: float):
+        self.regions = regions
+        self.original_duration = original_duration
+
+    @property
+    def kept_seconds(self) -> float:
+        return sum(end - start for start, end, _ in self.regions)
+
+    @property
+    def skipped_fraction(self) -> float:
+        if self.original_duration <= 0:
+            return 0.0
+        return 1.0 - self.kept_seconds / self.original_duration
+
+    def to_original(self, start: float, end: float) -> List[Tuple[float, float]]:
+        """
+        Original-timeline pieces of a compact interval, split where silence was removed.
+        """
+        pieces = []
+        for original_start, original_end, compact_start in self.regions:
+            compact_end = compact_start + (original_end - original_start)
+            overlap_start, overlap_end = max(start, compact_start), min(end, compact_end)
+            if overlap_end > overlap_start:
+                pieces.append((
+                    original_start + overlap_start - compact_start,
+                    original_start + overlap_end - compact_start
+                ))
+        return pieces
+
+    def remap(self, annotation):
+        """Return a pyannote Annotation with every turn moved back to the original timeline."""
+        from pyannote.core import Annotation, Segment
+
+        remapped = Annotation(uri=annotation.uri)
+        for segment, track, label in annotation.itertracks(yield_label=True):
+            for start, end in self.to_original(segment.start, segment.end):
+                remapped[Segment(start, end), track] = label
+        return remapped
+
+
+class VoiceActivityFilter:
+    """
+    Energy-based voice activity detection used to cut long silences
+    (waiting rooms, muted stretches) before diarization and ASR.
+
+    Frames louder than the noise floor by threshold_db count as activity.
+    Only pauses longer than min_silence_seconds are removed, and every kept
+    region is padded, so natural pauses and word edges stay intact.
+    """
+    def __init__(self,
+                 threshold_db: float = 12.0,
+                 min_silence_seconds: float = 2.0,
+                 padding_seconds: float = 0.25,
+                 frame_seconds: float = 0.03,
+                 floor_db: float = -60.0):
+        self.threshold_db = threshold_db
+        self.min_silence_seconds = min_silence_seconds
+        self.padding_seconds = padding_seconds
+        self.frame_seconds = frame_seconds
+        self.floor_db = floor_db
+
+    def speech_regions(self, audio: DecodedAudio) -> List[Tuple[float, float]]:
+        """
+        Regions of the recording that contain sound, in seconds.
+        """
+        frame = max(1, int(self.frame_seconds * audio.sample_rate))
+        count = len(audio.samples) // frame
+        if count == 0:
+            return [(0.0, audio.duration)] if audio.duration > 0 else []
+
+        frames = np.asarray(audio.samples[:count * frame], dtype=np.float32).reshape(count, frame)
+        level_db = 10 * np.log10(np.mean(frames * frames, axis=1) + 1e-12)
+        noise_floor = np.percentile(level_db, 10)
+        active = level_db > max(noise_floor + self.threshold_db, self.floor_db)
+
+        regions: List[Tuple[float, float]] = []
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], active.astype(np.int8), [0]))))
+        for first, last in zip(edges[::2], edges[1::2]):
+            start = max(0.0, first * self.frame_seconds - self.padding_seconds)
+            end = min(audio.duration, last * self.frame_seconds + self.padding_seconds)
+            if regions and start - regions[-1][1] < self.min_silence_seconds:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+        return regions
+
+    def filter(self, audio: DecodedAudio) -> Tuple[DecodedAudio, TimestampMap]:
+        """
+        Remove long silences.
+
+        :return: Audio holding only the active regions, and the map back to the original timeline.
+            A recording without any activity is returned as is, with an identity map.
+        """
+        regions = self.speech_regions(audio)
+        if not regions:
+            # Silent or near-silent recording, an empty buffer would crash pyannote
+            return audio, TimestampMap([(0.0, audio.duration, 0.0)], audio.duration)
+        kept = []
+        compact_start = 0.0
+        pieces = []
+        for start, end in regions:
+            piece = audio.slice(start, end)
+            pieces.append(piece)
+            kept.append((start, start + len(piece) / audio.sample_rate, compact_start))
+            compact_start += len(piece) / audio.sample_rate
+
+        samples = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+        compact = DecodedAudio(samples, source_path=audio.source_path, sample_rate=audio.sample_rate)
+        return compact, TimestampMap(kept, audio.duration)
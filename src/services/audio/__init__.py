@@ -0,0 +1,6 @@
+from .DecodedAudio import DecodedAudio
+from .StreamingDecoder import StreamingDecoder
+from .AudioProbe import AudioProbe, AudioMetadata, audio_probe
+from .CanonicalAudio import CanonicalAudio
+from .PCMCache import PCMCache, pcm_cache
+from .VoiceActivity import VoiceActivityFilter, TimestampMap
\ No newline at end of file
@@ -0,0 +1,187 @@
+from src.services.BaseService import BaseService
+from src.core import get_settings
+from src.helpers import unique_file_name
+from typing import Dict, List, Optional
+import threading
+import hashlib
+import shutil
+import json
+import time
+import os
+
+ARTIFACTS = {
+    "audio_summary_path": "summary.mp3",
+    "summary_json_path": "summary.json",
+    "diarization_csv_path": "diarization.csv",
+}
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_fingerprint(config: Dict) -> str:
+    """Stable short hash of the pipeline configuration that shapes the output."""
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class ResultCache(BaseService):
+    """
+    Content-addressed store of finished job artifacts.
+
+    Entries are keyed by the SHA-256 of the input audio plus a fingerprint of
+    the pipeline configuration, so a re-upload of the same recording returns
+    the stored summary audio, JSON and diarization CSV without reprocessing.
+    """
+    def __init__(self, max_bytes: int, max_age_seconds: float):
+        super().__init__()
+        self.cache_dir = self.ensure_path("result_cache")
+        self.restore_dir = self.ensure_path("cached_results")
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict] = self._load_index()
+
+    def key(self, content_hash: str, fingerprint: str) -> str:
+        return f"{content_hash}-{fingerprint}"
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Return copies of the artifacts stored under key, or None on a miss.
+        The copies belong to the calling job and outlive the entry's eviction.
+        """
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is not None and self._expired(meta):
+                self._remove(key)
+                meta = None
+            if meta is None:
+                self.misses += 1
+                return None
+            paths = self._paths(key, meta.get("artifacts"))
+            if not all(os.path.exists(path) for path in paths.values() if path):
+                self._remove(key)
+                self.misses += 1
+                return None
+            # Copied under the lock so a concurrent eviction cannot remove the entry mid-copy
+            restored = {field: self._restore(path) if path else None for field, path in paths.items()}
+            meta["last_access"] = time.time()
+            self._write_meta(key, meta)
+            self.hits += 1
+        self.logger.info(f"Result cache hit for {key}")
+        return restored
+
+    def put(self, key: str, result: Dict[str, str]) -> Dict[str, str]:
+        """
+        Store copies of a finished job's artifacts.
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        staging_dir = f"{entry_dir}.tmp{threading.get_ident()}"
+        os.makedirs(staging_dir, exist_ok=True)
+        size = 0
+        stored = []
+        for field, filename in ARTIFACTS.items():
+            # The diarization CSV is optional (TRANSCRIPT_CSV_EXPORT)
+            if not result.get(field):
+                continue
+            stored.append(field)
+            target = os.path.join(staging_dir, filename)
+            # A copy, not a hard link: the entry must not follow later writes to the job's file
+            shutil.copyfile(result[field], target)
+            size += os.path.getsize(target)
+
+        now = time.time()
+        meta = {"created": now, "last_access": now, "size": size, "artifacts": stored}
+        with open(os.path.join(staging_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        with self._lock:
+            if key in self._index:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            else:
+                os.replace(staging_dir, entry_dir)
+                self._index[key] = meta
+            self._evict()
+        self.logger.info(f"Stored result cache entry {key} ({size} bytes)")
+        return self._paths(key, stored)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": sum(meta["size"] for meta in self._index.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+    def _paths(self, key: str, fields: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+        # Entries written before artifacts were recorded hold all of them
+        fields = list(ARTIFACTS) if fields is None else fields
+        return {
+            field: os.path.join(self.cache_dir, key, filename) if field in fields else None
+            for field, filename in ARTIFACTS.items()
+        }
+
+    def _expired(self, meta: Dict) -> bool:
+        return self.max_age_seconds > 0 and time.time() - meta["created"] > self.max_age_seconds
+
+    def _evict(self):
+        # Called with self._lock held: drop expired entries, then least recently used until under the size cap
+        for key in [k for k, meta in self._index.items() if self._expired(meta)]:
+            self._remove(key)
+            self.evictions += 1
+        total = sum(meta["size"] for meta in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]["size"]
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        self._index.pop(key, None)
+        shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
+    def _restore(self, path: str) -> str:
+        target = os.path.join(self.restore_dir, unique_file_name(file_extension=path.rsplit(".", 1)[-1]))
+        shutil.copyfile(path, target)
+        return target
+
+    def _write_meta(self, key: str, meta: Dict):
+        # Keeps last_access across restarts, so LRU order survives them
+        meta_path = os.path.join(self.cache_dir, key, "meta.json")
+        try:
+            with open(f"{meta_path}.tmp", "w") as f:
+                json.dump(meta, f)
+            os.replace(f"{meta_path}.tmp", meta_path)
+        except OSError as e:
+            self.logger.warning(f"Could not update result cache entry {key}: {e}")
+
+    def _load_index(self) -> Dict[str, Dict]:
+        index = {}
+        for key in os.listdir(self.cache_dir):
+            meta_path = os.path.join(self.cache_dir, key, "meta.json")
+            if ".tmp" in key or not os.path.exists(meta_path):
+                shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+                continue
+            with open(meta_path) as f:
+                index[key] = json.load(f)
+        return index
+
+
+result_cache = ResultCache(
+    max_bytes=get_settings().RESULT_CACHE_MAX_MB * 1024 * 1024,
+    max_age_seconds=get_settings().RESULT_CACHE_MAX_AGE_HOURS * 3600
+)
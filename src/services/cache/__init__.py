@@ -0,0 +1 @@
+from .ResultCache import ResultCache, result_cache, hash_file, config_fingerprint
\ No newline at end of file
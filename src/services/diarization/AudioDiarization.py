@@ -1,10 +1,24 @@
-from pyannote.audio import Pipeline
 from src.services.BaseService import BaseService
 from src.services.diarization.CSVHandler import CSVHandler
 from src.services.transcription.AudioTranscription import AudioTranscription
-from src.core import get_settings
+from src.services.transcription.WordAligner import WordAligner
+from src.services.transcription.BatchTranscription import BatchTranscription
+from src.services.transcription.ParallelTranscription import ParallelTranscription
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.services.audio.VoiceActivity import VoiceActivityFilter
+from src.services.diarization.SpeakerLinker import SpeakerLinker
+from src.services.diarization.TurnConsolidator import TurnConsolidator
+from src.services.transcript.Transcript import Transcript
+from src.services.models.ModelRegistry import model_registry
+from src.services.progress.JobProgress import JobProgress
 from pathlib import Path
+from typing import Union, List, Dict, Optional, Tuple
+import numpy as np
 import torch
+import time
+
+# Same-speaker turns closer than this across a window boundary are one turn
+WINDOW_JOIN_GAP_SECONDS = 0.5
 
 class AudioDiarization(BaseService):
     def __init__(self):
@@ -16,29 +30,260 @@ class AudioDiarization(BaseService):
         self.logger.info(f"Using device: {self.device}")  
         print(f"Using device: {self.device}")  
         
-        self.pipeline = Pipeline.from_pretrained(
-            "pyannote/speaker-diarization", 
-            use_auth_token=get_settings().HF_TOKEN
-        ).to(self.device)
+        self.pipeline = model_registry.get_diarization_pipeline(
+            self.app_settings.DIARIZATION_MODEL,
+            device=str(self.device)
+        )
+        self.vad = VoiceActivityFilter(
+            threshold_db=self.app_settings.VAD_THRESHOLD_DB,
+            min_silence_seconds=self.app_settings.VAD_MIN_SILENCE_SECONDS
+        )
          
 
-    def diarize(self, audio_file: str, save_csv: bool = True):
+    def diarize(self, audio_file: Union[str, DecodedAudio], save_csv: bool = True, progress: Optional[JobProgress] = None,
+                speaker_hints: Optional[Dict[str, int]] = None, language: Optional[str] = None):
         """
         Perform speaker diarization on the given audio file with transcription.
         
-        :param audio_file: Path to the audio file to be diarized.
+        :param audio_file: Path to the audio file or an already decoded audio buffer.
         :param save_csv: Whether to save the results to a CSV file.
+        :param progress: Receives diarization and transcription stage events.
+        :param speaker_hints: num_speakers / min_speakers / max_speakers known by the client.
+        :param language: Spoken language if known, detected once from the first turns otherwise.
         :return: Diarization result and transcript.
         """
+        # Decode once, the same buffer feeds pyannote and whisper
+        audio = audio_file if isinstance(audio_file, DecodedAudio) else DecodedAudio.from_file(audio_file)
+        diarization = self.find_speakers(audio, progress=progress, speaker_hints=speaker_hints)
+        return self.transcribe(audio, diarization, save_csv=save_csv, progress=progress, language=language)
+
+    def find_speakers(self, audio: DecodedAudio, progress: Optional[JobProgress] = None, device: Optional[str] = None,
+                      speaker_hints: Optional[Dict[str, int]] = None):
+        """
+        Run the pyannote pipeline on the decoded audio.
+        
+        :param audio: Decoded audio buffer.
+        :param progress: Receives the diarization stage events.
+        :param device: Run on the pipeline copy of this device instead of the default one.
+        :param speaker_hints: num_speakers / min_speakers / max_speakers, narrow the clustering search.
+        :return: pyannote Annotation.
+        """
+        progress = progress or JobProgress()
+        speaker_hints = speaker_hints or {}
+        pipeline = self.pipeline
+        if device is not None and device != str(self.device):
+            pipeline = model_registry.get_diarization_pipeline(self.app_settings.DIARIZATION_MODEL, device=device)
+
+        self.logger.info(f"Starting diarization for {audio.source_path}")
+        progress.start("diarization", **speaker_hints)
+        skipped_fraction = 0.0
+        if self.app_settings.VAD_ENABLED:
+            # Long silences never reach pyannote, turns are mapped back to the original timeline
+            compact, timestamp_map = self.vad.filter(audio)
+            if compact.duration >= 1.0:
+                diarization = timestamp_map.remap(self._run_pipeline(pipeline, compact, progress, speaker_hints))
+                skipped_fraction = timestamp_map.skipped_fraction
+            else:
+                diarization = self._run_pipeline(pipeline, audio, progress, speaker_hints)
+            self.logger.info(f"VAD skipped {skipped_fraction:.1%} of {audio.duration:.0f}s")
+        else:
+            diarization = self._run_pipeline(pipeline, audio, progress, speaker_hints)
+        turn_count = len(list(diarization.itertracks()))
+        progress.complete(
+            "diarization", turns=turn_count, speakers=len(diarization.labels()),
+            skipped_fraction=round(skipped_fraction, 3)
+        )
+        self.logger.info(f"Diarization completed for {audio.source_path}")
+        return diarization
+
+    def _run_pipeline(self, pipeline, audio: DecodedAudio, progress: JobProgress, speaker_hints: Dict[str, int]):
+        if audio.duration > self.app_settings.DIARIZATION_LONG_AUDIO_MINUTES * 60:
+            return self.find_speakers_windowed(audio, pipeline=pipeline, progress=progress, speaker_hints=speaker_hints)
+        return pipeline(audio.to_pyannote(), **speaker_hints)
+
+    def find_speakers_windowed(self, audio: DecodedAudio, pipeline=None, progress: Optional[JobProgress] = None,
+                               window_seconds: Optional[float] = None, overlap_seconds: Optional[float] = None,
+                               speaker_hints: Optional[Dict[str, int]] = None):
+        """
+        Diarize long audio in overlapping windows so peak memory does not grow with its length.
+        
+        Speakers of each window are linked to the speakers found so far by embedding
+        similarity. Every window keeps the turns of its own half of the overlaps,
+        and same-speaker turns cut by a window boundary are joined again.
+        
+        :param audio: Decoded audio buffer.
+        :param pipeline: pyannote pipeline to use, the default one if None.
+        :param progress: Receives one diarization update per window.
+        :param window_seconds: Window length, DIARIZATION_WINDOW_MINUTES if None.
+        :param overlap_seconds: Overlap between windows, DIARIZATION_WINDOW_OVERLAP_SECONDS if None.
+        :param speaker_hints: Speaker counts of the whole recording, a window gets them as an upper bound.
+        :return: pyannote Annotation labelled SPEAKER_xx on the timeline of the whole audio.
+        """
+        from pyannote.core import Annotation, Segment
+
+        progress = progress or JobProgress()
+        pipeline = pipeline or self.pipeline
+        window = window_seconds or self.app_settings.DIARIZATION_WINDOW_MINUTES * 60
+        overlap = self.app_settings.DIARIZATION_WINDOW_OVERLAP_SECONDS if overlap_seconds is None else overlap_seconds
+        overlap = min(overlap, window / 2)
+        step = window - overlap
+        starts = [0.0]
+        while starts[-1] + window < audio.duration:
+            starts.append(starts[-1] + step)
+
+        # A window may hear only some of the meeting's speakers
+        speaker_hints = speaker_hints or {}
+        upper_bound = speaker_hints.get("num_speakers") or speaker_hints.get("max_speakers")
+        window_hints = {"max_speakers": upper_bound} if upper_bound else {}
+
+        linker = SpeakerLinker(threshold=self.app_settings.SPEAKER_LINK_THRESHOLD)
+        merged = Annotation(uri=audio.source_path)
+        for index, start in enumerate(starts):
+            end = min(start + window, audio.duration)
+            # A view on the shared buffer, only this window goes through the model
+            piece = DecodedAudio(audio.slice(start, end), source_path=audio.source_path, sample_rate=audio.sample_rate)
+            local = pipeline(piece.to_pyannote(), **window_hints)
+            mapping = linker.link(self.speaker_embeddings(piece, local))
 
-        self.logger.info(f"Starting diarization for {audio_file}")
+            own_from = start + overlap / 2 if index > 0 else 0.0
+            own_to = end - overlap / 2 if index < len(starts) - 1 else audio.duration
+            for turn, track, label in local.itertracks(yield_label=True):
+                turn_start, turn_end = max(start + turn.start, own_from), min(start + turn.end, own_to)
+                # Unlinked: a few frames of speech without embedding before any speaker was found
+                if turn_end > turn_start and label in mapping:
+                    merged[Segment(turn_start, turn_end), f"{index}_{track}"] = mapping[label]
+            progress.update("diarization", done=index + 1, total=len(starts))
+            self.logger.info(
+                f"Diarized window {index + 1}/{len(starts)} ({start:.0f}-{end:.0f}s), "
+                f"{linker.speaker_count} speakers so far"
+            )
+        return merged.support(collar=WINDOW_JOIN_GAP_SECONDS)
 
-        diarization = self.pipeline(audio_file)
-        self.logger.info(f"Diarization completed for {audio_file}")
+    def speaker_embeddings(self, audio: DecodedAudio, diarization, max_seconds: float = 30.0) -> Dict[str, Tuple[np.ndarray, float]]:
+        """
+        One embedding per speaker of a diarization, used to link speakers across pieces of audio.
+        
+        :param audio: Audio the diarization was computed on.
+        :param diarization: pyannote Annotation.
+        :param max_seconds: Speech per speaker fed to the embedding model.
+        :return: Speaker label -> (embedding, seconds of speech).
+        """
+        inference = model_registry.get_speaker_embedding(self.app_settings.SPEAKER_EMBEDDING_MODEL, device=str(self.device))
+        embeddings = {}
+        for label in diarization.labels():
+            timeline = diarization.label_timeline(label)
+            pieces, collected = [], 0.0
+            for segment in timeline:
+                if collected >= max_seconds:
+                    break
+                end = min(segment.end, segment.start + max_seconds - collected)
+                pieces.append(audio.slice(segment.start, end))
+                collected += end - segment.start
+            samples = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+            if len(samples) < audio.sample_rate // 10:
+                embeddings[label] = (np.full(1, np.nan), timeline.duration())
+                continue
+            embedding = inference({"waveform": torch.from_numpy(samples).unsqueeze(0), "sample_rate": audio.sample_rate})
+            embeddings[label] = (np.asarray(embedding), timeline.duration())
+        return embeddings
+
+    def transcribe(self, audio: DecodedAudio, diarization, save_csv: bool = True, progress: Optional[JobProgress] = None, replica: int = 0,
+                   language: Optional[str] = None):
+        """
+        Transcribe the diarization turns and optionally save the CSV.
         
-        transcriber = AudioTranscription(audio_file)
-        self.logger.info(f"Transcriber initialized for {audio_file}")
+        :param replica: Whisper model replica to use, concurrent callers need distinct ones.
+        :param language: Language passed to every ASR call, detected once here if None.
+        :return: Diarization result, Transcript and CSV path (None without save_csv).
+        """
+        progress = progress or JobProgress()
+        audio_path = audio.source_path
+        turn_count = len(list(diarization.itertracks()))
 
+        mode = self.app_settings.TRANSCRIPTION_MODE
+        # Parallel workers load their own models, none is needed in this process
+        transcriber = AudioTranscription(audio, replica=replica) if mode != "parallel" else None
+        self.logger.info(f"Transcriber initialized for {audio_path}")
+        language = language or self.detect_language(audio, diarization, transcriber=transcriber)
+        if transcriber:
+            transcriber.language = language
+
+        if mode == "batched" and not transcriber.engine.supports_batching:
+            self.logger.warning(f"{type(transcriber.engine).__name__} cannot decode mel batches, using per_turn")
+            mode = "per_turn"
+        progress.start("transcription", mode=mode, total=turn_count, language=language)
+        started = time.perf_counter()
+        if mode == "parallel":
+            text_data = self.transcribe_parallel(audio, diarization, progress, language=language)
+        elif mode == "whole_file":
+            text_data = self.transcribe_whole_file(transcriber, diarization)
+        elif mode == "batched":
+            text_data = self.transcribe_batched(transcriber, diarization, progress)
+        else:
+            text_data = self.transcribe_turns(transcriber, diarization, progress)
+        elapsed = time.perf_counter() - started
+        progress.complete("transcription", done=turn_count, total=turn_count)
+        self.logger.info(
+            f"Transcription ({mode}) took {elapsed:.1f}s, "
+            f"{audio.duration / max(elapsed, 1e-6):.1f} audio-minutes per wall-minute"
+        )
+        
+        transcript = Transcript.from_diarization(diarization, text_data)
+        csv_path = None
+        if save_csv:
+            csv_handler = CSVHandler(output_path=self.output_path)
+            csv_path = csv_handler.save_transcript(transcript, audio_path)
+            self.logger.info(f"Diarization results saved to CSV: {csv_path}")
+            print(f"Diarization results saved to CSV: {csv_path}")
+        
+        return diarization, transcript, csv_path
+    
+    def detect_language(self, audio: DecodedAudio, diarization, replica: int = 0,
+                        transcriber: Optional[AudioTranscription] = None) -> Optional[str]:
+        """
+        Detect the spoken language once per job from the first LANGUAGE_DETECTION_SECONDS of speech.
+        
+        :param transcriber: Reused when the caller already has one.
+        :return: Language code, or None when pinning is disabled or there is no speech.
+        """
+        seconds = self.app_settings.LANGUAGE_DETECTION_SECONDS
+        if seconds <= 0:
+            return None
+        pieces, collected = [], 0.0
+        for turn in sorted((turn for turn, _ in diarization.itertracks()), key=lambda turn: turn.start):
+            if collected >= seconds:
+                break
+            end = min(turn.end, turn.start + seconds - collected)
+            pieces.append(audio.slice(turn.start, end))
+            collected += end - turn.start
+        if collected < 1.0:
+            return None
+
+        sample = np.concatenate(pieces)
+        if self.app_settings.TRANSCRIPTION_MODE == "parallel" and transcriber is None:
+            language, probability = ParallelTranscription(
+                workers=self.app_settings.ASR_PROCESS_WORKERS,
+                threads_per_worker=self.app_settings.ASR_THREADS_PER_WORKER
+            ).detect_language(sample)
+        else:
+            transcriber = transcriber or AudioTranscription(audio, replica=replica)
+            language, probability = transcriber.detect_language(sample)
+        self.logger.info(f"Pinned language {language} (p={probability:.2f}) from {collected:.0f}s of speech")
+        return language
+
+    def transcribe_turns(self, transcriber: AudioTranscription, diarization, progress: Optional[JobProgress] = None,
+                         consolidate: Optional[bool] = None) -> List[Dict]:
+        """
+        Transcribe each diarization turn with its own whisper call.
+        
+        :param consolidate: Group turns first (transcribe_consolidated), TURN_CONSOLIDATION_ENABLED if None.
+        """
+        progress = progress or JobProgress()
+        if consolidate is None:
+            consolidate = self.app_settings.TURN_CONSOLIDATION_ENABLED
+        if consolidate:
+            return self.transcribe_consolidated(transcriber, diarization, progress)
+        total = len(list(diarization.itertracks()))
         text_data = []
         for turn, _, speaker in diarization.itertracks(yield_label=True):
             audio_segment = transcriber.extract_segments(turn.start, turn.end)
@@ -48,15 +293,88 @@ class AudioDiarization(BaseService):
                 'end': turn.end,
                 'text': text
             })
-        
-        if save_csv:
-            csv_handler = CSVHandler(output_path=self.output_path)
-            csv_path = csv_handler.save_to_csv(diarization, text_data, audio_file)
-            self.logger.info(f"Diarization results saved to CSV: {csv_path}")
-            print(f"Diarization results saved to CSV: {csv_path}")
-        
-        return diarization, text_data, csv_path
-    
+            progress.update("transcription", done=len(text_data), total=total)
+        return text_data
+
+    def transcribe_consolidated(self, transcriber: AudioTranscription, diarization, progress: Optional[JobProgress] = None) -> List[Dict]:
+        """
+        Transcribe merged groups of turns with word timestamps and split the words back onto the original turns.
+        """
+        progress = progress or JobProgress()
+        turns = [(turn.start, turn.end, speaker) for turn, _, speaker in diarization.itertracks(yield_label=True)]
+        groups = TurnConsolidator(
+            merge_gap_seconds=self.app_settings.TURN_MERGE_GAP_SECONDS,
+            min_duration_seconds=self.app_settings.TURN_MIN_DURATION_SECONDS
+        ).group(turns)
+
+        text_data = [{'start': start, 'end': end, 'text': ''} for start, end, _ in turns]
+        aligner = WordAligner()
+        done = 0
+        for group in groups:
+            words = transcriber.transcribe_span_words(group.start, group.end)
+            aligned = aligner.align(words, [turns[i][:2] for i in group.indices])
+            for index, row in zip(group.indices, aligned):
+                text_data[index]['text'] = row['text']
+            done += len(group.indices)
+            progress.update("transcription", done=done, total=len(turns))
+
+        dropped = len(turns) - sum(len(group.indices) for group in groups)
+        self.logger.info(
+            f"Turn consolidation: {len(groups)} ASR calls for {len(turns)} turns "
+            f"({len(turns) - len(groups)} calls removed, {dropped} short turns dropped)"
+        )
+        progress.update(
+            "transcription", done=len(turns), total=len(turns),
+            asr_calls=len(groups), asr_calls_removed=len(turns) - len(groups)
+        )
+        return text_data
+
+    def transcribe_whole_file(self, transcriber: AudioTranscription, diarization) -> List[Dict]:
+        """
+        Transcribe the recording once with word timestamps and join the words onto the turns.
+        """
+        words = transcriber.transcribe_words()
+        turns = [(turn.start, turn.end) for turn, _ in diarization.itertracks()]
+        return WordAligner().align(words, turns)
+
+    def transcribe_batched(self, transcriber: AudioTranscription, diarization, progress: Optional[JobProgress] = None) -> List[Dict]:
+        """
+        Transcribe all turns through the batching engine, results come back in turn order.
+        """
+        progress = progress or JobProgress()
+        turns = [(turn.start, turn.end) for turn, _ in diarization.itertracks()]
+        engine = BatchTranscription(transcriber, batch_size=self.app_settings.WHISPER_BATCH_SIZE)
+        texts = engine.transcribe(
+            turns,
+            on_progress=lambda done: progress.update("transcription", done=done, total=len(turns))
+        )
+        return [
+            {'start': start, 'end': end, 'text': text}
+            for (start, end), text in zip(turns, texts)
+        ]
+
+    def transcribe_parallel(self, audio: DecodedAudio, diarization, progress: Optional[JobProgress] = None,
+                            language: Optional[str] = None) -> List[Dict]:
+        """
+        Transcribe all turns on the CPU process pool, results come back in turn order.
+        """
+        progress = progress or JobProgress()
+        turns = [(turn.start, turn.end) for turn, _ in diarization.itertracks()]
+        engine = ParallelTranscription(
+            workers=self.app_settings.ASR_PROCESS_WORKERS,
+            threads_per_worker=self.app_settings.ASR_THREADS_PER_WORKER
+        )
+        texts = engine.transcribe(
+            audio,
+            turns,
+            on_progress=lambda done: progress.update("transcription", done=done, total=len(turns)),
+            language=language
+        )
+        return [
+            {'start': start, 'end': end, 'text': text}
+            for (start, end), text in zip(turns, texts)
+        ]
+
     def get_speaker_timeline(self, diarization_result):
         """
         Get a chronological timeline of speaker segments.
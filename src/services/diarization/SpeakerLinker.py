@@ -0,0 +1,78 @@
+from typing import Dict, List, Tuple
+import numpy as np
+
+
+class SpeakerLinker:
+    """
+    Maps the speaker labels of independently diarized pieces of audio onto
+    one stable SPEAKER_xx labelling.
+
+    Every global speaker keeps a duration-weighted centroid of its embeddings.
+    A local speaker joins the most similar global speaker above the cosine
+    similarity threshold, otherwise it becomes a new global speaker. Speakers
+    without a usable embedding (too little speech) never create a global
+    speaker: they are attributed to the piece's main speaker.
+    """
+    def __init__(self, threshold: float = 0.5):
+        self.threshold = threshold
+        self.centroids: List[np.ndarray] = []
+        self.weights: List[float] = []
+
+    def link(self, embeddings: Dict[str, Tuple[np.ndarray, float]]) -> Dict[str, str]:
+        """
+        Assign global labels to the speakers of one piece of audio.
+
+        :param embeddings: Local label -> (embedding, seconds of speech).
+        :return: Local label -> global label. A speaker without an embedding is
+            missing when no global speaker exists yet, callers drop its turns.
+        """
+        mapping = {}
+        taken = set()
+        unembedded = []
+        # Longest speakers first, they have the most reliable embeddings
+        for label, (embedding, seconds) in sorted(embeddings.items(), key=lambda item: -item[1][1]):
+            vector = np.asarray(embedding, dtype=np.float64).ravel()
+            norm = np.linalg.norm(vector)
+            if not np.isfinite(norm) or norm == 0:
+                unembedded.append(label)
+                continue
+            vector = vector / norm
+
+            best, best_similarity = None, self.threshold
+            for index, centroid in enumerate(self.centroids):
+                # Two local speakers of the same piece are never the same person
+                if index in taken:
+                    continue
+                similarity = float(np.dot(vector, centroid / np.linalg.norm(centroid)))
+                if similarity >= best_similarity:
+                    best, best_similarity = index, similarity
+
+            if best is None:
+                mapping[label] = self._add(vector, seconds)
+                best = len(self.centroids) - 1
+            else:
+                total = self.weights[best] + seconds
+                self.centroids[best] = (self.centroids[best] * self.weights[best] + vector * seconds) / max(total, 1e-9)
+                self.weights[best] = total
+                mapping[label] = self.label(best)
+            taken.add(best)
+
+        if unembedded and self.centroids:
+            # The piece's longest speaker, or the longest speaker so far when no speaker of the piece has an embedding
+            main = next(iter(mapping.values()), None) or self.label(int(np.argmax(self.weights)))
+            for label in unembedded:
+                mapping[label] = main
+        return mapping
+
+    @property
+    def speaker_count(self) -> int:
+        return len(self.centroids)
+
+    @staticmethod
+    def label(index: int) -> str:
+        return f"SPEAKER_{index:02d}"
+
+    def _add(self, vector, seconds: float) -> str:
+        self.centroids.append(vector)
+        self.weights.append(seconds)
+        return self.label(len(self.centroids) - 1)
@@ -0,0 +1,64 @@
+from typing import List, NamedTuple, Tuple
+import bisect
+
+
+class TurnGroup(NamedTuple):
+    start: float
+    end: float
+    speaker: str
+    # Positions of the original turns transcribed by this group
+    indices: List[int]
+
+
+class TurnConsolidator:
+    """
+    Groups diarization turns so several of them share one ASR call.
+
+    Consecutive turns of the same speaker closer than merge_gap_seconds are
+    merged. Turns shorter than min_duration_seconds are attached to the
+    closest group within merge_gap_seconds, or dropped when there is none.
+    The original turns are kept: each group is transcribed with word
+    timestamps and its words are split back onto its turns.
+    """
+    def __init__(self, merge_gap_seconds: float = 0.5, min_duration_seconds: float = 0.3, max_group_seconds: float = 30.0):
+        self.merge_gap_seconds = merge_gap_seconds
+        self.min_duration_seconds = min_duration_seconds
+        # Whisper's window, a group is decoded in a single pass
+        self.max_group_seconds = max_group_seconds
+
+    def group(self, turns: List[Tuple[float, float, str]]) -> List[TurnGroup]:
+        """
+        :param turns: (start, end, speaker) in diarization order.
+        :return: Groups ordered by start, turns in no group are dropped.
+        """
+        groups: List[List] = []
+        short = []
+        for index, (start, end, speaker) in enumerate(turns):
+            if end - start < self.min_duration_seconds:
+                short.append(index)
+                continue
+            last = groups[-1] if groups else None
+            if (last and last[2] == speaker and start - last[1] < self.merge_gap_seconds
+                    and max(end, last[1]) - last[0] <= self.max_group_seconds):
+                last[1] = max(last[1], end)
+                last[3].append(index)
+            else:
+                groups.append([start, end, speaker, [index]])
+
+        groups.sort(key=lambda group: group[0])
+        starts = [group[0] for group in groups]
+        for index in short:
+            start, end, speaker = turns[index]
+            position = bisect.bisect_left(starts, start)
+            candidates = [groups[i] for i in (position - 1, position) if 0 <= i < len(groups)]
+            # Closest group first, the same speaker wins a tie
+            candidates.sort(key=lambda group: (max(group[0] - end, start - group[1], 0.0), group[2] != speaker))
+            for group in candidates:
+                distance = max(group[0] - end, start - group[1], 0.0)
+                span = max(group[1], end) - min(group[0], start)
+                if distance < self.merge_gap_seconds and span <= self.max_group_seconds:
+                    group[0], group[1] = min(group[0], start), max(group[1], end)
+                    group[3].append(index)
+                    break
+
+        return [TurnGroup(start, end, speaker, sorted(indices)) for start, end, speaker, indices in groups]
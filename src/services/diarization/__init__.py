@@ -1 +1,3 @@
-from .AudioDiarization import AudioDiarization
\ No newline at end of file
+from .AudioDiarization import AudioDiarization
+from .SpeakerLinker import SpeakerLinker
+from .TurnConsolidator import TurnConsolidator
\ No newline at end of file
@@ -15,11 +15,7 @@ class DownloadAudio(AbstractAudioHandler):
                 #'cookiesfrombrowser': ('chrome',),
                 'format': 'bestaudio/best',
                 'outtmpl': str(self.download_dir / '%(title)s.%(ext)s'),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
+                # Kept in the source codec, the job transcodes it once to the canonical format
                 "socket_timeout": 60,
                 "retries": 10,
                 "quiet": False
@@ -28,13 +24,12 @@ class DownloadAudio(AbstractAudioHandler):
             with YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(video_url, download=True)
                 filename = Path(ydl.prepare_filename(info))
-                mp3_filename = filename.with_suffix('.mp3')
-                self.logger.info(f"Downloaded audio file: {mp3_filename}")
+                self.logger.info(f"Downloaded audio file: {filename}")
                 
                 return {
                     "status": "success",
-                    "file_path": str(mp3_filename),
-                    "filename": mp3_filename.name
+                    "file_path": str(filename),
+                    "filename": filename.name
                 }
                 
         except Exception as e:
@@ -0,0 +1,46 @@
+from .AbstractAudioHandler import AbstractAudioHandler
+from fastapi import UploadFile
+from pathlib import Path
+import hashlib
+import asyncio
+import uuid
+import os
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class StreamingIngest(AbstractAudioHandler):
+    """
+    Saves an uploaded file with bounded memory and hashes it on the way.
+
+    The upload is streamed in chunks to a uniquely named temporary file next
+    to the destination and renamed once complete, so readers never see a
+    partial file and concurrent uploads never share one.
+    """
+    async def handle(self, file: UploadFile, destination: Path) -> dict:
+        """
+        Store the upload at destination.
+        
+        :param file: Incoming upload.
+        :param destination: Final path of the stored file.
+        :return: dict with file_path, content_hash and bytes.
+        """
+        return await asyncio.to_thread(self._store, file.file, Path(destination))
+
+    def _store(self, source, destination: Path) -> dict:
+        partial = destination.with_name(f".{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(partial, "wb") as buffer:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    buffer.write(chunk)
+                    size += len(chunk)
+            os.replace(partial, destination)
+        except Exception:
+            if partial.exists():
+                partial.unlink()
+            raise
+        self.logger.info(f"Streamed upload to {destination} ({size} bytes)")
+        return {"file_path": str(destination), "content_hash": digest.hexdigest(), "bytes": size}
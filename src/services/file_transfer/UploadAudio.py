@@ -1,13 +1,19 @@
 from .AbstractAudioHandler import AbstractAudioHandler
+from .StreamingIngest import StreamingIngest
+from src.services.audio.AudioProbe import audio_probe
+from src.helpers import unique_upload_name
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
+import asyncio
+import os
 
 class UploadAudio(AbstractAudioHandler):
     def __init__(self):
         super().__init__()
         self.uploaded_audios_path = Path(self.base_service.uploaded_audios_path)
+        self.ingest = StreamingIngest()
 
-    def handle(self, file: UploadFile) -> dict:
+    async def handle(self, file: UploadFile) -> dict:
         if not file.filename or not file.filename.lower().endswith('.mp3'):
             raise HTTPException(
                 status_code=400,
@@ -15,29 +21,32 @@ class UploadAudio(AbstractAudioHandler):
             )
 
         try:
-            destination = self.uploaded_audios_path / file.filename
-            
-            if destination.exists():
-                self.logger.info(f"File already exists: {destination}")
-                return {
-                    "status": "success",
-                    "message": "File already exists",
-                    "file_path": str(destination),
-                    "filename": file.filename
-                }
-
-            with open(destination, "wb") as buffer:
-                buffer.write(file.file.read())
+            # Unique names, concurrent uploads of the same file name must not share files;
+            # repeated recordings are recognised by content in the result cache
+            destination = self.uploaded_audios_path / unique_upload_name(file.filename)
+            staged = destination.with_name(f".{destination.name}.upload")
+            stored = await self.ingest.handle(file, staged)
+            content_hash = stored["content_hash"]
 
+            try:
+                await asyncio.to_thread(audio_probe.validate, str(staged), content_hash)
+            except HTTPException:
+                os.remove(staged)
+                raise
+            os.replace(staged, destination)
             return {
                 "status": "success",
                 "file_path": str(destination),
-                "filename": file.filename
+                "filename": destination.name,
+                "content_hash": content_hash,
+                "bytes": stored["bytes"]
             }
             
+        except HTTPException:
+            raise
         except Exception as e:
             self.logger.error(f"Error uploading file: {e}")
             raise HTTPException(
                 status_code=500,
                 detail=f"File upload failed: {str(e)}"
-            )
\ No newline at end of file
+            )
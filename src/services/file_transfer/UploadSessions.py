@@ -0,0 +1,239 @@
+from src.services.BaseService import BaseService
+from src.services.cache.ResultCache import hash_file
+from src.services.audio.AudioProbe import audio_probe
+from src.helpers import unique_upload_name
+from fastapi import HTTPException
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import threading
+import hashlib
+import shutil
+import uuid
+import json
+import time
+import os
+
+
+class UploadSessions(BaseService):
+    """
+    Resumable uploads for long recordings.
+
+    A session owns a preallocated data file under assets/upload_sessions/<id>/.
+    Clients PUT checksummed byte ranges in any order, can ask which ranges
+    already arrived after a dropped connection, and finalize once the whole
+    file is present. Sessions untouched for longer than ttl_seconds are removed.
+    """
+    def __init__(self, ttl_seconds: float, max_chunk_bytes: int, max_upload_bytes: int):
+        super().__init__()
+        self.sessions_dir = self.ensure_path("upload_sessions")
+        self.ttl_seconds = ttl_seconds
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_upload_bytes = max_upload_bytes
+        # Guards meta.json updates only, never held during file-sized work
+        self._lock = threading.Lock()
+
+    def create(self, filename: str, size: int, source_type: str, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Open a new upload session.
+
+        :param filename: Original file name, kept for the stored file.
+        :param size: Total size of the file in bytes.
+        :param source_type: SourceType value the finished upload is processed as.
+        :param metadata: Extra fields handed back on finalize (platform, timestamp, ...).
+        :return: Session state.
+        """
+        if size <= 0:
+            raise HTTPException(status_code=400, detail="Upload size must be positive")
+        if size > self.max_upload_bytes:
+            raise HTTPException(status_code=413, detail=f"Uploads are limited to {self.max_upload_bytes} bytes")
+        self.cleanup_expired()
+
+        upload_id = uuid.uuid4().hex
+        session_dir = os.path.join(self.sessions_dir, upload_id)
+        os.makedirs(session_dir)
+        with open(self._data_path(upload_id), "wb") as f:
+            f.truncate(size)
+
+        now = time.time()
+        meta = {
+            "upload_id": upload_id,
+            "filename": Path(filename).name,
+            "size": size,
+            "source_type": source_type,
+            "metadata": metadata or {},
+            "received": [],
+            "finalizing": False,
+            "created": now,
+            "updated": now,
+        }
+        self._save_meta(meta)
+        self.logger.info(f"Created upload session {upload_id} for {meta['filename']} ({size} bytes)")
+        return self._state(meta)
+
+    def write_chunk(self, upload_id: str, start: int, data: bytes, checksum: str) -> Dict:
+        """
+        Store the bytes [start, start + len(data)) of the upload.
+
+        :param checksum: Hex SHA-256 of data, the chunk is rejected on mismatch.
+        :return: Session state with the received ranges.
+        """
+        if len(data) > self.max_chunk_bytes:
+            raise HTTPException(status_code=413, detail=f"Chunks are limited to {self.max_chunk_bytes} bytes")
+        if hashlib.sha256(data).hexdigest() != checksum.lower():
+            raise HTTPException(status_code=422, detail="Chunk checksum mismatch")
+
+        meta = self._load_meta(upload_id)
+        if meta.get("finalizing"):
+            raise HTTPException(status_code=409, detail="Upload is being finalized")
+        end = start + len(data)
+        if start < 0 or end > meta["size"]:
+            raise HTTPException(status_code=416, detail=f"Range {start}-{end} outside of upload size {meta['size']}")
+
+        fd = os.open(self._data_path(upload_id), os.O_WRONLY)
+        try:
+            os.pwrite(fd, data, start)
+        finally:
+            os.close(fd)
+
+        # Chunks of one session may arrive concurrently
+        with self._lock:
+            meta = self._load_meta(upload_id)
+            meta["received"] = self._merge(meta["received"] + [[start, end]])
+            meta["updated"] = time.time()
+            self._save_meta(meta)
+        return self._state(meta)
+
+    def status(self, upload_id: str) -> Dict:
+        return self._state(self._load_meta(upload_id))
+
+    def finalize(self, upload_id: str, submit: Callable[[Dict], str]) -> Dict:
+        """
+        Move a complete upload next to regular uploads or recorded meetings, hand it to submit
+        and close the session once submit has accepted it.
+
+        :param submit: Called with the stored file (see below), returns the job id. When it raises,
+            the file goes back into the session and the client can finalize again.
+        :return: dict with file_path, content_hash, bytes, source_type, metadata and job_id.
+        """
+        # Claim the session under the lock, hash and probe the file outside of it
+        with self._lock:
+            meta = self._load_meta(upload_id)
+            state = self._state(meta)
+            if not state["complete"]:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Upload incomplete: {state['received_bytes']} of {meta['size']} bytes received"
+                )
+            if meta.get("finalizing"):
+                raise HTTPException(status_code=409, detail="Upload is already being finalized")
+            meta["finalizing"] = True
+            self._save_meta(meta)
+
+        session_dir = os.path.join(self.sessions_dir, upload_id)
+        data_path = self._data_path(upload_id)
+        try:
+            content_hash = hash_file(data_path)
+            audio_probe.validate(data_path, content_hash)
+        except HTTPException:
+            shutil.rmtree(session_dir, ignore_errors=True)
+            raise
+        except Exception:
+            self._release(meta)
+            raise
+
+        destination_dir = self.recorded_meetings_path if meta["source_type"] == "RECORDED" else self.uploaded_audios_path
+        destination = Path(destination_dir) / unique_upload_name(meta["filename"])
+        stored = {
+            "file_path": str(destination),
+            "content_hash": content_hash,
+            "bytes": meta["size"],
+            "source_type": meta["source_type"],
+            "metadata": meta["metadata"],
+        }
+        os.replace(data_path, destination)
+        try:
+            stored["job_id"] = submit(stored)
+        except Exception:
+            # Queue full or the job could not be stored, keep the upload for a retry
+            os.replace(destination, data_path)
+            self._release(meta)
+            raise
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+        self.logger.info(f"Finalized upload session {upload_id} into {destination}")
+        return stored
+
+    def abort(self, upload_id: str):
+        self._load_meta(upload_id)
+        shutil.rmtree(os.path.join(self.sessions_dir, upload_id), ignore_errors=True)
+        self.logger.info(f"Aborted upload session {upload_id}")
+
+    def cleanup_expired(self) -> int:
+        """Delete sessions not touched within the TTL, returns how many were removed."""
+        removed = 0
+        for upload_id in os.listdir(self.sessions_dir):
+            meta_path = os.path.join(self.sessions_dir, upload_id, "meta.json")
+            try:
+                with open(meta_path) as f:
+                    updated = json.load(f)["updated"]
+            except (OSError, ValueError, KeyError):
+                updated = os.path.getmtime(os.path.join(self.sessions_dir, upload_id))
+            if time.time() - updated > self.ttl_seconds:
+                shutil.rmtree(os.path.join(self.sessions_dir, upload_id), ignore_errors=True)
+                removed += 1
+        if removed:
+            self.logger.info(f"Removed {removed} expired upload sessions")
+        return removed
+
+    def _state(self, meta: Dict) -> Dict:
+        received_bytes = sum(end - start for start, end in meta["received"])
+        return {
+            "upload_id": meta["upload_id"],
+            "filename": meta["filename"],
+            "size": meta["size"],
+            "received": meta["received"],
+            "received_bytes": received_bytes,
+            "complete": meta["received"] == [[0, meta["size"]]],
+            "max_chunk_bytes": self.max_chunk_bytes,
+            "expires_at": meta["updated"] + self.ttl_seconds,
+        }
+
+    def _release(self, meta: Dict):
+        # Undo the finalize claim so the client can retry
+        with self._lock:
+            meta["finalizing"] = False
+            meta["updated"] = time.time()
+            self._save_meta(meta)
+
+    def _merge(self, ranges: List[List[int]]) -> List[List[int]]:
+        merged: List[List[int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+
+    def _data_path(self, upload_id: str) -> str:
+        return os.path.join(self.sessions_dir, upload_id, "data")
+
+    def _load_meta(self, upload_id: str) -> Dict:
+        meta_path = os.path.join(self.sessions_dir, upload_id, "meta.json")
+        if not upload_id.isalnum():
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        if time.time() - meta["updated"] > self.ttl_seconds:
+            shutil.rmtree(os.path.dirname(meta_path), ignore_errors=True)
+            raise HTTPException(status_code=410, detail="Upload session expired")
+        return meta
+
+    def _save_meta(self, meta: Dict):
+        meta_path = os.path.join(self.sessions_dir, meta["upload_id"], "meta.json")
+        staging_path = f"{meta_path}.tmp"
+        with open(staging_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(staging_path, meta_path)
@@ -1,2 +1,4 @@
 from .DownloadAudio import DownloadAudio
-from .UploadAudio import UploadAudio
\ No newline at end of file
+from .UploadAudio import UploadAudio
+from .StreamingIngest import StreamingIngest
+from .UploadSessions import UploadSessions
\ No newline at end of file
@@ -0,0 +1,185 @@
+from src.services.BaseService import BaseService
+from src.services.audio.DecodedAudio import DecodedAudio
+from src.services.audio.StreamingDecoder import StreamingDecoder
+from src.services.diarization.AudioDiarization import AudioDiarization
+from src.services.diarization.SpeakerLinker import SpeakerLinker
+from src.services.transcription.AudioTranscription import AudioTranscription
+from src.services.transcript.Transcript import Transcript
+from fastapi import HTTPException
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+import numpy as np
+import threading
+import time
+import os
+
+# Same-speaker pieces closer than this are one turn cut by a window boundary
+MERGE_GAP_SECONDS = 0.5
+
+
+class LiveSession(BaseService):
+    """
+    Incremental processing of a meeting while it is being recorded.
+
+    Audio chunks are appended to the recording on disk and decoded as they
+    arrive. Every window_seconds of new audio is diarized and transcribed,
+    together with context_seconds of the previous window so turns crossing
+    the boundary keep their speaker. Window-local speakers are mapped onto
+    stable labels with a SpeakerLinker, and the transcript grows turn by turn.
+    """
+    def __init__(self,
+                 session_id: str,
+                 diarization: AudioDiarization,
+                 extension: str = "webm",
+                 window_seconds: float = 30.0,
+                 context_seconds: float = 5.0,
+                 link_threshold: float = 0.5,
+                 replica: int = 0,
+                 diarization_device: Optional[Callable[[], ContextManager[Optional[str]]]] = None,
+                 metadata: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self.session_id = session_id
+        self.diarization = diarization
+        self.window_seconds = window_seconds
+        self.context_seconds = context_seconds
+        self.replica = replica
+        # Lease of a diarization device, held while pyannote runs on a window
+        self.diarization_device = diarization_device or (lambda: nullcontext(None))
+        self.metadata = metadata or {}
+        self.recording_path = os.path.join(self.recorded_meetings_path, f"live_{session_id}.{extension}")
+        self.linker = SpeakerLinker(threshold=link_threshold)
+        self.decoder = StreamingDecoder()
+        self.segments: List[Dict[str, Any]] = []
+        # Detected on the first window with speech, then fixed for the session
+        self.language: Optional[str] = None
+        self.next_seq = 0
+        self.closed = False
+        self.error: Optional[str] = None
+        self.last_activity = time.time()
+
+        # Decoded audio not yet processed, preceded by the context kept from the last window
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._pending_offset = 0.0
+        self._context = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def processed_seconds(self) -> float:
+        return self._pending_offset + self._context
+
+    def append(self, seq: int, data: bytes) -> bool:
+        """
+        Add the chunk with sequence number seq to the recording.
+
+        :return: False if the chunk was already received (client retry).
+        """
+        with self._lock:
+            if self.closed:
+                raise HTTPException(status_code=409, detail="Live session already finished")
+            if seq < self.next_seq:
+                return False
+            if seq > self.next_seq:
+                raise HTTPException(status_code=409, detail=f"Expected chunk {self.next_seq}, got {seq}")
+            size = os.path.getsize(self.recording_path) if os.path.exists(self.recording_path) else 0
+            with open(self.recording_path, "ab") as f:
+                f.write(data)
+            try:
+                self.decoder.feed(data)
+            except Exception:
+                # next_seq stays, the client resends this chunk: drop it from the recording
+                os.truncate(self.recording_path, size)
+                raise
+            self.next_seq += 1
+            self.last_activity = time.time()
+        return True
+
+    def close(self):
+        """Stop accepting chunks, the remaining audio is processed by advance(final=True)."""
+        with self._lock:
+            self.closed = True
+
+    def advance(self, final: bool = False):
+        """
+        Process every complete window decoded so far, and the remainder when final.
+        Called from a single worker thread per session.
+        """
+        samples = self.decoder.close() if final else self.decoder.take()
+        self._pending = np.concatenate([self._pending, samples])
+        sample_rate = self.decoder.sample_rate
+        window = int((self._context + self.window_seconds) * sample_rate)
+
+        while len(self._pending) >= window or (final and len(self._pending) > self._context * sample_rate):
+            chunk = self._pending[:window]
+            self._process_window(chunk)
+            chunk_seconds = len(chunk) / sample_rate
+            context = min(self.context_seconds, chunk_seconds)
+            keep_from = len(chunk) - int(context * sample_rate)
+            self._pending = self._pending[keep_from:]
+            self._pending_offset += keep_from / sample_rate
+            self._context = context
+            if final and len(chunk) < window:
+                break
+
+    def transcript(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "processed_seconds": round(self.processed_seconds, 2),
+            "speakers": self.linker.speaker_count,
+            "language": self.language,
+            "segments": list(self.segments),
+            "error": self.error,
+        }
+
+    def save_csv(self) -> str:
+        """Write the transcript in the diarization CSV format used by the rest of the pipeline."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(self.diarization_output_path, f"live_{self.session_id}_diarization_{timestamp}.csv")
+        Transcript.from_rows(self.segments).to_csv(csv_path)
+        self.logger.info(f"Live transcript saved to: {csv_path}")
+        return csv_path
+
+    def discard(self):
+        self.decoder.close(timeout=5)
+        if os.path.exists(self.recording_path):
+            os.remove(self.recording_path)
+
+    def _process_window(self, samples: np.ndarray):
+        offset = self._pending_offset
+        new_from = self._context
+        audio = DecodedAudio(samples, source_path=self.recording_path, sample_rate=self.decoder.sample_rate)
+
+        with self.diarization_device() as device:
+            diarization = self.diarization.find_speakers(audio, device=device)
+            embeddings = self.diarization.speaker_embeddings(audio, diarization)
+        mapping = self.linker.link(embeddings)
+        transcriber = AudioTranscription(audio, replica=self.replica, language=self.language)
+        if self.language is None:
+            self.language = transcriber.language = self.diarization.detect_language(audio, diarization, transcriber=transcriber)
+
+        for turn, _, label in diarization.itertracks(yield_label=True):
+            # The context part was transcribed with the previous window
+            if turn.end <= new_from or label not in mapping:
+                continue
+            start = max(turn.start, new_from)
+            text = transcriber.transcribe_segment(transcriber.extract_segments(start, turn.end)).strip()
+            self._add_segment(offset + start, offset + turn.end, mapping[label], text)
+        self.logger.info(
+            f"Live session {self.session_id}: processed up to {offset + audio.duration:.1f}s, "
+            f"{len(self.segments)} turns, {self.linker.speaker_count} speakers"
+        )
+
+    def _add_segment(self, start: float, end: float, speaker: str, text: str):
+        last = self.segments[-1] if self.segments else None
+        if last and last["speaker"] == speaker and start - last["end"] <= MERGE_GAP_SECONDS:
+            last["end"] = max(last["end"], end)
+            last["duration"] = last["end"] - last["start"]
+            last["text"] = f"{last['text']} {text}".strip()
+            return
+        self.segments.append({
+            "start": start,
+            "end": end,
+            "duration": end - start,
+            "speaker": speaker,
+            "text": text
+        })
@@ -0,0 +1 @@
+from .LiveSession import LiveSession
\ No newline at end of file
@@ -0,0 +1,206 @@
+from src.core import get_settings
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+import threading
+import logging
+import time
+import torch
+
+
+class ModelKey(NamedTuple):
+    kind: str
+    name: str
+    device: str
+    precision: str
+    # Independent copies of the same model for callers that cannot share one instance
+    replica: int = 0
+
+
+class LoadedModel:
+    def __init__(self, model: Any, memory_bytes: int, load_seconds: float):
+        self.model = model
+        self.memory_bytes = memory_bytes
+        self.load_seconds = load_seconds
+        self.last_used = time.time()
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded models.
+
+    Models are loaded lazily on first request, exactly once per
+    (kind, name, device, precision) even under concurrent requests, and kinds
+    with a configured limit are evicted least-recently-used first.
+    """
+    def __init__(self, max_models_per_kind: Optional[Dict[str, int]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_models_per_kind = max_models_per_kind or {}
+        self._models: "OrderedDict[ModelKey, LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+
+    @staticmethod
+    def default_device() -> str:
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    def get(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """
+        Return the model stored under key, loading it with loader on first use.
+        
+        :param key: Identity of the model.
+        :param loader: Callable building the model, only called on a miss.
+        :return: The loaded model.
+        """
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None:
+                self._models.move_to_end(key)
+                entry.last_used = time.time()
+                return entry.model
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Load outside the global lock so different models can load in parallel
+        with key_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    return entry.model
+
+            self.logger.info(f"Loading model {key}")
+            started = time.perf_counter()
+            cuda_before = self._cuda_allocated(key.device)
+            model = loader()
+            load_seconds = time.perf_counter() - started
+            memory_bytes = self._cuda_allocated(key.device) - cuda_before or self._estimate_memory(model)
+
+            with self._lock:
+                self._models[key] = LoadedModel(model, memory_bytes, load_seconds)
+                self._evict_over_limit(key.kind)
+            self.logger.info(f"Loaded model {key} in {load_seconds:.1f}s using {memory_bytes / 2**20:.0f} MiB")
+            return model
+
+    def get_whisper(self, name: str, device: Optional[str] = None, precision: Optional[str] = None, replica: int = 0):
+        """Return a shared openai-whisper model.
+        Whisper's decoder installs hooks on the model per call, so concurrent
+        callers must each use their own replica."""
+        device = device or self.default_device()
+        precision = precision or ("fp16" if device.startswith("cuda") else "fp32")
+
+        def load():
+            import whisper
+            return whisper.load_model(name, device=device)
+        return self.get(ModelKey("whisper", name, device, precision, replica), load)
+
+    def get_faster_whisper(self, name: str, device: Optional[str] = None, compute_type: str = "int8",
+                           cpu_threads: int = 0, replica: int = 0):
+        """Return a shared faster-whisper (CTranslate2) model.
+        cpu_threads=0 lets CTranslate2 pick, callers running several replicas should split the cores."""
+        device = device or self.default_device()
+
+        def load():
+            from faster_whisper import WhisperModel
+            return WhisperModel(name, device=device.split(":")[0], compute_type=compute_type, cpu_threads=cpu_threads)
+        return self.get(ModelKey("faster_whisper", name, device, compute_type, replica), load)
+
+    def get_diarization_pipeline(self, name: str, device: Optional[str] = None):
+        """Return a shared pyannote diarization pipeline."""
+        device = device or self.default_device()
+
+        def load():
+            from pyannote.audio import Pipeline
+            pipeline = Pipeline.from_pretrained(name, use_auth_token=get_settings().HF_TOKEN)
+            return pipeline.to(torch.device(device))
+        return self.get(ModelKey("diarization", name, device, "fp32"), load)
+
+    def get_speaker_embedding(self, name: str, device: Optional[str] = None):
+        """Return a shared pyannote inference producing one embedding per input clip."""
+        device = device or self.default_device()
+
+        def load():
+            from pyannote.audio import Inference, Model
+            model = Model.from_pretrained(name, use_auth_token=get_settings().HF_TOKEN)
+            return Inference(model, window="whole", device=torch.device(device))
+        return self.get(ModelKey("embedding", name, device, "fp32"), load)
+
+    def evict(self, key: ModelKey) -> bool:
+        """Drop a model from the registry. Returns True if it was loaded."""
+        with self._lock:
+            removed = self._models.pop(key, None) is not None
+        if removed:
+            self._release_device_memory(key.device)
+            self.logger.info(f"Evicted model {key}")
+        return removed
+
+    def loaded(self) -> List[Dict[str, Any]]:
+        """Describe every loaded model with its memory footprint."""
+        with self._lock:
+            return [
+                {
+                    **key._asdict(),
+                    "memory_mb": round(entry.memory_bytes / 2**20, 1),
+                    "load_seconds": round(entry.load_seconds, 2),
+                    "last_used": entry.last_used,
+                }
+                for key, entry in self._models.items()
+            ]
+
+    def total_memory_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.memory_bytes for entry in self._models.values())
+
+    def _evict_over_limit(self, kind: str):
+        # Called with self._lock held, the OrderedDict is kept in LRU order.
+        # Replicas of one model count once against the limit.
+        limit = self.max_models_per_kind.get(kind)
+        if not limit:
+            return
+        groups = []
+        for key in self._models:
+            group = key._replace(replica=0)
+            if key.kind == kind and group not in groups:
+                groups.append(group)
+        for group in groups[:max(0, len(groups) - limit)]:
+            for key in [k for k in self._models if k._replace(replica=0) == group]:
+                self._models.pop(key)
+                self._release_device_memory(key.device)
+                self.logger.info(f"Evicted least recently used model {key}")
+
+    def _cuda_allocated(self, device: str) -> int:
+        if device.startswith("cuda") and torch.cuda.is_available():
+            return torch.cuda.memory_allocated(torch.device(device))
+        return 0
+
+    def _release_device_memory(self, device: str):
+        if device.startswith("cuda") and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _estimate_memory(self, model: Any) -> int:
+        """Sum parameter and buffer bytes of every torch module reachable from model."""
+        modules = []
+        if isinstance(model, torch.nn.Module):
+            modules.append(model)
+        else:
+            # pyannote pipelines keep their sub-models as plain attributes
+            for value in list(vars(model).values()) + list(getattr(model, "_models", {}).values()):
+                if isinstance(value, torch.nn.Module):
+                    modules.append(value)
+                elif isinstance(getattr(value, "model", None), torch.nn.Module):
+                    modules.append(value.model)
+
+        seen = set()
+        total = 0
+        for module in modules:
+            for tensor in list(module.parameters()) + list(module.buffers()):
+                if id(tensor) not in seen:
+                    seen.add(id(tensor))
+                    total += tensor.numel() * tensor.element_size()
+        return total
+
+
+model_registry = ModelRegistry(
+    max_models_per_kind={
+        "whisper": get_settings().MAX_LOADED_WHISPER_MODELS,
+        "faster_whisper": get_settings().MAX_LOADED_WHISPER_MODELS,
+    }
+)
@@ -0,0 +1 @@
+from .ModelRegistry import ModelRegistry, ModelKey, model_registry
\ No newline at end of file
@@ -0,0 +1,155 @@
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import asyncio
+import time
+
+STAGES = ["decode", "diarization", "transcription", "analysis", "summarization", "tts", "db_write"]
+
+
+class StageRates:
+    """
+    Moving average of how long each stage takes per second of input audio,
+    learned from finished jobs and used to estimate the time left.
+    """
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+        self._rates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, audio_seconds: float):
+        if audio_seconds <= 0:
+            return
+        rate = seconds / audio_seconds
+        with self._lock:
+            previous = self._rates.get(stage)
+            self._rates[stage] = rate if previous is None else previous + self.smoothing * (rate - previous)
+
+    def estimate(self, stage: str, audio_seconds: float) -> Optional[float]:
+        with self._lock:
+            rate = self._rates.get(stage)
+        return rate * audio_seconds if rate is not None else None
+
+
+class JobProgress:
+    """
+    Stage events of one processing job.
+
+    Stages report from worker threads; subscribers are asyncio queues that
+    receive every event, including the ones emitted before they subscribed.
+    """
+    def __init__(self, job_id: Optional[str] = None, rates: Optional[StageRates] = None):
+        self.job_id = job_id
+        self.rates = rates or StageRates()
+        self.started_at = time.perf_counter()
+        self.audio_seconds: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self.finished = False
+        self._stage_started: Dict[str, float] = {}
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    def start(self, stage: str, **info):
+        self._stage_started[stage] = time.perf_counter()
+        self._emit(stage, "started", **info)
+
+    def update(self, stage: str, done: int, total: int, **info):
+        self._emit(stage, "progress", done=done, total=total, **info)
+
+    def complete(self, stage: str, **info):
+        started = self._stage_started.get(stage)
+        if started is not None and self.audio_seconds:
+            self.rates.record(stage, time.perf_counter() - started, self.audio_seconds)
+        self._emit(stage, "completed", **info)
+
+    def set_audio_duration(self, seconds: float):
+        self.audio_seconds = seconds
+
+    def finish(self, error: Optional[str] = None):
+        """Emit the terminal event and close every subscriber stream."""
+        self._emit("job", "failed" if error else "completed", error=error)
+        with self._lock:
+            self.finished = True
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving past and future events, then None once the job is over."""
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            for event in self.events:
+                queue.put_nowait(event)
+            if self.finished:
+                queue.put_nowait(None)
+            else:
+                self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    def _emit(self, stage: str, status: str, **info):
+        now = time.perf_counter()
+        started = self._stage_started.get(stage)
+        event = {
+            "job_id": self.job_id,
+            "stage": stage,
+            "status": status,
+            "elapsed_seconds": round(now - self.started_at, 2),
+            "stage_elapsed_seconds": round(now - started, 2) if started is not None else None,
+            "eta_seconds": self._eta(stage, status, info),
+            **{k: v for k, v in info.items() if v is not None},
+        }
+        with self._lock:
+            self.events.append(event)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    def _eta(self, stage: str, status: str, info: Dict[str, Any]) -> Optional[float]:
+        if stage not in STAGES or not self.audio_seconds:
+            return None
+        index = STAGES.index(stage)
+        remaining = STAGES[index + 1:] if status == "completed" else STAGES[index:]
+        total = 0.0
+        for name in remaining:
+            estimate = self.rates.estimate(name, self.audio_seconds)
+            if estimate is None:
+                return None
+            if name == stage and status != "completed":
+                # Scale the current stage by its reported progress, or by time already spent
+                done, count = info.get("done"), info.get("total")
+                spent = time.perf_counter() - self._stage_started.get(stage, time.perf_counter())
+                if done is not None and count:
+                    estimate = spent / max(done, 1) * (count - done) if done else estimate
+                else:
+                    estimate = max(estimate - spent, 0.0)
+            total += estimate
+        return round(total, 1)
+
+
+class ProgressHub:
+    """Process-wide lookup of the progress of running and recent jobs."""
+    def __init__(self, keep_finished: int = 200):
+        self.keep_finished = keep_finished
+        self.rates = StageRates()
+        self._jobs: Dict[str, JobProgress] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job_id: str) -> JobProgress:
+        progress = JobProgress(job_id, rates=self.rates)
+        with self._lock:
+            self._jobs[job_id] = progress
+            finished = [key for key, job in self._jobs.items() if job.finished]
+            for key in finished[:max(0, len(finished) - self.keep_finished)]:
+                self._jobs.pop(key, None)
+        return progress
+
+    def get(self, job_id: str) -> Optional[JobProgress]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+progress_hub = ProgressHub()
@@ -0,0 +1 @@
+from .JobProgress import JobProgress, ProgressHub, StageRates, progress_hub
\ No newline at end of file
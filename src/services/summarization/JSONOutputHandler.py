@@ -8,14 +8,13 @@ class JSONOutputHandler:
     def __init__(self, base_service: BaseService):
         self.base_service = base_service
         self.output_path = self.base_service.generated_reports_path
-        self.filename = unique_file_name(file_extension="json")
-        self.filepath = os.path.join(self.output_path, self.filename)
         self.logger = self.base_service.logger
-        self.logger.info(f"JSONOutputHandler initialized with output path: {self.output_path} and filename: {self.filename}")
+        self.logger.info(f"JSONOutputHandler initialized with output path: {self.output_path}")
 
     def save_output(self, data) -> str:
         """
-        Saves data to a JSON file and returns the path to the saved file.
+        Saves data to a new JSON file and returns the path to the saved file.
+        Every call gets its own file, the handler is shared by concurrent jobs.
 
         Args:
             data: The data to save.
@@ -23,10 +22,11 @@ class JSONOutputHandler:
         Raises:
             FileNotFoundError: If the file could not be created.
         """
+        filepath = os.path.join(self.output_path, unique_file_name(file_extension="json"))
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=4)
-                return self.filepath
+                return filepath
         except Exception as e:
             self.logger.error(f"Error saving JSON output: {e}")
-            raise FileNotFoundError(f"Could not create file at {self.filepath}") from e
\ No newline at end of file
+            raise FileNotFoundError(f"Could not create file at {filepath}") from e
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from src.services.BaseService import BaseService
 from src.helpers import unique_file_name
 from pathlib import Path
+from typing import Optional
 import os
 
 class AbstractConverter(ABC):
@@ -9,10 +10,12 @@ class AbstractConverter(ABC):
         self.base_service = base_service or BaseService()
         self.logger = self.base_service.logger
         self.generated_audios_path = Path(self.base_service.generated_audios_path)
-        self.output_filename = unique_file_name(file_extension="mp3")
-        self.audio_path = os.path.join(self.generated_audios_path, self.output_filename)
         self.voice = voice
+
+    def new_audio_path(self) -> str:
+        """Fresh output file for one conversion, a converter is shared by every job"""
+        return os.path.join(self.generated_audios_path, unique_file_name(file_extension="mp3"))
         
     @abstractmethod
-    async def convert(self, text: str) -> str:
+    async def convert(self, text: str, output_path: Optional[str] = None) -> str:
         pass
\ No newline at end of file
@@ -1,16 +1,18 @@
 from .AbstractConverter import AbstractConverter
+from typing import Optional
 import edge_tts
 
 class EnglishConverter(AbstractConverter):
     def __init__(self, base_service=None):
         super().__init__(base_service=base_service, voice="en-GB-RyanNeural")
 
-    async def convert(self, text: str):
+    async def convert(self, text: str, output_path: Optional[str] = None):
+        output_path = output_path or self.new_audio_path()
         try:
             communicate = edge_tts.Communicate(text, self.voice)
-            await communicate.save(self.audio_path)
-            self.logger.info(f"Successfully converted english text into audio and file saved at {self.audio_path}")
-            return self.audio_path
+            await communicate.save(output_path)
+            self.logger.info(f"Successfully converted english text into audio and file saved at {output_path}")
+            return output_path
         except Exception as e:
             self.logger.exception(f"Error while trying to convert english text into audio {e}")
             raise
\ No newline at end of file
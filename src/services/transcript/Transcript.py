@@ -0,0 +1,123 @@
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import csv
+
+
+class Transcript:
+    """
+    Diarized transcript of a job, stored column by column.
+
+    start/end are float64 arrays, speakers are int32 codes into a label table
+    and all turn texts live in one string addressed by an offsets array. One
+    instance is built after transcription and handed in memory to analysis,
+    summarization and formatting; the CSV is only an optional export.
+    """
+    COLUMNS = ["start", "end", "duration", "speaker", "text"]
+
+    def __init__(self, start: np.ndarray, end: np.ndarray, speaker_codes: np.ndarray, speakers: List[str],
+                 text: str, text_offsets: np.ndarray):
+        self.start = start
+        self.end = end
+        self.speaker_codes = speaker_codes
+        self.speakers = speakers
+        self._text = text
+        # Turn i's text is _text[text_offsets[i]:text_offsets[i + 1]]
+        self.text_offsets = text_offsets
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict]) -> "Transcript":
+        """Build from dicts with 'start', 'end', 'speaker' and 'text' keys."""
+        starts, ends, codes, texts = [], [], [], []
+        labels: Dict[str, int] = {}
+        for row in rows:
+            starts.append(row['start'])
+            ends.append(row['end'])
+            codes.append(labels.setdefault(str(row['speaker']), len(labels)))
+            text = row.get('text')
+            # Empty cells come back from pandas as NaN
+            texts.append(text if isinstance(text, str) else '')
+
+        offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in texts], out=offsets[1:])
+        return cls(
+            np.asarray(starts, dtype=np.float64),
+            np.asarray(ends, dtype=np.float64),
+            np.asarray(codes, dtype=np.int32),
+            list(labels),
+            ''.join(texts),
+            offsets
+        )
+
+    @classmethod
+    def from_diarization(cls, diarization, text_data: List[Dict]) -> "Transcript":
+        """
+        Join transcribed text onto the diarization turns.
+
+        :param diarization: pyannote Annotation.
+        :param text_data: {'start', 'end', 'text'} dicts, a turn gets the texts lying inside it.
+        """
+        texts = sorted(text_data, key=lambda item: item['start'])
+        text_starts = [item['start'] for item in texts]
+
+        def inside(turn):
+            first = int(np.searchsorted(text_starts, turn.start, side='left'))
+            matching = []
+            for item in texts[first:]:
+                if item['start'] > turn.end:
+                    break
+                if item['end'] <= turn.end:
+                    matching.append(item['text'])
+            return ' '.join(matching)
+
+        return cls.from_rows(
+            {'start': turn.start, 'end': turn.end, 'speaker': speaker, 'text': inside(turn)}
+            for turn, _, speaker in diarization.itertracks(yield_label=True)
+        )
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> "Transcript":
+        """Read a diarization CSV (live sessions, older jobs)."""
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            return cls.from_rows(
+                {'start': float(row['start']), 'end': float(row['end']), 'speaker': row['speaker'], 'text': row['text']}
+                for row in csv.DictReader(f)
+            )
+
+    def to_csv(self, csv_path: str) -> str:
+        """Export in the diarization CSV format, same columns as before."""
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            for i in range(len(self)):
+                start, end = float(self.start[i]), float(self.end[i])
+                writer.writerow([start, end, end - start, self.speaker(i), self.text(i)])
+        return csv_path
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def duration(self) -> np.ndarray:
+        return self.end - self.start
+
+    def speaker(self, i: int) -> str:
+        return self.speakers[self.speaker_codes[i]]
+
+    def text(self, i: int) -> str:
+        return self._text[self.text_offsets[i]:self.text_offsets[i + 1]]
+
+    def texts(self, limit: Optional[int] = None) -> List[str]:
+        """Text of every turn, or of the first limit turns."""
+        count = len(self) if limit is None else min(limit, len(self))
+        return [self.text(i) for i in range(count)]
+
+    def speaker_labels(self) -> List[str]:
+        """Speaker of every turn."""
+        return [self.speakers[code] for code in self.speaker_codes]
+
+    def speaker_totals(self, values: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Sum of values per speaker, in label order. Counts turns when values is None.
+        """
+        totals = np.bincount(self.speaker_codes, weights=values, minlength=len(self.speakers))
+        return {label: totals[code] for code, label in enumerate(self.speakers)}
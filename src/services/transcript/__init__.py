@@ -0,0 +1 @@
+from .Transcript import Transcript
\ No newline at end of file
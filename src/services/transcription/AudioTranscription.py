@@ -1,41 +1,132 @@
 from src.services.BaseService import BaseService
-from pydub import AudioSegment
+from src.services.audio.DecodedAudio import DecodedAudio
+from .engines import BaseASREngine, WhisperEngine, FasterWhisperEngine
+from typing import Union, List, Dict, Optional, Tuple
+import numpy as np
 import tempfile
-import whisper
+import wave
 import os
 
 class AudioTranscription(BaseService):
-    def __init__(self, audio_path, transcribe_model: str = "base"):
+    def __init__(self, audio: Union[str, DecodedAudio], transcribe_model: Optional[str] = None, in_memory: bool = True,
+                 replica: int = 0, engine: Optional[str] = None, language: Optional[str] = None):
         super().__init__()
 
-        self.audio_path = audio_path
-        self.transcribe_model = whisper.load_model(transcribe_model)
-        self.logger.info(f"Transcription model {transcribe_model} loaded.")
+        self.in_memory = in_memory
+        self.audio = audio if isinstance(audio, DecodedAudio) else DecodedAudio.from_file(audio)
+        self.audio_path = self.audio.source_path
+        # Pinned once per job, whisper otherwise detects the language on every call
+        self.language = language
+        transcribe_model = transcribe_model or self.app_settings.WHISPER_MODEL
+        self.engine = self.create_engine(engine or self.app_settings.ASR_ENGINE, transcribe_model, replica)
+        # Underlying model, BatchTranscription decodes with it directly
+        self.transcribe_model = self.engine.load()
+        self.logger.info(f"Transcription model {transcribe_model} ready ({type(self.engine).__name__}).")
+
+    def create_engine(self, name: str, transcribe_model: str, replica: int = 0) -> BaseASREngine:
+        """
+        Build the ASR engine selected by ASR_ENGINE.
+        """
+        if name == "whisper":
+            return WhisperEngine(self, model=transcribe_model, replica=replica)
+        if name == "faster_whisper":
+            return FasterWhisperEngine(
+                self,
+                model=transcribe_model,
+                replica=replica,
+                compute_type=self.app_settings.ASR_COMPUTE_TYPE,
+                cpu_threads=self.app_settings.ASR_CPU_THREADS
+            )
+        raise ValueError(f"Unknown ASR engine: {name}")
     
     def extract_segments(self, start_time, end_time):
 
         """
-        Extract segments from the audio file.
+        Extract segments from the decoded audio buffer.
         
-        :param start_time: Start time in milliseconds.
-        :param end_time: End time in milliseconds.
-        :return: Extracted audio segment.
+        :param start_time: Start time in seconds.
+        :param end_time: End time in seconds.
+        :return: Extracted audio samples (a view over the shared buffer).
         """
-        audio = AudioSegment.from_file(self.audio_path)
-        return audio[start_time*1000 : end_time*1000]
+        return self.audio.slice(start_time, end_time)
         
-    def transcribe_segment(self, audio_segment):
+    def transcribe_segment(self, audio_segment: np.ndarray):
         """
         Transcribe the given audio segment.
         
-        :param audio_segment: Audio segment to be transcribed.
+        Samples are fed straight into whisper; the temporary WAV path is kept
+        as a fallback when in-memory decoding is disabled or fails.
+        
+        :param audio_segment: Audio samples to be transcribed.
         :return: Transcription result.
         """
+        if self.in_memory:
+            try:
+                return self.transcribe_array(audio_segment)
+            except Exception as e:
+                self.logger.warning(f"In-memory transcription failed, falling back to WAV file: {e}")
+        return self.transcribe_file(audio_segment)
+
+    def transcribe_array(self, audio_segment: np.ndarray) -> str:
+        """
+        Transcribe float32 16 kHz samples without touching the disk.
+        """
+        samples = np.ascontiguousarray(audio_segment, dtype=np.float32)
+        result = self.engine.transcribe(samples, language=self.language)
+        return result['text']
+
+    def transcribe_words(self) -> List[Dict]:
+        """
+        Transcribe the whole recording in one pass with word-level timestamps.
+        
+        :return: List of {'start', 'end', 'word'} dicts on the recording timeline.
+        """
+        words = self.transcribe_span_words(0.0, self.audio.duration)
+        self.logger.info(f"Whole-file transcription produced {len(words)} words.")
+        return words
+
+    def transcribe_span_words(self, start_time: float, end_time: float) -> List[Dict]:
+        """
+        Transcribe part of the recording with word-level timestamps.
+        
+        :return: List of {'start', 'end', 'word'} dicts on the recording timeline.
+        """
+        samples = np.ascontiguousarray(self.extract_segments(start_time, end_time), dtype=np.float32)
+        result = self.engine.transcribe(samples, word_timestamps=True, language=self.language)
+        words = []
+        for segment in result['segments']:
+            for word in segment.get('words', []):
+                words.append({'start': start_time + word['start'], 'end': start_time + word['end'], 'word': word['word']})
+        return words
+
+    def detect_language(self, samples: np.ndarray) -> Tuple[str, float]:
+        """
+        Spoken language of a speech sample (whisper looks at the first 30 s).
+        
+        :return: Language code and its probability.
+        """
+        return self.engine.detect_language(samples)
+
+    def transcribe_file(self, audio_segment: np.ndarray) -> str:
+        """
+        Transcribe by exporting the samples to a temporary WAV file first.
+        """
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            audio_segment.export(f.name, format="wav")
-            result = self.transcribe_model.transcribe(f.name)
+            self._export_wav(f.name, audio_segment)
+            result = self.engine.transcribe(f.name, language=self.language)
         os.remove(f.name)
         return result['text']
+
+    def _export_wav(self, path: str, samples: np.ndarray):
+        """
+        Write float32 samples to a 16-bit mono WAV file.
+        """
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        with wave.open(path, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(self.audio.sample_rate)
+            wav_file.writeframes(pcm.tobytes())
     
     def build_trascript(self, diarization):
         transcript = []
@@ -0,0 +1,82 @@
+from src.services.BaseService import BaseService
+from src.services.transcription.AudioTranscription import AudioTranscription
+from whisper.audio import N_SAMPLES, N_FRAMES, log_mel_spectrogram, pad_or_trim
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+import whisper
+import torch
+import os
+
+class BatchTranscription(BaseService):
+    """
+    Transcribe many short diarization turns by decoding padded mel batches
+    in a single model forward pass instead of one transcribe() call per turn.
+    """
+    def __init__(self, transcriber: AudioTranscription, batch_size: int = 16):
+        super().__init__()
+        self.transcriber = transcriber
+        self.model = transcriber.transcribe_model
+        self.batch_size = max(1, batch_size)
+        self.options = whisper.DecodingOptions(
+            fp16=self.model.device.type == "cuda",
+            language=transcriber.language,
+            without_timestamps=True
+        )
+
+    def transcribe(self, turns: List[Tuple[float, float]], on_progress: Optional[Callable[[int], None]] = None) -> List[str]:
+        """
+        Transcribe the given turns.
+        
+        :param turns: (start, end) pairs in seconds.
+        :param on_progress: Called with the number of turns transcribed so far.
+        :return: One text per turn, in the same order as the input.
+        """
+        done = 0
+        texts: List[str] = [""] * len(turns)
+        batch_size = self._effective_batch_size()
+        self.logger.info(f"Batched transcription of {len(turns)} turns with batch size {batch_size}")
+
+        short_turns = []
+        for index, (start, end) in enumerate(turns):
+            samples = self.transcriber.extract_segments(start, end)
+            if len(samples) > N_SAMPLES:
+                # Whisper's window is 30 s, longer turns go through the sequential path
+                texts[index] = self.transcriber.transcribe_segment(samples)
+                done += 1
+            else:
+                short_turns.append((index, samples))
+
+        for offset in range(0, len(short_turns), batch_size):
+            batch = short_turns[offset:offset + batch_size]
+            mel = torch.stack([self._mel(samples) for _, samples in batch]).to(self.model.device)
+            results = whisper.decode(self.model, mel, self.options)
+            for (index, _), result in zip(batch, results):
+                texts[index] = result.text
+            done += len(batch)
+            if on_progress:
+                on_progress(done)
+        return texts
+
+    def _mel(self, samples: np.ndarray) -> torch.Tensor:
+        audio = torch.from_numpy(np.ascontiguousarray(samples, dtype=np.float32))
+        mel = log_mel_spectrogram(audio, self.model.dims.n_mels)
+        return pad_or_trim(mel, N_FRAMES)
+
+    def _effective_batch_size(self) -> int:
+        """
+        Cap the configured batch size by the memory currently available on the model's device.
+        """
+        dims = self.model.dims
+        # Rough activation footprint of one 30 s window through encoder and decoder
+        per_item = dims.n_audio_ctx * dims.n_audio_state * (dims.n_audio_layer + dims.n_text_layer) * 4 * 8
+
+        if self.model.device.type == "cuda":
+            free_bytes, _ = torch.cuda.mem_get_info(self.model.device)
+        else:
+            try:
+                free_bytes = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+            except (ValueError, OSError, AttributeError):
+                return self.batch_size
+
+        fits = max(1, int(free_bytes * 0.5) // per_item)
+        return min(self.batch_size, fits)
@@ -0,0 +1,152 @@
+from src.services.BaseService import BaseService
+from src.services.audio.DecodedAudio import DecodedAudio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+import multiprocessing
+import threading
+import tempfile
+import uuid
+import os
+
+# Turns per task, small enough to balance long and short turns across workers
+SHARD_TURNS = 4
+
+# State of a pool worker process, set once by _init_worker
+_worker_engine = None
+_worker_audio: Dict[str, DecodedAudio] = {}
+
+
+def _init_worker(engine: str, model: str, threads: int, compute_type: str):
+    # Thread limits before torch / CTranslate2 start their pools
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    import torch
+    torch.set_num_threads(threads)
+
+    from .engines import WhisperEngine, FasterWhisperEngine
+    global _worker_engine
+    if engine == "faster_whisper":
+        _worker_engine = FasterWhisperEngine(model=model, device="cpu", compute_type=compute_type, cpu_threads=threads)
+    else:
+        _worker_engine = WhisperEngine(model=model, device="cpu")
+    _worker_engine.load()
+
+
+def _transcribe_shard(pcm_path: str, sample_rate: int, turns: List[Tuple[float, float]],
+                      language: Optional[str] = None) -> List[str]:
+    import numpy as np
+    audio = _worker_audio.get(pcm_path)
+    if audio is None:
+        # One mapping per job and worker, the previous job's file is closed
+        _worker_audio.clear()
+        audio = _worker_audio[pcm_path] = DecodedAudio.from_pcm(pcm_path, sample_rate=sample_rate)
+    return [
+        _worker_engine.transcribe(np.ascontiguousarray(audio.slice(start, end), dtype=np.float32), language=language)["text"]
+        for start, end in turns
+    ]
+
+
+def _detect_language(samples) -> Tuple[str, float]:
+    return _worker_engine.detect_language(samples)
+
+
+def _loaded() -> bool:
+    return _worker_engine is not None
+
+
+class ParallelTranscription(BaseService):
+    """
+    Transcribe diarization turns on a pool of CPU worker processes.
+
+    Every worker loads its own model once and maps the job's float32 PCM file,
+    so only turn boundaries cross process boundaries. Workers are limited to
+    threads_per_worker threads each, workers * threads_per_worker should not
+    exceed the number of cores. The pool is shared by all jobs of the process.
+    """
+    _pools: Dict[Tuple, ProcessPoolExecutor] = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, workers: int = 0, threads_per_worker: int = 1):
+        super().__init__()
+        self.threads_per_worker = max(1, threads_per_worker)
+        self.workers = workers or max(1, (os.cpu_count() or 1) // self.threads_per_worker)
+
+    def transcribe(self, audio: DecodedAudio, turns: List[Tuple[float, float]],
+                   on_progress: Optional[Callable[[int], None]] = None, language: Optional[str] = None) -> List[str]:
+        """
+        Transcribe the given turns.
+
+        :param audio: Decoded audio, memory-mapped from the PCM cache when possible.
+        :param turns: (start, end) pairs in seconds.
+        :param on_progress: Called with the number of turns transcribed so far.
+        :param language: Language pinned for the job, None lets every call detect it.
+        :return: One text per turn, in the same order as the input.
+        """
+        texts: List[str] = [""] * len(turns)
+        if not turns:
+            return texts
+        pcm_path, owned = self._shared_pcm(audio)
+        try:
+            pool = self._pool()
+            shards = {
+                pool.submit(_transcribe_shard, pcm_path, audio.sample_rate, turns[offset:offset + SHARD_TURNS], language): offset
+                for offset in range(0, len(turns), SHARD_TURNS)
+            }
+            done = 0
+            for future in as_completed(shards):
+                offset = shards[future]
+                shard_texts = future.result()
+                texts[offset:offset + len(shard_texts)] = shard_texts
+                done += len(shard_texts)
+                if on_progress:
+                    on_progress(done)
+        finally:
+            if owned:
+                os.remove(pcm_path)
+        return texts
+
+    def detect_language(self, samples) -> Tuple[str, float]:
+        """Spoken language of a speech sample, detected on one of the workers."""
+        return self._pool().submit(_detect_language, samples).result()
+
+    def warm(self):
+        """Start every worker process and wait until each has loaded its model."""
+        pool = self._pool()
+        # Submitted together, no worker is idle yet so each task spawns its own process
+        futures = [pool.submit(_loaded) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def _shared_pcm(self, audio: DecodedAudio) -> Tuple[str, bool]:
+        if audio.pcm_path:
+            return audio.pcm_path, False
+        # Samples held in memory (PCM cache full or disabled) are written once for the workers
+        path = os.path.join(tempfile.gettempdir(), f"asr_{uuid.uuid4().hex}.f32")
+        audio.samples.astype("float32", copy=False).tofile(path)
+        return path, True
+
+    def _pool(self) -> ProcessPoolExecutor:
+        settings = self.app_settings
+        key = (settings.ASR_ENGINE, settings.WHISPER_MODEL, settings.ASR_COMPUTE_TYPE, self.workers, self.threads_per_worker)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                self.logger.info(
+                    f"Starting {self.workers} transcription processes with {self.threads_per_worker} threads each"
+                )
+                # spawn: forking a process that already runs torch threads can deadlock
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(key[0], key[1], self.threads_per_worker, key[2])
+                )
+                self._pools[key] = pool
+            return pool
+
+    @classmethod
+    def shutdown(cls):
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.shutdown(wait=False, cancel_futures=True)
+            cls._pools.clear()
@@ -0,0 +1,53 @@
+from typing import List, Dict, Tuple
+
+
+class WordAligner:
+    """
+    Assign word-level ASR timestamps to diarization turns with an interval join.
+    """
+
+    def align(self, words: List[Dict], turns: List[Tuple[float, float]]) -> List[Dict]:
+        """
+        Join words onto turns.
+
+        Each word goes to the turn it overlaps the most. Words falling in a gap
+        between turns go to the nearest turn so no speech is dropped.
+
+        :param words: Word dicts with 'start', 'end' and 'word' keys.
+        :param turns: (start, end) pairs ordered by start time.
+        :return: One {'start', 'end', 'text'} dict per turn, in turn order.
+        """
+        buckets: List[List[str]] = [[] for _ in turns]
+        if not turns:
+            return []
+
+        words = sorted(words, key=lambda w: w['start'])
+        active: List[int] = []
+        next_turn = 0
+
+        for word in words:
+            w_start, w_end = word['start'], word['end']
+
+            # Open every turn starting before the word ends, close the ones that ended before it starts
+            while next_turn < len(turns) and turns[next_turn][0] < w_end:
+                active.append(next_turn)
+                next_turn += 1
+            active = [i for i in active if turns[i][1] > w_start]
+
+            if active:
+                best = max(active, key=lambda i: min(turns[i][1], w_end) - max(turns[i][0], w_start))
+            else:
+                best = self._nearest_turn(turns, next_turn, w_start, w_end)
+            buckets[best].append(word['word'])
+
+        return [
+            {'start': start, 'end': end, 'text': ''.join(bucket).strip()}
+            for (start, end), bucket in zip(turns, buckets)
+        ]
+
+    def _nearest_turn(self, turns: List[Tuple[float, float]], next_turn: int, w_start: float, w_end: float) -> int:
+        """
+        Pick the closest turn for a word that overlaps none of them.
+        """
+        candidates = [i for i in (next_turn - 1, next_turn) if 0 <= i < len(turns)]
+        return min(candidates, key=lambda i: max(turns[i][0] - w_end, w_start - turns[i][1]))
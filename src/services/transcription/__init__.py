@@ -1 +1,5 @@
-from .AudioTranscription import AudioTranscription
\ No newline at end of file
+from .AudioTranscription import AudioTranscription
+from .WordAligner import WordAligner
+from .BatchTranscription import BatchTranscription
+from .ParallelTranscription import ParallelTranscription
+from .engines import BaseASREngine, WhisperEngine, FasterWhisperEngine
\ No newline at end of file
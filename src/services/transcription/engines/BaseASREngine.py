@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from src.services.BaseService import BaseService
+from src.services.models.ModelRegistry import model_registry
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+
+
+class BaseASREngine(ABC):
+    """Abstract class defines the interface for speech recognition engines."""
+    # Engines whose model can decode padded mel batches through BatchTranscription
+    supports_batching = False
+
+    def __init__(self, base_service: Optional[BaseService] = None,
+                 model: Optional[str] = None,
+                 device: Optional[str] = None,
+                 replica: int = 0):
+        self.base_service = base_service or BaseService()
+        self.logger = self.base_service.logger
+        self.model = model
+        self.device = device or model_registry.default_device()
+        self.replica = replica
+
+    @abstractmethod
+    def load(self) -> Any:
+        """Returns the engine's model, loaded once through the model registry"""
+        pass
+
+    @abstractmethod
+    def transcribe(self, audio: Union[np.ndarray, str], word_timestamps: bool = False,
+                   language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Transcribe float32 16 kHz samples or an audio file.
+
+        :return: openai-whisper style result: 'text', 'language' and 'segments',
+                 each segment with 'start', 'end', 'text' and, with word_timestamps,
+                 'words' of 'start', 'end', 'word'.
+        """
+        pass
+
+    @abstractmethod
+    def detect_language(self, samples: np.ndarray) -> Tuple[str, float]:
+        """
+        Spoken language of up to 30 s of float32 16 kHz samples.
+
+        :return: Language code and its probability.
+        """
+        pass
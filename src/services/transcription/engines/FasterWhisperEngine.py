@@ -0,0 +1,65 @@
+from src.services.BaseService import BaseService
+from src.services.models.ModelRegistry import model_registry
+from .BaseASREngine import BaseASREngine
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+
+
+class FasterWhisperEngine(BaseASREngine):
+    """
+    Implementation of ASR engine using faster-whisper (CTranslate2).
+
+    Runs the same Whisper checkpoints with int8 weights by default, which is
+    several times faster than fp32 PyTorch on CPU-only nodes.
+    """
+    def __init__(self, base_service: Optional[BaseService] = None,
+                 model: Optional[str] = "base",
+                 device: Optional[str] = None,
+                 replica: int = 0,
+                 compute_type: str = "int8",
+                 cpu_threads: int = 0,
+                 beam_size: int = 1):
+        super().__init__(base_service, model=model, device=device, replica=replica)
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        # Greedy decoding like openai-whisper's transcribe() default
+        self.beam_size = beam_size
+
+    def load(self):
+        return model_registry.get_faster_whisper(
+            self.model,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            replica=self.replica
+        )
+
+    def transcribe(self, audio: Union[np.ndarray, str], word_timestamps: bool = False,
+                   language: Optional[str] = None) -> Dict[str, Any]:
+        segments, info = self.load().transcribe(
+            audio,
+            language=language,
+            beam_size=self.beam_size,
+            word_timestamps=word_timestamps
+        )
+        # segments is a generator, decoding happens while it is consumed
+        results = []
+        for segment in segments:
+            results.append({
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "words": [
+                    {"start": word.start, "end": word.end, "word": word.word}
+                    for word in (segment.words or [])
+                ],
+            })
+        return {
+            "text": "".join(segment["text"] for segment in results),
+            "segments": results,
+            "language": info.language,
+        }
+
+    def detect_language(self, samples: np.ndarray) -> Tuple[str, float]:
+        language, probability, _ = self.load().detect_language(np.ascontiguousarray(samples, dtype=np.float32))
+        return language, float(probability)
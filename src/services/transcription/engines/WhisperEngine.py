@@ -0,0 +1,33 @@
+from src.services.BaseService import BaseService
+from src.services.models.ModelRegistry import model_registry
+from .BaseASREngine import BaseASREngine
+from typing import Any, Dict, Optional, Tuple, Union
+import numpy as np
+
+
+class WhisperEngine(BaseASREngine):
+    """Implementation of ASR engine using openai-whisper (PyTorch)."""
+    supports_batching = True
+
+    def __init__(self, base_service: Optional[BaseService] = None,
+                 model: Optional[str] = "base",
+                 device: Optional[str] = None,
+                 replica: int = 0):
+        super().__init__(base_service, model=model, device=device, replica=replica)
+
+    def load(self):
+        return model_registry.get_whisper(self.model, device=self.device, replica=self.replica)
+
+    def transcribe(self, audio: Union[np.ndarray, str], word_timestamps: bool = False,
+                   language: Optional[str] = None) -> Dict[str, Any]:
+        return self.load().transcribe(audio, word_timestamps=word_timestamps, language=language)
+
+    def detect_language(self, samples: np.ndarray) -> Tuple[str, float]:
+        import whisper
+        import torch
+        model = self.load()
+        audio = whisper.pad_or_trim(torch.from_numpy(np.ascontiguousarray(samples, dtype=np.float32)))
+        mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels).to(model.device)
+        _, probs = model.detect_language(mel)
+        language = max(probs, key=probs.get)
+        return language, float(probs[language])
@@ -0,0 +1,3 @@
+from .BaseASREngine import BaseASREngine
+from .WhisperEngine import WhisperEngine
+from .FasterWhisperEngine import FasterWhisperEngine
\ No newline at end of file